@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Compare MP3 duration probing strategies on the shipped audio_files/*.mp3.
+
+    python benchmarks/bench_mp3_probe.py
+
+Reports total time and worst disagreement for the header probe, a full frame
+scan and (when installed) pydub, which decodes through ffmpeg.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+import mp3_frames  # noqa: E402
+
+try:
+    from pydub import AudioSegment
+except ImportError:
+    AudioSegment = None  # type: ignore
+
+
+def _scan(path: str) -> float:
+    with open(path, "rb") as fh:
+        return mp3_frames.scan_duration(fh)
+
+
+def _pydub(path: str) -> float:
+    return len(AudioSegment.from_mp3(path)) / 1000.0
+
+
+def main() -> None:
+    paths = [str(p) for p in sorted((ROOT / "audio_files").rglob("*.mp3"))]
+    strategies = [("header probe", mp3_frames.probe_duration), ("frame scan", _scan)]
+    if AudioSegment is not None:
+        strategies.append(("pydub decode", _pydub))
+    else:
+        print("pydub not installed; skipping decode baseline")
+
+    baseline: list[float] | None = None
+    print(f"{len(paths)} files")
+    for name, fn in strategies:
+        t0 = time.perf_counter()
+        durations = [fn(p) for p in paths]
+        elapsed = time.perf_counter() - t0
+        drift = 0.0
+        if baseline is None:
+            baseline = durations
+        else:
+            drift = max(abs(a - b) for a, b in zip(baseline, durations))
+        print(
+            f"  {name:<13} {elapsed * 1000:9.1f} ms total  "
+            f"{elapsed / len(paths) * 1e6:9.1f} us/file  max drift {drift:.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
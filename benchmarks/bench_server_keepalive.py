@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Compare fetching the PWA app shell over fresh connections vs one kept-alive connection.
+
+    python benchmarks/bench_server_keepalive.py
+    python benchmarks/bench_server_keepalive.py --rounds 50 --clients 8
+
+The asset list is sw.js's STATIC_ASSETS. Each client fetches the whole list
+`--rounds` times with gzip negotiation, either sending `Connection: close` on
+every request (one TCP connection per asset, as under HTTP/1.0) or reusing a
+single HTTP/1.1 connection. Reports requests/sec and connections opened.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import http.client
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+import server  # noqa: E402
+
+
+class QuietHandler(server.GzipHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def app_shell_paths() -> list[str]:
+    source = (ROOT / "sw.js").read_text(encoding="utf-8")
+    block = re.search(r"STATIC_ASSETS\s*=\s*\[(.*?)\]", source, re.S).group(1)
+    return ["/" + p.removeprefix("./") for p in re.findall(r'"([^"]+)"', block)]
+
+
+def fetch_shell(port: int, paths: list[str], rounds: int, keep_alive: bool) -> int:
+    """Fetch every path `rounds` times; returns the number of connections opened."""
+    headers = {"Accept-Encoding": "gzip"}
+    if not keep_alive:
+        headers["Connection"] = "close"
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    opened = 0
+    try:
+        for _ in range(rounds):
+            for path in paths:
+                if conn.sock is None:
+                    opened += 1
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                response.read()
+                if response.status != 200:
+                    raise RuntimeError(f"{path}: HTTP {response.status}")
+    finally:
+        conn.close()
+    return opened
+
+
+def run(keep_alive: bool, paths: list[str], rounds: int, clients: int) -> tuple[float, int]:
+    handler = functools.partial(QuietHandler, directory=str(ROOT))
+    httpd = server.PooledHTTPServer(("127.0.0.1", 0), handler, workers=clients)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    port = httpd.server_address[1]
+    try:
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients) as pool:
+            opened = sum(pool.map(lambda _: fetch_shell(port, paths, rounds, keep_alive), range(clients)))
+        wall = time.perf_counter() - t0
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        thread.join()
+    return wall, opened
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20, help="App-shell fetches per client")
+    parser.add_argument("--clients", type=int, default=4, help="Concurrent clients")
+    args = parser.parse_args()
+
+    paths = app_shell_paths()
+    requests = len(paths) * args.rounds * args.clients
+    print(f"{len(paths)} app-shell assets, {args.rounds} rounds x {args.clients} clients = {requests} requests")
+    for name, keep_alive in (("close", False), ("keep-alive", True)):
+        wall, opened = run(keep_alive, paths, args.rounds, args.clients)
+        print(f"  {name:<11} {requests / wall:8.0f} req/s  {opened:6d} connections  {wall:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Measure identity-response throughput of server.py with and without sendfile.
+
+    python benchmarks/bench_server_sendfile.py
+    python benchmarks/bench_server_sendfile.py --rounds 20 --clients 8
+
+Serves the repository on an ephemeral port and downloads every
+audio_files/**/*.mp3 `--rounds` times from `--clients` threads, once with
+GzipHandler.use_sendfile enabled and once with the userspace copy loop, then
+repeats with one large synthetic file where per-request overhead is negligible.
+Reports bytes/sec (headers included) and process CPU seconds per GB.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import os
+import resource
+import socket
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+import server  # noqa: E402
+
+
+class QuietHandler(server.GzipHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def _cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+def _download_all(port: int, paths: list[str]) -> int:
+    """Fetch each path on its own connection, discarding the bytes (cheap client side)."""
+    buf = bytearray(256 * 1024)
+    total = 0
+    for path in paths:
+        with socket.create_connection(("127.0.0.1", port)) as sock:
+            sock.sendall(f"GET {path} HTTP/1.0\r\nHost: bench\r\n\r\n".encode())
+            while n := sock.recv_into(buf):
+                total += n
+    return total
+
+
+def run(
+    use_sendfile: bool, directory: Path, paths: list[str], rounds: int, clients: int
+) -> tuple[float, float, int]:
+    handler_class = type("BenchHandler", (QuietHandler,), {"use_sendfile": use_sendfile})
+    handler = functools.partial(handler_class, directory=str(directory))
+    httpd = server.PooledHTTPServer(("127.0.0.1", 0), handler, workers=clients)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    port = httpd.server_address[1]
+    try:
+        cpu0, t0 = _cpu_seconds(), time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients) as pool:
+            sizes = list(pool.map(lambda _: _download_all(port, paths), range(rounds * clients)))
+        wall, cpu = time.perf_counter() - t0, _cpu_seconds() - cpu0
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        thread.join()
+    return wall, cpu, sum(sizes)
+
+
+def report(title: str, directory: Path, paths: list[str], rounds: int, clients: int) -> None:
+    print(f"{title}, {rounds} rounds x {clients} clients")
+    for name, use_sendfile in (("copyfile", False), ("sendfile", True)):
+        wall, cpu, total = run(use_sendfile, directory, paths, rounds, clients)
+        print(
+            f"  {name:<9} {total / wall / 1e6:9.1f} MB/s  "
+            f"{cpu / (total / 1e9):7.2f} CPU s/GB  ({total / 1e6:.0f} MB in {wall:.2f}s)"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5, help="Downloads of the full set per client")
+    parser.add_argument("--clients", type=int, default=4, help="Concurrent client threads")
+    parser.add_argument(
+        "--large-mb", type=int, default=64, help="Size of a synthetic large file to also serve (0 to skip)"
+    )
+    args = parser.parse_args()
+
+    paths = ["/" + p.relative_to(ROOT).as_posix() for p in sorted((ROOT / "audio_files").rglob("*.mp3"))]
+    report(f"{len(paths)} lesson MP3 files", ROOT, paths, args.rounds, args.clients)
+    if args.large_mb > 0:
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(Path(tmp) / "large.bin", "wb") as f:
+                f.write(os.urandom(args.large_mb * 1024 * 1024))
+            report(f"one {args.large_mb} MB file", Path(tmp), ["/large.bin"], args.rounds, args.clients)
+
+
+if __name__ == "__main__":
+    main()
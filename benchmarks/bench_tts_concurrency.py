@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Measure how segment concurrency hides TTS round-trip latency.
+
+Uses a local stand-in for edge-tts that sleeps for a fixed latency and returns
+placeholder bytes, so no network access is needed:
+
+    python benchmarks/bench_tts_concurrency.py --segments 40 --latency 0.25
+    python benchmarks/bench_tts_concurrency.py --failure-rate 0.1   # with retries
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "scripts"))
+import audio_timings  # noqa: E402
+from tts_resilience import FlakySynthesizer, RetryPolicy  # noqa: E402
+
+
+async def run(segments: int, latency: float, levels: list[int], failure_rate: float) -> None:
+    texts = [f"phrase {i}." for i in range(segments)]
+    retry = RetryPolicy(retries=8, base_delay=latency) if failure_rate else None
+    print(
+        f"{segments} segments, {latency * 1000:.0f} ms simulated latency, "
+        f"{failure_rate:.0%} injected failures"
+    )
+    for concurrency in levels:
+        synthesize = FlakySynthesizer(failure_rate=failure_rate, latency=latency, seed=concurrency)
+        t0 = time.perf_counter()
+        await audio_timings.synthesize_segments(
+            texts,
+            "zh-CN-XiaoxiaoNeural",
+            concurrency=concurrency,
+            synthesize=synthesize,
+            retry=retry,
+        )
+        elapsed = time.perf_counter() - t0
+        print(f"  concurrency={concurrency:<3d} {elapsed:7.2f}s  {synthesize.failures} retried failures")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--segments", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.25, help="Seconds per request")
+    parser.add_argument(
+        "--levels", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="Concurrency levels"
+    )
+    parser.add_argument(
+        "--failure-rate", type=float, default=0.0, help="Fraction of requests that fail and are retried"
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.segments, args.latency, args.levels, args.failure_rate))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Load-test server.py with a realistic request mix from a local asyncio client.
+
+    python benchmarks/load_test.py
+    python benchmarks/load_test.py --duration 10 --concurrency 32 --output results.json
+    python benchmarks/load_test.py --baseline results.json   # exit 1 on regression
+
+Starts PooledHTTPServer in-process on an ephemeral port, then runs each
+scenario for --duration seconds over --concurrency keep-alive connections:
+
+    app_shell     every sw.js STATIC_ASSETS entry, gzip accepted
+    timing_json   timing/**/*.json, gzip accepted
+    negotiation   compressible files with br / gzip / q=0 / no Accept-Encoding
+    range_seek    random single-range reads from audio_files/**/*.mp3
+    revalidation  HTML and timing JSON with a matching If-None-Match (304s)
+
+Prints (or writes) JSON with req/s, bytes/s and p50/p95/p99 latency per
+scenario. Client and server share one process, so treat numbers as relative:
+compare runs on the same machine, not against other servers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import http.client
+import json
+import math
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+import server  # noqa: E402
+from bench_server_keepalive import app_shell_paths  # noqa: E402
+
+
+class Request(NamedTuple):
+    path: str
+    headers: dict
+
+
+class QuietHandler(server.GzipHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def _rel(paths) -> list[str]:
+    return ["/" + p.relative_to(ROOT).as_posix() for p in sorted(paths)]
+
+
+def _etags(port: int, requests: list[Request]) -> list[Request]:
+    """Prime each request once and return it with If-None-Match set to the current ETag."""
+    primed = []
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    try:
+        for req in requests:
+            conn.request("GET", req.path, headers=req.headers)
+            response = conn.getresponse()
+            response.read()
+            if response.getheader("ETag"):
+                primed.append(Request(req.path, {**req.headers, "If-None-Match": response.getheader("ETag")}))
+            if response.will_close:
+                conn.close()
+    finally:
+        conn.close()
+    return primed
+
+
+def build_scenarios(port: int, rng: random.Random) -> dict[str, Callable[[], Request]]:
+    gzip = {"Accept-Encoding": "gzip"}
+    shell = [Request(p, gzip) for p in app_shell_paths()]
+    timing = [Request(p, gzip) for p in _rel((ROOT / "timing").rglob("*.json"))]
+    compressible = [r.path for r in shell if r.path.endswith((".html", ".css", ".js", ".json"))]
+    encodings = [{"Accept-Encoding": "br, gzip"}, gzip, {"Accept-Encoding": "gzip;q=0"}, {}]
+    mp3s = [(p, (ROOT / p.lstrip("/")).stat().st_size) for p in _rel((ROOT / "audio_files").rglob("*.mp3"))]
+    revalidate = _etags(port, [r for r in shell if r.path.endswith(".html")] + timing[:40])
+
+    def range_seek() -> Request:
+        path, size = rng.choice(mp3s)
+        start = rng.randrange(size)
+        end = min(size - 1, start + rng.randrange(4096, 65536))
+        return Request(path, {"Range": f"bytes={start}-{end}"})
+
+    return {
+        "app_shell": lambda: rng.choice(shell),
+        "timing_json": lambda: rng.choice(timing),
+        "negotiation": lambda: Request(rng.choice(compressible), rng.choice(encodings)),
+        "range_seek": range_seek,
+        "revalidation": lambda: rng.choice(revalidate),
+    }
+
+
+async def _read_response(reader: asyncio.StreamReader) -> tuple[int, int, bool]:
+    """Read one response; returns (status, bytes read, server will close)."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("server closed the connection")
+    nbytes = len(status_line)
+    status = int(status_line.split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        nbytes += len(line)
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        while True:
+            size_line = await reader.readline()
+            size = int(size_line.split(b";")[0], 16)
+            nbytes += len(size_line) + len(await reader.readexactly(size + 2))
+            if size == 0:
+                break
+    elif status != 304:
+        nbytes += len(await reader.readexactly(int(headers.get("content-length", 0))))
+    return status, nbytes, headers.get("connection", "").lower() == "close"
+
+
+async def _connection_loop(port: int, next_request: Callable[[], Request], deadline: float, stats: dict) -> None:
+    reader = writer = None
+    try:
+        while time.perf_counter() < deadline:
+            if writer is None:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            req = next_request()
+            head = f"GET {req.path} HTTP/1.1\r\nHost: loadtest\r\n"
+            head += "".join(f"{k}: {v}\r\n" for k, v in req.headers.items())
+            t0 = time.perf_counter()
+            try:
+                writer.write((head + "\r\n").encode("latin-1"))
+                status, nbytes, will_close = await _read_response(reader)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                stats["errors"] += 1
+                writer.close()
+                writer = None
+                continue
+            stats["latencies"].append(time.perf_counter() - t0)
+            stats["bytes"] += nbytes
+            stats["status"][status] = stats["status"].get(status, 0) + 1
+            if will_close:
+                writer.close()
+                writer = None
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+async def run_scenario(port: int, next_request: Callable[[], Request], duration: float, concurrency: int) -> dict:
+    stats = {"latencies": [], "bytes": 0, "errors": 0, "status": {}}
+    t0 = time.perf_counter()
+    deadline = t0 + duration
+    await asyncio.gather(*(_connection_loop(port, next_request, deadline, stats) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - t0
+    latencies = sorted(stats["latencies"])
+    return {
+        "requests": len(latencies),
+        "errors": stats["errors"],
+        "seconds": round(elapsed, 3),
+        "req_per_s": round(len(latencies) / elapsed, 1),
+        "bytes_per_s": round(stats["bytes"] / elapsed),
+        "latency_ms": {
+            f"p{p}": round(_percentile(latencies, p) * 1000, 3) for p in (50, 95, 99)
+        } | {"max": round(latencies[-1] * 1000, 3) if latencies else 0.0},
+        "status": {str(code): n for code, n in sorted(stats["status"].items())},
+    }
+
+
+def regressions(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Scenarios whose req/s fell, or p99 rose, by more than `tolerance` vs baseline."""
+    found = []
+    for name, now in results["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if not before:
+            continue
+        if now["req_per_s"] < before["req_per_s"] * (1 - tolerance):
+            found.append(f"{name}: {now['req_per_s']} req/s vs {before['req_per_s']} baseline")
+        if now["latency_ms"]["p99"] > before["latency_ms"]["p99"] * (1 + tolerance):
+            found.append(f"{name}: p99 {now['latency_ms']['p99']} ms vs {before['latency_ms']['p99']} ms baseline")
+    return found
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load-test server.py with a realistic request mix")
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds per scenario")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent keep-alive connections")
+    parser.add_argument("--workers", type=int, default=server.DEFAULT_WORKERS, help="Server worker threads")
+    parser.add_argument("--cache-mb", type=float, default=0, help="Server hot-file cache size")
+    parser.add_argument("--scenarios", nargs="+", help="Subset of scenarios to run (default: all)")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the request mix")
+    parser.add_argument("--output", help="Write JSON results here instead of stdout")
+    parser.add_argument("--baseline", help="Earlier --output file to compare against")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="Allowed fractional regression vs --baseline (default: 0.2)"
+    )
+    args = parser.parse_args()
+
+    handler = functools.partial(QuietHandler, directory=str(ROOT))
+    httpd = server.PooledHTTPServer(
+        ("127.0.0.1", 0), handler, workers=args.workers, cache_bytes=int(args.cache_mb * 1024 * 1024)
+    )
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    port = httpd.server_address[1]
+    try:
+        scenarios = build_scenarios(port, random.Random(args.seed))
+        selected = args.scenarios or list(scenarios)
+        unknown = set(selected) - set(scenarios)
+        if unknown:
+            parser.error(f"unknown scenario(s): {', '.join(sorted(unknown))}")
+        results = {
+            "config": {
+                "duration": args.duration,
+                "concurrency": args.concurrency,
+                "workers": args.workers,
+                "cache_mb": args.cache_mb,
+            },
+            "scenarios": {},
+        }
+        for name in selected:
+            results["scenarios"][name] = asyncio.run(
+                run_scenario(port, scenarios[name], args.duration, args.concurrency)
+            )
+            print(f"{name}: {results['scenarios'][name]['req_per_s']} req/s", file=sys.stderr)
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        thread.join()
+
+    report = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(report + "\n", encoding="utf-8")
+    else:
+        print(report)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        found = regressions(results, baseline, args.tolerance)
+        for line in found:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
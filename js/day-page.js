@@ -144,30 +144,45 @@ document.addEventListener("DOMContentLoaded", function () {
 
     const timingUrl = `timing/day${day}_${audioLang}.json`;
 
-    const textFetch = fetch(`text_files/day${day}_${lang}.txt`).then(
-        (response) => {
+    const fetchText = () =>
+        fetch(`text_files/day${day}_${lang}.txt`).then((response) => {
             if (!response.ok) {
                 throw new Error(
                     `Network response was not ok: ${response.status}`,
                 );
             }
             return response.text();
-        },
-    );
+        });
 
-    const timingFetch = fetch(timingUrl)
-        .then(async (response) => {
-            if (!response.ok) return null;
-            try {
-                return await response.json();
-            } catch (e) {
-                console.warn("Lesson timing manifest invalid JSON:", e);
-                return null;
+    const fetchTiming = () =>
+        fetch(timingUrl)
+            .then(async (response) => {
+                if (!response.ok) return null;
+                try {
+                    return await response.json();
+                } catch (e) {
+                    console.warn("Lesson timing manifest invalid JSON:", e);
+                    return null;
+                }
+            })
+            .catch(() => null);
+
+    // One request for text + cues (scripts/lesson_bundles.py); fall back to
+    // the separate text and timing files if the bundle is unavailable.
+    const lessonFetch = fetch(`api/day/${day}.json`)
+        .then((response) => (response.ok ? response.json() : null))
+        .catch(() => null)
+        .then((bundle) => {
+            if (bundle && Array.isArray(bundle.sections)) {
+                return [
+                    lessonTextFromBundle(bundle, lang),
+                    bundle.timing?.[audioLang] ?? null,
+                ];
             }
-        })
-        .catch(() => null);
+            return Promise.all([fetchText(), fetchTiming()]);
+        });
 
-    Promise.all([textFetch, timingFetch])
+    lessonFetch
         .then(([text, timing]) => {
             formatAndDisplayContent(text, day, lang, timing);
             LessonAudioSync.attachCueHighlighting(
@@ -212,6 +227,18 @@ document.addEventListener("DOMContentLoaded", function () {
     }
 });
 
+// Same layout as text_files/dayN_<lang>.txt, so both sources render alike.
+function lessonTextFromBundle(bundle, lang) {
+    let text = "";
+    bundle.sections.forEach((section) => {
+        text += `\n${section.title}\n${"-".repeat(section.title.length)}\n`;
+        section.phrases.forEach((phrase) => {
+            text += `${phrase[lang]}\n`;
+        });
+    });
+    return text;
+}
+
 function formatAndDisplayContent(text, day, lang, timingManifest) {
     text = text.replace(/\r\n/g, "\n").replace(/\r/g, "\n");
     const sections = text.split(/\n(?=\w[^\n]+\n-+\n)/);
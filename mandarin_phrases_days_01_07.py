@@ -9,528 +9,49 @@ _scripts_dir = Path(__file__).resolve().parent / "scripts"
 if str(_scripts_dir) not in sys.path:
     sys.path.insert(0, str(_scripts_dir))
 import audio_timings  # noqa: E402
-
-# Define phrases by day and category
-
-# Day 1: Basic Greetings & Common Phrases
-day1_phrases = {
-    "Basic Greetings & Common Phrases": [
-        {
-            "zh": "你好",
-            "pinyin": "Nǐ hǎo",
-            "en": "Hello"
-        },
-        {
-            "zh": "早上好",
-            "pinyin": "Zǎoshang hǎo",
-            "en": "Good morning"
-        },
-        {
-            "zh": "下午好",
-            "pinyin": "Xiàwǔ hǎo",
-            "en": "Good afternoon"
-        },
-        {
-            "zh": "晚上好",
-            "pinyin": "Wǎnshang hǎo",
-            "en": "Good evening"
-        },
-        {
-            "zh": "再见",
-            "pinyin": "Zàijiàn",
-            "en": "Goodbye"
-        }
-    ],
-    "Self Introduction": [
-        {
-            "zh": "我叫...",
-            "pinyin": "Wǒ jiào...",
-            "en": "My name is..."
-        },
-        {
-            "zh": "很高兴认识你",
-            "pinyin": "Hěn gāoxìng rènshi nǐ",
-            "en": "Nice to meet you"
-        },
-        {
-            "zh": "我是美国人",
-            "pinyin": "Wǒ shì měiguó rén",
-            "en": "I am American"
-        },
-        {
-            "zh": "你呢？",
-            "pinyin": "Nǐ ne?",
-            "en": "And you?"
-        }
-    ],
-    "Basic Questions": [
-        {
-            "zh": "你好吗？",
-            "pinyin": "Nǐ hǎo ma?",
-            "en": "How are you?"
-        },
-        {
-            "zh": "你是哪国人？",
-            "pinyin": "Nǐ shì nǎ guó rén?",
-            "en": "What is your nationality?"
-        },
-        {
-            "zh": "你会说英语吗？",
-            "pinyin": "Nǐ huì shuō yīngyǔ ma?",
-            "en": "Do you speak English?"
-        },
-        {
-            "zh": "你懂中文吗？",
-            "pinyin": "Nǐ dǒng zhōngwén ma?",
-            "en": "Do you understand Chinese?"
-        }
-    ]
-}
-
-# Day 2: Numbers and Counting
-day2_phrases = {
-    "Numbers 0-10": [
-        {
-            "zh": "零",
-            "pinyin": "líng",
-            "en": "zero"
-        },
-        {
-            "zh": "一",
-            "pinyin": "yī",
-            "en": "one"
-        },
-        {
-            "zh": "二",
-            "pinyin": "èr",
-            "en": "two"
-        },
-        {
-            "zh": "三",
-            "pinyin": "sān",
-            "en": "three"
-        },
-        {
-            "zh": "四",
-            "pinyin": "sì",
-            "en": "four"
-        },
-        {
-            "zh": "五",
-            "pinyin": "wǔ",
-            "en": "five"
-        },
-        {
-            "zh": "六",
-            "pinyin": "liù",
-            "en": "six"
-        },
-        {
-            "zh": "七",
-            "pinyin": "qī",
-            "en": "seven"
-        },
-        {
-            "zh": "八",
-            "pinyin": "bā",
-            "en": "eight"
-        },
-        {
-            "zh": "九",
-            "pinyin": "jiǔ",
-            "en": "nine"
-        },
-        {
-            "zh": "十",
-            "pinyin": "shí",
-            "en": "ten"
-        }
-    ],
-    "Basic Counting Phrases": [
-        {
-            "zh": "多少？",
-            "pinyin": "duōshao?",
-            "en": "How many/much?"
-        },
-        {
-            "zh": "一共",
-            "pinyin": "yīgòng",
-            "en": "in total"
-        },
-        {
-            "zh": "第一",
-            "pinyin": "dì-yī",
-            "en": "first"
-        },
-        {
-            "zh": "第二",
-            "pinyin": "dì-èr",
-            "en": "second"
-        }
-    ]
-}
-
-# Day 3: Time Expressions
-day3_phrases = {
-    "Time Words": [
-        {
-            "zh": "现在",
-            "pinyin": "xiànzài",
-            "en": "now"
-        },
-        {
-            "zh": "今天",
-            "pinyin": "jīntiān",
-            "en": "today"
-        },
-        {
-            "zh": "明天",
-            "pinyin": "míngtiān",
-            "en": "tomorrow"
-        },
-        {
-            "zh": "昨天",
-            "pinyin": "zuótiān",
-            "en": "yesterday"
-        },
-        {
-            "zh": "上午",
-            "pinyin": "shàngwǔ",
-            "en": "morning"
-        },
-        {
-            "zh": "下午",
-            "pinyin": "xiàwǔ",
-            "en": "afternoon"
-        },
-        {
-            "zh": "晚上",
-            "pinyin": "wǎnshang",
-            "en": "evening"
-        }
-    ],
-    "Asking Time": [
-        {
-            "zh": "几点了？",
-            "pinyin": "jǐ diǎn le?",
-            "en": "What time is it?"
-        },
-        {
-            "zh": "现在是三点",
-            "pinyin": "xiànzài shì sān diǎn",
-            "en": "It's 3 o'clock now"
-        },
-        {
-            "zh": "什么时候？",
-            "pinyin": "shénme shíhou?",
-            "en": "When?"
-        },
-        {
-            "zh": "星期几？",
-            "pinyin": "xīngqī jǐ?",
-            "en": "What day of the week?"
-        }
-    ]
-}
-
-# Day 4: Basic Verbs and Actions
-day4_phrases = {
-    "Common Verbs": [
-        {
-            "zh": "是",
-            "pinyin": "shì",
-            "en": "to be"
-        },
-        {
-            "zh": "有",
-            "pinyin": "yǒu",
-            "en": "to have"
-        },
-        {
-            "zh": "想",
-            "pinyin": "xiǎng",
-            "en": "to want/to think"
-        },
-        {
-            "zh": "去",
-            "pinyin": "qù",
-            "en": "to go"
-        },
-        {
-            "zh": "来",
-            "pinyin": "lái",
-            "en": "to come"
-        },
-        {
-            "zh": "吃",
-            "pinyin": "chī",
-            "en": "to eat"
-        },
-        {
-            "zh": "喝",
-            "pinyin": "hē",
-            "en": "to drink"
-        },
-        {
-            "zh": "说",
-            "pinyin": "shuō",
-            "en": "to speak/to say"
-        }
-    ],
-    "Simple Sentences": [
-        {
-            "zh": "我想去那里",
-            "pinyin": "wǒ xiǎng qù nàlǐ",
-            "en": "I want to go there"
-        },
-        {
-            "zh": "你有时间吗？",
-            "pinyin": "nǐ yǒu shíjiān ma?",
-            "en": "Do you have time?"
-        },
-        {
-            "zh": "我们去吃饭吧",
-            "pinyin": "wǒmen qù chīfàn ba",
-            "en": "Let's go eat"
-        },
-        {
-            "zh": "我不知道",
-            "pinyin": "wǒ bù zhīdào",
-            "en": "I don't know"
-        }
-    ]
-}
-
-# Day 5: Basic Adjectives
-day5_phrases = {
-    "Common Adjectives": [
-        {
-            "zh": "好",
-            "pinyin": "hǎo",
-            "en": "good"
-        },
-        {
-            "zh": "坏",
-            "pinyin": "huài",
-            "en": "bad"
-        },
-        {
-            "zh": "大",
-            "pinyin": "dà",
-            "en": "big"
-        },
-        {
-            "zh": "小",
-            "pinyin": "xiǎo",
-            "en": "small"
-        },
-        {
-            "zh": "多",
-            "pinyin": "duō",
-            "en": "many/much"
-        },
-        {
-            "zh": "少",
-            "pinyin": "shǎo",
-            "en": "few/little"
-        },
-        {
-            "zh": "热",
-            "pinyin": "rè",
-            "en": "hot"
-        },
-        {
-            "zh": "冷",
-            "pinyin": "lěng",
-            "en": "cold"
-        },
-        {
-            "zh": "新",
-            "pinyin": "xīn",
-            "en": "new"
-        },
-        {
-            "zh": "旧",
-            "pinyin": "jiù",
-            "en": "old (for objects)"
-        }
+import build_manifest  # noqa: E402
+import content_store  # noqa: E402
+import lesson_bundles  # noqa: E402
+
+# Phrases by day and category live in content/days/day{n}.json and are
+# loaded on first access.
+all_phrases = content_store.LazyMapping(
+    [
+        1,  # Basic Greetings & Common Phrases
+        2,  # Numbers and Counting
+        3,  # Time Expressions
+        4,  # Basic Verbs and Actions
+        5,  # Basic Adjectives
+        6,  # Question Words
+        7,  # Basic Characters and Radicals
     ],
-    "Descriptive Phrases": [
-        {
-            "zh": "很好",
-            "pinyin": "hěn hǎo",
-            "en": "very good"
-        },
-        {
-            "zh": "太贵了",
-            "pinyin": "tài guì le",
-            "en": "too expensive"
-        },
-        {
-            "zh": "非常漂亮",
-            "pinyin": "fēicháng piàoliang",
-            "en": "very beautiful"
-        },
-        {
-            "zh": "不太远",
-            "pinyin": "bú tài yuǎn",
-            "en": "not too far"
-        }
-    ]
-}
+    content_store.day_phrases,
+)
 
-# Day 6: Question Words
-day6_phrases = {
-    "Question Words": [
-        {
-            "zh": "什么",
-            "pinyin": "shénme",
-            "en": "what"
-        },
-        {
-            "zh": "谁",
-            "pinyin": "shuí/shéi",
-            "en": "who"
-        },
-        {
-            "zh": "哪里",
-            "pinyin": "nǎlǐ",
-            "en": "where"
-        },
-        {
-            "zh": "为什么",
-            "pinyin": "wèishénme",
-            "en": "why"
-        },
-        {
-            "zh": "怎么",
-            "pinyin": "zěnme",
-            "en": "how"
-        },
-        {
-            "zh": "多少",
-            "pinyin": "duōshao",
-            "en": "how many/how much"
-        }
-    ],
-    "Common Questions": [
-        {
-            "zh": "这是什么？",
-            "pinyin": "zhè shì shénme?",
-            "en": "What is this?"
-        },
-        {
-            "zh": "那是谁？",
-            "pinyin": "nà shì shuí?",
-            "en": "Who is that?"
-        },
-        {
-            "zh": "你叫什么名字？",
-            "pinyin": "nǐ jiào shénme míngzi?",
-            "en": "What is your name?"
-        },
-        {
-            "zh": "这个多少钱？",
-            "pinyin": "zhège duōshao qián?",
-            "en": "How much is this?"
-        },
-        {
-            "zh": "洗手间在哪里？",
-            "pinyin": "xǐshǒujiān zài nǎlǐ?",
-            "en": "Where is the bathroom?"
-        }
-    ]
-}
-
-# Day 7: Basic Characters and Radicals
-day7_phrases = {
-    "Common Radicals": [
-        {
-            "zh": "人",
-            "pinyin": "rén",
-            "en": "person radical"
-        },
-        {
-            "zh": "口",
-            "pinyin": "kǒu",
-            "en": "mouth radical"
-        },
-        {
-            "zh": "女",
-            "pinyin": "nǚ",
-            "en": "woman radical"
-        },
-        {
-            "zh": "水",
-            "pinyin": "shuǐ",
-            "en": "water radical"
-        },
-        {
-            "zh": "木",
-            "pinyin": "mù",
-            "en": "tree/wood radical"
-        },
-        {
-            "zh": "火",
-            "pinyin": "huǒ",
-            "en": "fire radical"
-        },
-        {
-            "zh": "心",
-            "pinyin": "xīn",
-            "en": "heart radical"
-        }
-    ],
-    "Character Components": [
-        {
-            "zh": "好 = 女 + 子",
-            "pinyin": "hǎo = nǚ + zǐ",
-            "en": "good = woman + child"
-        },
-        {
-            "zh": "明 = 日 + 月",
-            "pinyin": "míng = rì + yuè",
-            "en": "bright = sun + moon"
-        },
-        {
-            "zh": "休 = 人 + 木",
-            "pinyin": "xiū = rén + mù",
-            "en": "rest = person + tree"
-        },
-        {
-            "zh": "男 = 田 + 力",
-            "pinyin": "nán = tián + lì",
-            "en": "man = field + strength"
-        },
-        {
-            "zh": "森 = 木 + 木 + 木",
-            "pinyin": "sēn = mù + mù + mù",
-            "en": "forest = tree + tree + tree"
-        }
-    ]
-}
+def __getattr__(name):
+    """Keep legacy `day1_phrases`-style module attributes working."""
+    day = name[3:-len("_phrases")] if name.startswith("day") and name.endswith("_phrases") else ""
+    if day.isdigit() and int(day) in all_phrases:
+        return all_phrases[int(day)]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Dictionary mapping day numbers to phrase dictionaries
-all_phrases = {
-    1: day1_phrases,
-    2: day2_phrases,
-    3: day3_phrases,
-    4: day4_phrases,
-    5: day5_phrases,
-    6: day6_phrases,
-    7: day7_phrases
-}
-
-def generate_text_file(day, format_type):
+def generate_text_file(day, format_type, manifest=None):
     """Generate a text file with all phrases for a specific day"""
-    print(f"Generating Day {day} {format_type} text file...")
-    
     phrases_dict = all_phrases[day]
+    out_path = f"text_files/day{day}_{format_type}.txt"
+    build_fp = build_manifest.fingerprint(
+        phrases_dict, format_type, build_manifest.code_version(generate_text_file)
+    )
+    if manifest is not None and manifest.is_fresh([out_path], build_fp):
+        print(f"✓ Up to date: {out_path}")
+        return
+
+    print(f"Generating Day {day} {format_type} text file...")
     
     # Ensure the text_files directory exists
     os.makedirs("text_files", exist_ok=True)
     
-    with open(f"text_files/day{day}_{format_type}.txt", "w", encoding="utf-8") as f:
+    with open(out_path, "w", encoding="utf-8") as f:
         for category, phrase_list in phrases_dict.items():
             f.write(f"\n{category}\n")
             f.write("-" * len(category) + "\n")
@@ -542,23 +63,29 @@ def generate_text_file(day, format_type):
                 else:  # English
                     f.write(f"{phrase['en']}\n")
     
-    print(f"✓ Saved to text_files/day{day}_{format_type}.txt")
+    if manifest is not None:
+        manifest.record([out_path], build_fp)
+    print(f"✓ Saved to {out_path}")
 
-async def generate_audio(day, format_type="zh", voice=None):
+async def generate_audio(day, format_type="zh", voice=None, **tts_options):
     """Generate per-phrase stitched audio plus timing JSON for karaoke-style playback."""
     print(f"\nGenerating Day {day} {format_type} audio file...")
     start_time = time.time()
     phrases_dict = all_phrases[day]
 
-    await audio_timings.generate_day_lesson_audio_with_timings(
-        phrases_dict, day, format_type, voice
+    built = await audio_timings.generate_day_lesson_audio_with_timings(
+        phrases_dict, day, format_type, voice, **tts_options
     )
+    if not built:
+        print(f"✓ Up to date: audio_files/day{day}_{format_type}.mp3")
+        return False
 
     elapsed = time.time() - start_time
     print(
         f"✓ Saved to audio_files/day{day}_{format_type}.mp3 "
         f"and timing/day{day}_{format_type}.json ({elapsed:.2f}s)"
     )
+    return True
 
 async def main():
     parser = argparse.ArgumentParser(description="Generate Mandarin and English learning files")
@@ -570,7 +97,12 @@ async def main():
                         help="Voice to use for audio generation")
     parser.add_argument("--language", "-l", type=str, choices=["zh", "en", "both"], default="both",
                         help="Language to generate audio for (zh=Chinese, en=English, both=Both languages)")
+    parser.add_argument("--force", "-f", action="store_true",
+                        help="Regenerate outputs even if their inputs are unchanged")
+    audio_timings.add_tts_arguments(parser)
     args = parser.parse_args()
+    tts_options = audio_timings.tts_options_from_args(args)
+    manifest = build_manifest.BuildManifest(force=args.force)
     
     # Determine which days to process
     days_to_process = [args.day] if args.day else [1, 2, 3, 4, 5, 6, 7]
@@ -580,16 +112,22 @@ async def main():
         print(f"\n=== Processing Day {day} ===")
         
         # Generate text files for Chinese characters, Pinyin, and English
-        generate_text_file(day, "zh")
-        generate_text_file(day, "pinyin")
-        generate_text_file(day, "en")
+        generate_text_file(day, "zh", manifest)
+        generate_text_file(day, "pinyin", manifest)
+        generate_text_file(day, "en", manifest)
         
         # Generate audio files if not text-only mode
         if not args.text_only:
             if args.language in ["zh", "both"]:
-                await generate_audio(day, "zh", args.voice)
+                await generate_audio(day, "zh", args.voice, manifest=manifest, **tts_options)
             if args.language in ["en", "both"]:
-                await generate_audio(day, "en", args.voice)
+                await generate_audio(day, "en", args.voice, manifest=manifest, **tts_options)
+
+        # Keep api/day/<N>.json (which day.html prefers) in step with the new text and cues.
+        if lesson_bundles.write_bundle(day, manifest):
+            print(f"✓ Updated {lesson_bundles.bundle_path(day)}")
+
+    audio_timings.evict_tts_cache(tts_options)
     
     print("\nAll files generated successfully!")
     print("\nUsage examples:")
@@ -9,409 +9,53 @@ _scripts_dir = Path(__file__).resolve().parent / "scripts"
 if str(_scripts_dir) not in sys.path:
     sys.path.insert(0, str(_scripts_dir))
 import audio_timings  # noqa: E402
-
-# Define supplementary phrases by category
-
-# Education & Academic Life
-education_phrases = {
-    "School Subjects": [
-        {
-            "zh": "数学",
-            "pinyin": "shùxué",
-            "en": "mathematics"
-        },
-        {
-            "zh": "物理",
-            "pinyin": "wùlǐ",
-            "en": "physics"
-        },
-        {
-            "zh": "化学",
-            "pinyin": "huàxué",
-            "en": "chemistry"
-        },
-        {
-            "zh": "生物",
-            "pinyin": "shēngwù",
-            "en": "biology"
-        },
-        {
-            "zh": "历史",
-            "pinyin": "lìshǐ",
-            "en": "history"
-        },
-        {
-            "zh": "地理",
-            "pinyin": "dìlǐ",
-            "en": "geography"
-        },
-        {
-            "zh": "文学",
-            "pinyin": "wénxué",
-            "en": "literature"
-        }
-    ],
-    "Classroom Phrases": [
-        {
-            "zh": "请举手",
-            "pinyin": "qǐng jǔshǒu",
-            "en": "please raise your hand"
-        },
-        {
-            "zh": "我不明白",
-            "pinyin": "wǒ bù míngbai",
-            "en": "I don't understand"
-        },
-        {
-            "zh": "能再解释一遍吗？",
-            "pinyin": "néng zài jiěshì yībiàn ma?",
-            "en": "Can you explain again?"
-        },
-        {
-            "zh": "下课了",
-            "pinyin": "xià kè le",
-            "en": "class is over"
-        },
-        {
-            "zh": "考试",
-            "pinyin": "kǎoshì",
-            "en": "exam"
-        }
-    ]
-}
-
-# Hobbies & Interests
-hobbies_phrases = {
-    "Sports": [
-        {
-            "zh": "足球",
-            "pinyin": "zúqiú",
-            "en": "football/soccer"
-        },
-        {
-            "zh": "篮球",
-            "pinyin": "lánqiú",
-            "en": "basketball"
-        },
-        {
-            "zh": "游泳",
-            "pinyin": "yóuyǒng",
-            "en": "swimming"
-        },
-        {
-            "zh": "网球",
-            "pinyin": "wǎngqiú",
-            "en": "tennis"
-        },
-        {
-            "zh": "跑步",
-            "pinyin": "pǎobù",
-            "en": "running"
-        }
-    ],
-    "Arts & Entertainment": [
-        {
-            "zh": "看电影",
-            "pinyin": "kàn diànyǐng",
-            "en": "watch movies"
-        },
-        {
-            "zh": "听音乐",
-            "pinyin": "tīng yīnyuè",
-            "en": "listen to music"
-        },
-        {
-            "zh": "画画",
-            "pinyin": "huàhuà",
-            "en": "painting"
-        },
-        {
-            "zh": "摄影",
-            "pinyin": "shèyǐng",
-            "en": "photography"
-        },
-        {
-            "zh": "弹钢琴",
-            "pinyin": "tán gāngqín",
-            "en": "play piano"
-        }
-    ],
-    "Reading & Literature": [
-        {
-            "zh": "小说",
-            "pinyin": "xiǎoshuō",
-            "en": "novel"
-        },
-        {
-            "zh": "诗歌",
-            "pinyin": "shīgē",
-            "en": "poetry"
-        },
-        {
-            "zh": "杂志",
-            "pinyin": "zázhì",
-            "en": "magazine"
-        },
-        {
-            "zh": "漫画",
-            "pinyin": "mànhuà",
-            "en": "comics"
-        },
-        {
-            "zh": "科幻小说",
-            "pinyin": "kēhuàn xiǎoshuō",
-            "en": "science fiction"
-        }
-    ]
-}
-
-# Emotions & Feelings
-emotions_phrases = {
-    "Basic Emotions": [
-        {
-            "zh": "高兴",
-            "pinyin": "gāoxìng",
-            "en": "happy"
-        },
-        {
-            "zh": "伤心",
-            "pinyin": "shāngxīn",
-            "en": "sad"
-        },
-        {
-            "zh": "生气",
-            "pinyin": "shēngqì",
-            "en": "angry"
-        },
-        {
-            "zh": "害怕",
-            "pinyin": "hàipà",
-            "en": "afraid"
-        },
-        {
-            "zh": "紧张",
-            "pinyin": "jǐnzhāng",
-            "en": "nervous"
-        },
-        {
-            "zh": "兴奋",
-            "pinyin": "xīngfèn",
-            "en": "excited"
-        }
-    ],
-    "Complex Feelings": [
-        {
-            "zh": "失望",
-            "pinyin": "shīwàng",
-            "en": "disappointed"
-        },
-        {
-            "zh": "骄傲",
-            "pinyin": "jiāo'ào",
-            "en": "proud"
-        },
-        {
-            "zh": "感动",
-            "pinyin": "gǎndòng",
-            "en": "moved/touched"
-        },
-        {
-            "zh": "困惑",
-            "pinyin": "kùnhuò",
-            "en": "confused"
-        },
-        {
-            "zh": "担心",
-            "pinyin": "dānxīn",
-            "en": "worried"
-        }
-    ],
-    "Expressing Feelings": [
-        {
-            "zh": "我觉得很...",
-            "pinyin": "wǒ juéde hěn...",
-            "en": "I feel very..."
-        },
-        {
-            "zh": "让我很开心",
-            "pinyin": "ràng wǒ hěn kāixīn",
-            "en": "makes me happy"
-        },
-        {
-            "zh": "我有点儿...",
-            "pinyin": "wǒ yǒu diǎnr...",
-            "en": "I'm a bit..."
-        },
-        {
-            "zh": "心情不好",
-            "pinyin": "xīnqíng bù hǎo",
-            "en": "in a bad mood"
-        }
-    ]
-}
-
-# Weather & Daily Life
-daily_life_phrases = {
-    "Weather Conditions": [
-        {
-            "zh": "晴天",
-            "pinyin": "qíngtiān",
-            "en": "sunny day"
-        },
-        {
-            "zh": "下雨",
-            "pinyin": "xiàyǔ",
-            "en": "raining"
-        },
-        {
-            "zh": "多云",
-            "pinyin": "duōyún",
-            "en": "cloudy"
-        },
-        {
-            "zh": "刮风",
-            "pinyin": "guāfēng",
-            "en": "windy"
-        },
-        {
-            "zh": "下雪",
-            "pinyin": "xiàxuě",
-            "en": "snowing"
-        },
-        {
-            "zh": "潮湿",
-            "pinyin": "cháoshī",
-            "en": "humid"
-        }
-    ],
-    "Daily Routines": [
-        {
-            "zh": "起床",
-            "pinyin": "qǐchuáng",
-            "en": "get up"
-        },
-        {
-            "zh": "刷牙",
-            "pinyin": "shuāyá",
-            "en": "brush teeth"
-        },
-        {
-            "zh": "洗澡",
-            "pinyin": "xǐzǎo",
-            "en": "take a shower"
-        },
-        {
-            "zh": "吃早饭",
-            "pinyin": "chī zǎofàn",
-            "en": "eat breakfast"
-        },
-        {
-            "zh": "上班",
-            "pinyin": "shàngbān",
-            "en": "go to work"
-        },
-        {
-            "zh": "下班",
-            "pinyin": "xiàbān",
-            "en": "get off work"
-        }
-    ],
-    "Shopping Types": [
-        {
-            "zh": "服装店",
-            "pinyin": "fúzhuāng diàn",
-            "en": "clothing store"
-        },
-        {
-            "zh": "书店",
-            "pinyin": "shūdiàn",
-            "en": "bookstore"
-        },
-        {
-            "zh": "药店",
-            "pinyin": "yàodiàn",
-            "en": "pharmacy"
-        },
-        {
-            "zh": "面包店",
-            "pinyin": "miànbāo diàn",
-            "en": "bakery"
-        },
-        {
-            "zh": "水果店",
-            "pinyin": "shuǐguǒ diàn",
-            "en": "fruit store"
-        }
-    ]
-}
-
-# Comparison Structures
-comparison_phrases = {
-    "Basic Comparisons": [
-        {
-            "zh": "比...更",
-            "pinyin": "bǐ... gèng",
-            "en": "more... than"
-        },
-        {
-            "zh": "没有...那么",
-            "pinyin": "méiyǒu... nàme",
-            "en": "not as... as"
-        },
-        {
-            "zh": "跟...一样",
-            "pinyin": "gēn... yīyàng",
-            "en": "same as..."
-        },
-        {
-            "zh": "最...",
-            "pinyin": "zuì...",
-            "en": "the most..."
-        }
+import build_manifest  # noqa: E402
+import content_store  # noqa: E402
+
+# Supplementary phrases by category live in content/supplementary/{category}.json
+# and are loaded on first access.
+supplementary_phrases = content_store.LazyMapping(
+    [
+        "education",  # Education & Academic Life
+        "hobbies",  # Hobbies & Interests
+        "emotions",  # Emotions & Feelings
+        "daily_life",  # Weather & Daily Life
+        "comparisons",  # Comparison Structures
     ],
-    "Example Sentences": [
-        {
-            "zh": "这个比那个贵",
-            "pinyin": "zhège bǐ nàge guì",
-            "en": "this is more expensive than that"
-        },
-        {
-            "zh": "今天没有昨天热",
-            "pinyin": "jīntiān méiyǒu zuótiān rè",
-            "en": "today is not as hot as yesterday"
-        },
-        {
-            "zh": "这两个一样好",
-            "pinyin": "zhè liǎng ge yīyàng hǎo",
-            "en": "these two are equally good"
-        },
-        {
-            "zh": "这是最好的选择",
-            "pinyin": "zhè shì zuì hǎo de xuǎnzé",
-            "en": "this is the best choice"
-        }
-    ]
+    content_store.supplementary_phrases,
+)
+
+_LEGACY_NAMES = {
+    "education_phrases": "education",
+    "hobbies_phrases": "hobbies",
+    "emotions_phrases": "emotions",
+    "daily_life_phrases": "daily_life",
+    "comparison_phrases": "comparisons",
 }
 
-# Dictionary mapping categories to phrase dictionaries
-supplementary_phrases = {
-    "education": education_phrases,
-    "hobbies": hobbies_phrases,
-    "emotions": emotions_phrases,
-    "daily_life": daily_life_phrases,
-    "comparisons": comparison_phrases
-}
+def __getattr__(name):
+    """Keep legacy `education_phrases`-style module attributes working."""
+    if name in _LEGACY_NAMES:
+        return supplementary_phrases[_LEGACY_NAMES[name]]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-def generate_text_file(category, format_type):
+def generate_text_file(category, format_type, manifest=None):
     """Generate a text file with all phrases for a specific category"""
-    print(f"Generating {category} {format_type} text file...")
-    
     phrases_dict = supplementary_phrases[category]
+    out_path = f"text_files/supplementary/{category}_{format_type}.txt"
+    build_fp = build_manifest.fingerprint(
+        phrases_dict, format_type, build_manifest.code_version(generate_text_file)
+    )
+    if manifest is not None and manifest.is_fresh([out_path], build_fp):
+        print(f"✓ Up to date: {out_path}")
+        return
+
+    print(f"Generating {category} {format_type} text file...")
     
     # Ensure the text_files directory exists
     os.makedirs("text_files/supplementary", exist_ok=True)
     
-    with open(f"text_files/supplementary/{category}_{format_type}.txt", "w", encoding="utf-8") as f:
+    with open(out_path, "w", encoding="utf-8") as f:
         for subcategory, phrase_list in phrases_dict.items():
             f.write(f"\n{subcategory}\n")
             f.write("-" * len(subcategory) + "\n")
@@ -423,9 +67,11 @@ def generate_text_file(category, format_type):
                 else:  # English
                     f.write(f"{phrase['en']}\n")
     
-    print(f"✓ Saved to text_files/supplementary/{category}_{format_type}.txt")
+    if manifest is not None:
+        manifest.record([out_path], build_fp)
+    print(f"✓ Saved to {out_path}")
 
-async def generate_audio(category, format_type="zh", voice=None):
+async def generate_audio(category, format_type="zh", voice=None, **tts_options):
     """Generate per-phrase supplementary audio plus timing cues for highlight sync."""
     if voice is None:
         voice = "zh-CN-XiaoxiaoNeural" if format_type == "zh" else "en-US-JennyNeural"
@@ -435,14 +81,18 @@ async def generate_audio(category, format_type="zh", voice=None):
 
     phrases_dict = supplementary_phrases[category]
 
-    await audio_timings.generate_supplementary_audio_with_timings(
-        phrases_dict, category, format_type, voice
+    built = await audio_timings.generate_supplementary_audio_with_timings(
+        phrases_dict, category, format_type, voice, **tts_options
     )
+    if not built:
+        print(f"✓ Up to date: audio_files/supplementary/{category}_{format_type}.mp3")
+        return False
 
     elapsed = time.time() - start_time
     print(
         f"✓ Saved supplementary audio + timing/supplementary/{category}_{format_type}.json ({elapsed:.2f}s)"
     )
+    return True
 
 async def main():
     parser = argparse.ArgumentParser(description="Generate supplementary Mandarin and English learning files")
@@ -456,7 +106,12 @@ async def main():
                         help="Voice to use for audio generation")
     parser.add_argument("--language", "-l", type=str, choices=["zh", "en", "both"], default="both",
                         help="Language to generate audio for (zh=Chinese, en=English, both=Both languages)")
+    parser.add_argument("--force", "-f", action="store_true",
+                        help="Regenerate outputs even if their inputs are unchanged")
+    audio_timings.add_tts_arguments(parser)
     args = parser.parse_args()
+    tts_options = audio_timings.tts_options_from_args(args)
+    manifest = build_manifest.BuildManifest(force=args.force)
     
     # Determine which categories to process
     categories_to_process = [args.category] if args.category else supplementary_phrases.keys()
@@ -466,16 +121,18 @@ async def main():
         print(f"\n=== Processing {category} ===")
         
         # Generate text files for Chinese characters, Pinyin, and English
-        generate_text_file(category, "zh")
-        generate_text_file(category, "pinyin")
-        generate_text_file(category, "en")
+        generate_text_file(category, "zh", manifest)
+        generate_text_file(category, "pinyin", manifest)
+        generate_text_file(category, "en", manifest)
         
         # Generate audio files if not text-only mode
         if not args.text_only:
             if args.language in ["zh", "both"]:
-                await generate_audio(category, "zh", args.voice)
+                await generate_audio(category, "zh", args.voice, manifest=manifest, **tts_options)
             if args.language in ["en", "both"]:
-                await generate_audio(category, "en", args.voice)
+                await generate_audio(category, "en", args.voice, manifest=manifest, **tts_options)
+
+    audio_timings.evict_tts_cache(tts_options)
     
     print("\nAll supplementary files generated successfully!")
     print("\nUsage examples:")
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Hash every PWA and Flutter content asset into asset_manifest.json and report
+duplicates and drift between the two trees.
+
+    python scripts/asset_manifest.py                 # hash all, write manifest, report
+    python scripts/asset_manifest.py --check         # also exit 1 on drift
+    python scripts/asset_manifest.py --verify        # re-hash only files whose mtime changed
+
+Files are hashed with sha256 over read-only memory maps across a thread pool.
+Drift is judged against sync_flutter_assets.COPY_MAP: a Flutter copy that is
+missing, differs from its PWA source, or has no source any more. Duplicates are
+identical files within one tree (mirrors across trees are expected).
+
+The manifest lists (path, size, sha256) per file, plus mtime for --verify; it
+is the natural input for driving both the Flutter assets/ tree and the service
+worker's cache list from one source of truth.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import sync_flutter_assets
+
+ROOT = sync_flutter_assets.ROOT
+MANIFEST_PATH = ROOT / "asset_manifest.json"
+PWA_DIRS = ("audio_files", "timing", "text_files", "reading_files", "writing_files")
+FLUTTER_DIR = "flutter_app/assets"
+HASH_CHUNK = 4 * 1024 * 1024
+DEFAULT_JOBS = 8
+
+
+def hash_file(path: Path) -> str:
+    """sha256 of a file, fed from a read-only mmap in chunks (hashlib releases the GIL)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    for offset in range(0, size, HASH_CHUNK):
+                        digest.update(view[offset:offset + HASH_CHUNK])
+    return digest.hexdigest()
+
+
+def asset_files(root: Path = ROOT, dirs: tuple[str, ...] = PWA_DIRS + (FLUTTER_DIR,)) -> list[Path]:
+    """Every regular, non-hidden file under `dirs`."""
+    found = []
+    for name in dirs:
+        for path in (root / name).rglob("*"):
+            if path.is_file() and not path.name.startswith("."):
+                found.append(path)
+    return sorted(found)
+
+
+def scan(
+    paths: list[Path], root: Path = ROOT, previous: dict[str, dict] | None = None, jobs: int = DEFAULT_JOBS
+) -> dict[str, dict]:
+    """
+    Manifest entries keyed by root-relative path. Files whose size and mtime
+    match their entry in `previous` keep its digest instead of being re-hashed.
+    """
+    previous = previous or {}
+
+    def entry(path: Path) -> tuple[str, dict]:
+        key = path.relative_to(root).as_posix()
+        st = path.stat()
+        old = previous.get(key)
+        if old and old["size"] == st.st_size and old["mtime_ns"] == st.st_mtime_ns:
+            return key, old
+        return key, {"size": st.st_size, "sha256": hash_file(path), "mtime_ns": st.st_mtime_ns}
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        return dict(pool.map(entry, paths))
+
+
+def tree_of(key: str) -> str:
+    return "flutter" if key.startswith(FLUTTER_DIR + "/") else "pwa"
+
+
+def find_duplicates(entries: dict[str, dict]) -> list[list[str]]:
+    """Groups of non-empty, byte-identical files within the same tree."""
+    groups: dict[tuple[str, str], list[str]] = {}
+    for key, entry in entries.items():
+        if entry["size"]:
+            groups.setdefault((tree_of(key), entry["sha256"]), []).append(key)
+    return sorted(sorted(keys) for keys in groups.values() if len(keys) > 1)
+
+
+def find_drift(
+    entries: dict[str, dict],
+    copy_map: list[tuple[Path, Path]] = sync_flutter_assets.COPY_MAP,
+    root: Path = ROOT,
+) -> dict[str, list[str]]:
+    """Flutter copies that are missing, differ from their PWA source, or are stale."""
+    planned = sync_flutter_assets.plan_files(copy_map)
+    drift: dict[str, list[str]] = {"missing": [], "differs": [], "stale": []}
+    for dest, src in planned.items():
+        dest_key, src_key = dest.relative_to(root).as_posix(), src.relative_to(root).as_posix()
+        if dest_key not in entries:
+            drift["missing"].append(dest_key)
+        elif src_key in entries and entries[dest_key]["sha256"] != entries[src_key]["sha256"]:
+            drift["differs"].append(dest_key)
+    stale = sync_flutter_assets.managed_files(copy_map) - planned.keys()
+    drift["stale"] = sorted(p.relative_to(root).as_posix() for p in stale)
+    return drift
+
+
+def diff_entries(old: dict[str, dict], new: dict[str, dict]) -> dict[str, list[str]]:
+    return {
+        "added": sorted(new.keys() - old.keys()),
+        "removed": sorted(old.keys() - new.keys()),
+        "modified": sorted(k for k in old.keys() & new.keys() if old[k]["sha256"] != new[k]["sha256"]),
+    }
+
+
+def load_manifest(path: Path = MANIFEST_PATH) -> dict[str, dict]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["files"]
+
+
+def save_manifest(entries: dict[str, dict], path: Path = MANIFEST_PATH) -> None:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".part")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "files": dict(sorted(entries.items()))}, f, indent=1)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def _print_group(title: str, keys: list[str], limit: int = 10) -> None:
+    if not keys:
+        return
+    print(f"  {title}: {len(keys)}")
+    for key in keys[:limit]:
+        print(f"    {key}")
+    if len(keys) > limit:
+        print(f"    … {len(keys) - limit} more")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Hash PWA and Flutter assets; report duplicates and drift")
+    parser.add_argument("--output", type=Path, default=MANIFEST_PATH, help="Manifest path")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS, help="Hashing threads")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the Flutter tree has drifted")
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Compare against an existing manifest, re-hashing only files whose size or mtime changed",
+    )
+    args = parser.parse_args()
+
+    t0 = time.perf_counter()
+    paths = asset_files()
+    if args.verify:
+        try:
+            old = load_manifest(args.output)
+        except FileNotFoundError:
+            parser.error(f"{args.output} not found; run without --verify first")
+        entries = scan(paths, previous=old, jobs=args.jobs)
+        rehashed = sum(1 for key, entry in entries.items() if entry is not old.get(key))
+        changes = diff_entries(old, entries)
+        print(f"Verified {len(entries)} files ({rehashed} re-hashed) in {time.perf_counter() - t0:.2f}s")
+        for title, keys in changes.items():
+            _print_group(title, keys)
+        return 1 if any(changes.values()) else 0
+
+    entries = scan(paths, jobs=args.jobs)
+    save_manifest(entries, args.output)
+    total = sum(e["size"] for e in entries.values())
+    print(f"Hashed {len(entries)} files ({total / 1e6:.1f} MB) in {time.perf_counter() - t0:.2f}s -> {args.output.name}")
+
+    duplicates = find_duplicates(entries)
+    if duplicates:
+        wasted = sum(entries[g[0]]["size"] * (len(g) - 1) for g in duplicates)
+        print(f"Duplicates within a tree: {len(duplicates)} group(s), {wasted / 1e6:.1f} MB redundant")
+        for group in duplicates[:10]:
+            print(f"    {' = '.join(group)}")
+        if len(duplicates) > 10:
+            print(f"    … {len(duplicates) - 10} more")
+
+    drift = find_drift(entries)
+    if any(drift.values()):
+        print("Flutter assets drift from the PWA (run scripts/sync_flutter_assets.py):")
+        for title, keys in drift.items():
+            _print_group(title, keys)
+    else:
+        print("Flutter assets match the PWA.")
+    return 1 if args.check and any(drift.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
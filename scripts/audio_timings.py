@@ -1,19 +1,28 @@
 """
-Stitch edge-tts MP3 segments and emit cue JSON for audio–text synchronization.
+Stitch TTS MP3 segments and emit cue JSON for audio–text synchronization.
 
-Requires ffmpeg on PATH (pydub decodes MP3 segments).
+Segments are streamed from a TTS backend (scripts/tts_backends.py; edge-tts by
+default) into memory and joined frame-by-frame (scripts/mp3_frames.py) without
+temp files. pydub, and with it ffmpeg on PATH, is only needed when segments
+differ in sample rate or channels.
 """
 
 from __future__ import annotations
 
+import argparse
+import asyncio
 import json
 import os
 import re
 import shutil
-import tempfile
+import sys
 from typing import Any
 
-import edge_tts
+import mp3_frames
+from build_manifest import BuildManifest, code_version, fingerprint
+from tts_backends import BACKENDS, DEFAULT_BACKEND, TTSBackend, get_backend
+from tts_cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_BYTES, SegmentCache, segment_key
+from tts_resilience import DEFAULT_RETRIES, RetryPolicy, SynthesizeFn, TokenBucket, with_retries
 
 try:
     from pydub import AudioSegment
@@ -23,15 +32,47 @@ except ImportError as e:
 else:
     _PYDUB_IMPORT_ERROR = None
 
+# Segments synthesized in parallel per lesson; 1 restores the old serial behavior.
+DEFAULT_TTS_CONCURRENCY = 4
+
+# Synthesized audio held in memory per lesson before further segments spill to disk.
+DEFAULT_SPILL_BYTES = 64 * 1024 * 1024
+
+# Recorded in build manifests so pipeline changes rebuild every lesson.
+AUDIO_TIMINGS_VERSION = fingerprint(
+    code_version(sys.modules[__name__]), code_version(mp3_frames)
+)[:16]
+
 
 def _ensure_pydub():
     if AudioSegment is None:
         raise RuntimeError(
-            "pydub is required for lesson audio timings. pip install pydub "
-            "and ensure ffmpeg is installed and on PATH."
+            "pydub is required to stitch MP3 segments with differing sample "
+            "rates or channels. pip install pydub and ensure ffmpeg is "
+            "installed and on PATH."
         ) from _PYDUB_IMPORT_ERROR
 
 
+def _concat_with_pydub(segment_paths: list[mp3_frames.Segment], output_mp3: str) -> list[float]:
+    """Decode, conform to the first segment's format and re-encode in one pass."""
+    _ensure_pydub()
+    segments = []
+    for seg in segment_paths:
+        with mp3_frames.open_segment(seg) as fh:
+            segments.append(AudioSegment.from_file(fh, format="mp3"))
+    first = segments[0]
+    conformed = [
+        seg.set_frame_rate(first.frame_rate)
+        .set_channels(first.channels)
+        .set_sample_width(first.sample_width)
+        for seg in segments
+    ]
+    # Join raw PCM once instead of repeated `+=`, which copies quadratically.
+    combined = first._spawn(b"".join(seg.raw_data for seg in conformed))
+    combined.export(output_mp3, format="mp3")
+    return [mp3_frames.probe_duration(p) for p in segment_paths]
+
+
 def _tts_text_for_phrase(phrase: dict, format_type: str) -> str:
     if format_type == "zh":
         return phrase["zh"] + "。"
@@ -70,6 +111,102 @@ def split_reading_passage(text: str, lang: str) -> list[str]:
     return [p.strip() for p in parts if p.strip()]
 
 
+def _resolve_synthesis(
+    synthesize: SynthesizeFn | None, backend: TTSBackend | str | None, engine: str | None
+) -> tuple[SynthesizeFn, str]:
+    """
+    The synthesize callable and engine id to use; defaults to the edge-tts backend.
+    A backend given by name is only constructed here, once audio is actually built.
+    """
+    if isinstance(backend, str):
+        backend = get_backend(backend)
+    if synthesize is None:
+        backend = backend or get_backend(DEFAULT_BACKEND)
+        synthesize = backend.synthesize
+    if engine is None:
+        engine = backend.engine if backend is not None else "custom"
+    return synthesize, engine
+
+
+async def synthesize_segments(
+    texts: list[str],
+    voice: str,
+    spill_dir: str | None = None,
+    *,
+    concurrency: int = DEFAULT_TTS_CONCURRENCY,
+    synthesize: SynthesizeFn | None = None,
+    backend: TTSBackend | str | None = None,
+    cache: SegmentCache | None = None,
+    engine: str | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+    retry: RetryPolicy | None = None,
+    rate_limiter: TokenBucket | None = None,
+    spill_bytes: int = DEFAULT_SPILL_BYTES,
+) -> list[mp3_frames.Segment]:
+    """
+    Synthesize each text with at most `concurrency` requests in flight.
+    Returns segments in input order, each either MP3 bytes held in memory or
+    a file path (a cache hit, or spilled to `spill_dir`/seg_XXXX.mp3 once
+    more than `spill_bytes` are held; without a `spill_dir` nothing spills).
+
+    Segments come from `backend` (an instance or a BACKENDS name; default:
+    edge-tts, streamed) or from a bare `synthesize(text, voice) -> bytes`
+    stand-in; `engine` defaults to the backend's. With a `cache`, segments
+    already synthesized for the same (text, voice, engine) are reused from it,
+    and new ones are written to it once. A shared `semaphore` caps requests across several lessons and takes
+    precedence over `concurrency`.
+
+    `retry` retries failed requests with jittered exponential backoff and a
+    shared `rate_limiter` token bucket paces every attempt. With a cache, one
+    segment failing for good does not cancel the others: they finish and are
+    cached before the error is raised, so rerunning resumes where this stopped.
+    """
+    synthesize, engine = _resolve_synthesis(synthesize, backend, engine)
+    if retry is not None or rate_limiter is not None:
+        synthesize = with_retries(synthesize, retry or RetryPolicy(retries=0), rate_limiter)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(1, int(concurrency)))
+    segments: list[mp3_frames.Segment] = [b""] * len(texts)
+    held = 0
+
+    async def _one(idx: int, text: str) -> None:
+        nonlocal held
+        key = None
+        if cache is not None:
+            key = segment_key(text, voice, engine)
+            cached = cache.lookup(key)
+            if cached is not None:
+                segments[idx] = cached
+                return
+        async with semaphore:
+            data = await synthesize(text, voice)
+        if cache is not None:
+            cache.store_bytes(key, data)
+        if spill_dir is not None and held + len(data) > spill_bytes:
+            os.makedirs(spill_dir, exist_ok=True)
+            path = os.path.join(spill_dir, f"seg_{idx:04d}.mp3")
+            with open(path, "wb") as fh:
+                fh.write(data)
+            segments[idx] = path
+        else:
+            held += len(data)
+            segments[idx] = data
+
+    tasks = [asyncio.ensure_future(_one(idx, t)) for idx, t in enumerate(texts)]
+    try:
+        results = await asyncio.gather(*tasks, return_exceptions=cache is not None)
+    except BaseException:
+        # Stop in-flight requests before the caller removes spill_dir.
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return segments
+
+
 async def concatenate_tts_segments(
     segment_jobs: list[tuple[str, dict]],
     voice: str,
@@ -77,16 +214,43 @@ async def concatenate_tts_segments(
     output_json: str,
     *,
     manifest_extra: dict[str, Any] | None = None,
-) -> None:
+    concurrency: int = DEFAULT_TTS_CONCURRENCY,
+    synthesize: SynthesizeFn | None = None,
+    backend: TTSBackend | str | None = None,
+    cache: SegmentCache | None = None,
+    engine: str | None = None,
+    semaphore: asyncio.Semaphore | None = None,
+    retry: RetryPolicy | None = None,
+    rate_limiter: TokenBucket | None = None,
+    spill_bytes: int = DEFAULT_SPILL_BYTES,
+    manifest: BuildManifest | None = None,
+) -> bool:
     """
     segment_jobs: list of (tts_text, cue_metadata_dict_without start/end/i).
     Cue index i is the job order (overwrites any incoming i).
-    """
-    _ensure_pydub()
 
+    Segments are fetched concurrently (see synthesize_segments) but cues are
+    assembled in job order, so i/start/end do not depend on completion order.
+    Pass a SegmentCache to reuse unchanged phrases across rebuilds (it is not
+    trimmed here; see evict_tts_cache), and a RetryPolicy / TokenBucket to ride
+    out flaky or rate-limited TTS responses.
+    Segment audio stays in memory; only past `spill_bytes` does it go to a
+    scratch directory next to output_mp3 (removed afterwards).
+
+    With a build `manifest`, returns False without synthesizing anything when
+    both outputs exist and were built from identical inputs; True otherwise.
+    """
     if not segment_jobs:
         raise ValueError("segment_jobs cannot be empty")
 
+    synthesize, engine = _resolve_synthesis(synthesize, backend, engine)
+    outputs = [output_mp3, output_json]
+    build_fp = fingerprint(
+        segment_jobs, voice, engine, manifest_extra, AUDIO_TIMINGS_VERSION
+    )
+    if manifest is not None and manifest.is_fresh(outputs, build_fp):
+        return False
+
     out_mp3_dir = os.path.dirname(output_mp3)
     out_json_dir = os.path.dirname(output_json)
     if out_mp3_dir:
@@ -94,40 +258,128 @@ async def concatenate_tts_segments(
     if out_json_dir:
         os.makedirs(out_json_dir, exist_ok=True)
 
-    tmpdir = tempfile.mkdtemp(prefix="tts_concat_")
+    # Beside the output rather than in /tmp, so spilled audio never lands on tmpfs.
+    spill_dir = f"{output_mp3}.segments"
     cues: list[dict] = []
-    segments_audio: list = []
     cumulative = 0.0
 
     try:
-        for idx, (tts_raw, meta) in enumerate(segment_jobs):
+        segments = await synthesize_segments(
+            [tts_raw for tts_raw, _ in segment_jobs],
+            voice,
+            spill_dir,
+            concurrency=concurrency,
+            synthesize=synthesize,
+            cache=cache,
+            engine=engine,
+            semaphore=semaphore,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            spill_bytes=spill_bytes,
+        )
+        durations = mp3_frames.concat_segments(segments, output_mp3)
+        if durations is None:
+            durations = _concat_with_pydub(segments, output_mp3)
+
+        for idx, ((_, meta), dur_sec) in enumerate(zip(segment_jobs, durations)):
             merged = dict(meta)
             merged["i"] = idx
-            seg_path = os.path.join(tmpdir, f"seg_{idx:04d}.mp3")
-            communicate = edge_tts.Communicate(tts_raw, voice)
-            await communicate.save(seg_path)
-            seg = AudioSegment.from_mp3(seg_path)
-            dur_sec = len(seg) / 1000.0
             start_sec = cumulative
             cumulative += dur_sec
             merged["start"] = round(start_sec, 4)
             merged["end"] = round(cumulative, 4)
             cues.append(merged)
-            segments_audio.append(seg)
 
-        combined = segments_audio[0]
-        for seg in segments_audio[1:]:
-            combined += seg
-        combined.export(output_mp3, format="mp3")
-
-        manifest = {"version": 1, "phrases": cues}
+        timing_doc = {"version": 1, "phrases": cues}
         if manifest_extra:
-            manifest.update(manifest_extra)
+            timing_doc.update(manifest_extra)
 
         with open(output_json, "w", encoding="utf-8") as f:
-            json.dump(manifest, f, indent=2, ensure_ascii=False)
+            json.dump(timing_doc, f, indent=2, ensure_ascii=False)
     finally:
-        shutil.rmtree(tmpdir, ignore_errors=True)
+        shutil.rmtree(spill_dir, ignore_errors=True)
+
+    if manifest is not None:
+        manifest.record(outputs, build_fp)
+    return True
+
+
+def add_tts_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the synthesis options shared by every generator CLI."""
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_TTS_CONCURRENCY,
+        help=(
+            "Maximum TTS requests in flight per lesson "
+            f"(default {DEFAULT_TTS_CONCURRENCY}; 1 = serial)"
+        ),
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        help=f"Synthesized segment cache directory (default {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="Evict least recently used segments beyond this size",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-synthesize every segment",
+    )
+    parser.add_argument(
+        "--tts-backend",
+        choices=sorted(BACKENDS),
+        default=DEFAULT_BACKEND,
+        help=(
+            f"Speech engine (default {DEFAULT_BACKEND}); 'synthetic' is offline and "
+            "writes silent audio sized to the text, for tests and benchmarks"
+        ),
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=DEFAULT_RETRIES,
+        help=f"Retries per segment with jittered exponential backoff (default {DEFAULT_RETRIES})",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=0,
+        help="Maximum TTS requests per second across all lessons (default: unlimited)",
+    )
+
+
+def tts_options_from_args(args: argparse.Namespace) -> dict[str, Any]:
+    """
+    Keyword arguments for the generate_*_with_timings helpers. The backend is
+    passed by name, so --text-only runs never import its TTS engine.
+    """
+    cache = None
+    if not args.no_cache and args.cache_dir:
+        cache = SegmentCache(args.cache_dir, max_bytes=args.cache_max_mb * 1024 * 1024)
+    return {
+        "concurrency": args.concurrency,
+        "backend": args.tts_backend,
+        "cache": cache,
+        "retry": RetryPolicy(retries=max(0, args.retries)),
+        "rate_limiter": TokenBucket(args.rate_limit) if args.rate_limit > 0 else None,
+    }
+
+
+def evict_tts_cache(tts_options: dict[str, Any]) -> None:
+    """
+    Trim the segment cache to --cache-max-mb. Call once after every lesson in
+    the run is stitched: cache hits are read from disk at concatenation time,
+    so evicting while other lessons are in flight could delete their segments.
+    """
+    cache = tts_options.get("cache")
+    if cache is not None:
+        cache.evict()
 
 
 async def generate_day_lesson_audio_with_timings(
@@ -135,7 +387,8 @@ async def generate_day_lesson_audio_with_timings(
     day: int,
     format_type: str = "zh",
     voice: str | None = None,
-) -> None:
+    **tts_options: Any,
+) -> bool:
     if voice is None:
         voice = "zh-CN-XiaoxiaoNeural" if format_type == "zh" else "en-US-JennyNeural"
 
@@ -153,12 +406,13 @@ async def generate_day_lesson_audio_with_timings(
     if not jobs:
         raise ValueError(f"No phrases to synthesize for day {day}")
 
-    await concatenate_tts_segments(
+    return await concatenate_tts_segments(
         jobs,
         voice,
         mp3_path,
         json_path,
         manifest_extra={"day": day, "lang": format_type},
+        **tts_options,
     )
 
 
@@ -167,7 +421,8 @@ async def generate_supplementary_audio_with_timings(
     category: str,
     format_type: str = "zh",
     voice: str | None = None,
-) -> None:
+    **tts_options: Any,
+) -> bool:
     if voice is None:
         voice = "zh-CN-XiaoxiaoNeural" if format_type == "zh" else "en-US-JennyNeural"
 
@@ -187,12 +442,13 @@ async def generate_supplementary_audio_with_timings(
     if not jobs:
         raise ValueError(f"No supplementary phrases for category {category}")
 
-    await concatenate_tts_segments(
+    return await concatenate_tts_segments(
         jobs,
         voice,
         mp3_path,
         json_path,
         manifest_extra={"category": category, "lang": format_type},
+        **tts_options,
     )
 
 
@@ -202,7 +458,8 @@ async def generate_reading_audio_with_timings(
     topic: str,
     format_type: str = "zh",
     voice: str | None = None,
-) -> None:
+    **tts_options: Any,
+) -> bool:
     slug = topic.lower().replace(" ", "_")
     if voice is None:
         voice = "zh-CN-XiaoxiaoNeural" if format_type == "zh" else "en-US-AriaNeural"
@@ -224,7 +481,7 @@ async def generate_reading_audio_with_timings(
     if not jobs:
         raise ValueError(f"No reading sentences for {level}/{topic}")
 
-    await concatenate_tts_segments(
+    return await concatenate_tts_segments(
         jobs,
         voice,
         mp3_path,
@@ -235,6 +492,7 @@ async def generate_reading_audio_with_timings(
             "lang": format_type,
             "kind": "reading",
         },
+        **tts_options,
     )
 
 
@@ -244,7 +502,8 @@ async def generate_writing_audio_with_timings(
     level: str,
     format_type: str = "zh",
     voice: str | None = None,
-) -> None:
+    **tts_options: Any,
+) -> bool:
     slug = level.lower().replace(" ", "_")
     if voice is None:
         voice = "zh-CN-XiaoxiaoNeural" if format_type == "zh" else "en-US-AriaNeural"
@@ -279,7 +538,7 @@ async def generate_writing_audio_with_timings(
     )
     json_path = os.path.join("timing/writing", f"{activity_type}_{slug}_{format_type}.json")
 
-    await concatenate_tts_segments(
+    return await concatenate_tts_segments(
         jobs,
         voice,
         mp3_path,
@@ -290,4 +549,5 @@ async def generate_writing_audio_with_timings(
             "lang": format_type,
             "kind": "writing",
         },
+        **tts_options,
     )
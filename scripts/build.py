@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Rebuild the whole lesson corpus from one job graph.
+
+Collects every (lesson, format, language) output from the six generator
+scripts, runs text jobs across a process pool and TTS jobs concurrently under
+one shared request limit, then reports per-job timings. Outputs whose inputs
+are unchanged are skipped via build_manifest.json unless --force is given.
+Finally the day lesson bundles (api/day/<N>.json) are refreshed and the SQLite
+corpus index (corpus.sqlite) is rebuilt unless --no-index.
+
+    python scripts/build.py
+    python scripts/build.py --only days reading --text-only
+    python scripts/build.py --concurrency 16 --workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = ROOT / "scripts"
+for _p in (str(ROOT), str(SCRIPTS)):
+    if _p not in sys.path:
+        sys.path.insert(0, _p)
+
+import audio_timings  # noqa: E402
+import build_manifest  # noqa: E402
+import corpus_index  # noqa: E402
+import lesson_bundles  # noqa: E402
+
+DAY_MODULES = [
+    "mandarin_phrases_days_01_07",
+    "mandarin_phrases_days_08_14",
+    "mandarin_phrases_days_15_22",
+    "mandarin_phrases_days_23_30",
+    "mandarin_phrases_days_31_40",
+]
+GROUPS = ["days", "supplementary", "reading", "writing"]
+TEXT_FORMATS = ["zh", "pinyin", "en"]
+AUDIO_FORMATS = ["zh", "en"]
+
+
+class Job(NamedTuple):
+    kind: str  # "text" or "tts"
+    label: str
+    module: str
+    func: str
+    args: tuple
+
+
+class JobResult(NamedTuple):
+    job: Job
+    status: str  # "built", "skipped" or "failed"
+    seconds: float
+    error: str = ""
+
+
+def collect_jobs(groups: list[str], text_only: bool) -> list[Job]:
+    jobs: list[Job] = []
+
+    def add(module_name, text_func, keys, label_fn):
+        for key in keys:
+            key_args = key if isinstance(key, tuple) else (key,)
+            for fmt in TEXT_FORMATS:
+                jobs.append(
+                    Job("text", f"{label_fn(*key_args)} {fmt} text", module_name, text_func, (*key_args, fmt))
+                )
+            if text_only:
+                continue
+            for fmt in AUDIO_FORMATS:
+                jobs.append(
+                    Job("tts", f"{label_fn(*key_args)} {fmt} audio", module_name, "generate_audio", (*key_args, fmt))
+                )
+
+    if "days" in groups:
+        for name in DAY_MODULES:
+            module = importlib.import_module(name)
+            add(name, "generate_text_file", list(module.all_phrases), lambda d: f"day{d}")
+    if "supplementary" in groups:
+        name = "mandarin_phrases_supplementary"
+        module = importlib.import_module(name)
+        add(name, "generate_text_file", list(module.supplementary_phrases), lambda c: c)
+    if "reading" in groups:
+        name = "reading_activities"
+        module = importlib.import_module(name)
+        keys = [(lvl, topic) for lvl, topics in module.all_readings.items() for topic in topics]
+        add(name, "generate_reading_file", keys, lambda lvl, topic: f"reading {lvl}/{topic}")
+    if "writing" in groups:
+        name = "writing_activities"
+        module = importlib.import_module(name)
+        keys = [(kind, lvl) for kind, levels in module.all_writing_activities.items() for lvl in levels]
+        add(name, "generate_writing_file", keys, lambda kind, lvl: f"writing {kind}/{lvl}")
+    return jobs
+
+
+def _run_text_job(job: Job, force: bool) -> tuple[dict[str, str], float]:
+    """Process-pool entry point; returns manifest updates for the parent to merge."""
+    t0 = time.perf_counter()
+    manifest = build_manifest.BuildManifest(force=force, autosave=False)
+    func = getattr(importlib.import_module(job.module), job.func)
+    func(*job.args, manifest)
+    return manifest.updates, time.perf_counter() - t0
+
+
+async def run_text_jobs(
+    jobs: list[Job], manifest: build_manifest.BuildManifest, workers: int
+) -> list[JobResult]:
+    loop = asyncio.get_running_loop()
+    results: list[JobResult] = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            loop.run_in_executor(pool, _run_text_job, job, manifest.force) for job in jobs
+        ]
+        for job, outcome in zip(jobs, await asyncio.gather(*futures, return_exceptions=True)):
+            if isinstance(outcome, BaseException):
+                results.append(JobResult(job, "failed", 0.0, repr(outcome)))
+                continue
+            updates, seconds = outcome
+            manifest.merge(updates)
+            results.append(JobResult(job, "built" if updates else "skipped", seconds))
+    return results
+
+
+async def run_tts_jobs(
+    jobs: list[Job], manifest: build_manifest.BuildManifest, tts_options: dict
+) -> list[JobResult]:
+    async def _one(job: Job) -> JobResult:
+        t0 = time.perf_counter()
+        func = getattr(importlib.import_module(job.module), job.func)
+        try:
+            built = await func(*job.args, manifest=manifest, **tts_options)
+        except Exception as e:  # keep the rest of the corpus building
+            return JobResult(job, "failed", time.perf_counter() - t0, repr(e))
+        return JobResult(job, "built" if built else "skipped", time.perf_counter() - t0)
+
+    return list(await asyncio.gather(*(_one(job) for job in jobs)))
+
+
+def print_report(results: list[JobResult], wall: float, top: int) -> None:
+    print("\n=== Build report ===")
+    for kind in ("text", "tts"):
+        subset = [r for r in results if r.job.kind == kind]
+        if not subset:
+            continue
+        counts = {s: sum(1 for r in subset if r.status == s) for s in ("built", "skipped", "failed")}
+        busy = sum(r.seconds for r in subset)
+        print(
+            f"{kind:>4}: {len(subset)} jobs, {counts['built']} built, "
+            f"{counts['skipped']} skipped, {counts['failed']} failed, {busy:.2f}s job time"
+        )
+    slowest = sorted((r for r in results if r.status == "built"), key=lambda r: -r.seconds)[:top]
+    if slowest:
+        print(f"Slowest {len(slowest)} jobs:")
+        for r in slowest:
+            print(f"  {r.seconds:8.2f}s  {r.job.label}")
+    for r in results:
+        if r.status == "failed":
+            print(f"✗ {r.job.label}: {r.error}")
+    print(f"Wall time {wall:.2f}s")
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Rebuild all lesson text, audio and timing outputs in parallel. "
+        "--concurrency is shared by every lesson in flight, not per lesson."
+    )
+    parser.add_argument("--only", nargs="+", choices=GROUPS, default=GROUPS, help="Lesson groups to build")
+    parser.add_argument("--text-only", "-t", action="store_true", help="Skip audio and timing outputs")
+    parser.add_argument("--force", "-f", action="store_true", help="Rebuild even if inputs are unchanged")
+    parser.add_argument(
+        "--workers", type=int, default=os.cpu_count() or 1, help="Processes for text jobs (default: all cores)"
+    )
+    parser.add_argument("--top", type=int, default=10, help="Slowest jobs to list in the report")
+    parser.add_argument("--no-index", action="store_true", help="Skip rebuilding corpus.sqlite")
+    audio_timings.add_tts_arguments(parser)
+    args = parser.parse_args()
+
+    # Generators write relative to the repository root.
+    os.chdir(ROOT)
+    t0 = time.perf_counter()
+    jobs = collect_jobs(args.only, args.text_only)
+    manifest = build_manifest.BuildManifest(force=args.force)
+    tts_options = audio_timings.tts_options_from_args(args)
+    tts_options["semaphore"] = asyncio.Semaphore(max(1, args.concurrency))
+
+    text_jobs = [j for j in jobs if j.kind == "text"]
+    tts_jobs = [j for j in jobs if j.kind == "tts"]
+    print(f"Building {len(text_jobs)} text and {len(tts_jobs)} audio jobs …")
+    text_results, tts_results = await asyncio.gather(
+        run_text_jobs(text_jobs, manifest, max(1, args.workers)),
+        run_tts_jobs(tts_jobs, manifest, tts_options),
+    )
+    results = text_results + tts_results
+    audio_timings.evict_tts_cache(tts_options)
+    if "days" in args.only:
+        written = lesson_bundles.write_bundles(manifest=manifest)
+        print(f"Wrote {written} lesson bundle(s) to {lesson_bundles.BUNDLE_DIR}/")
+    if not args.no_index:
+        t_index = time.perf_counter()
+        corpus_index.build_index()
+        print(f"Rebuilt {corpus_index.DEFAULT_DB_PATH.name} in {time.perf_counter() - t_index:.2f}s")
+    print_report(results, time.perf_counter() - t0, args.top)
+    return 1 if any(r.status == "failed" for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,85 @@
+"""
+Build manifest for incremental lesson generation.
+
+Each generated output path maps to a fingerprint of everything that went into
+it (lesson content, voice, format, generator code). Generators skip outputs
+whose recorded fingerprint still matches and whose files still exist; --force
+rebuilds regardless.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+from typing import Any
+
+MANIFEST_PATH = "build_manifest.json"
+
+
+def fingerprint(*parts: Any) -> str:
+    """Stable hash of JSON-serializable inputs (dict key order does not matter)."""
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def code_version(obj: Any) -> str:
+    """Hash of a module's or function's source, so code edits invalidate outputs."""
+    return hashlib.sha256(inspect.getsource(obj).encode("utf-8")).hexdigest()[:16]
+
+
+class BuildManifest:
+    """
+    JSON map of output path -> input fingerprint, saved after every record().
+
+    With autosave=False (worker processes), records only accumulate in
+    `updates` for the parent to merge(), so concurrent writers never race.
+    """
+
+    def __init__(self, path: str = MANIFEST_PATH, force: bool = False, autosave: bool = True):
+        self.path = path
+        self.force = force
+        self.autosave = autosave
+        self.entries: dict[str, str] = {}
+        self.updates: dict[str, str] = {}
+        try:
+            with open(path, encoding="utf-8") as f:
+                self.entries = json.load(f).get("outputs", {})
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _key(output: str) -> str:
+        return os.path.normpath(output).replace(os.sep, "/")
+
+    def is_fresh(self, outputs: list[str], fp: str) -> bool:
+        if self.force:
+            return False
+        return all(
+            self.entries.get(self._key(out)) == fp and os.path.exists(out)
+            for out in outputs
+        )
+
+    def record(self, outputs: list[str], fp: str) -> None:
+        self.merge({self._key(out): fp for out in outputs})
+
+    def merge(self, updates: dict[str, str]) -> None:
+        self.entries.update(updates)
+        self.updates.update(updates)
+        if self.autosave and updates:
+            self.save()
+
+    def save(self) -> None:
+        directory = os.path.dirname(self.path) or "."
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".part")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(
+                {"version": 1, "outputs": dict(sorted(self.entries.items()))},
+                f,
+                indent=2,
+                ensure_ascii=False,
+            )
+            f.write("\n")
+        os.replace(tmp, self.path)
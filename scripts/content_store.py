@@ -0,0 +1,76 @@
+"""
+Lazily loaded lesson content (content/*.json).
+
+Phrase, reading and writing corpora live as one JSON file per lesson group
+instead of dict literals in the generator modules, so importing a generator
+no longer parses the whole corpus. Each file is read on first access and
+memoized; LazyMapping keeps the old `all_phrases[day]` style lookups working.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Callable, Hashable, Iterable, Iterator
+
+CONTENT_DIR = Path(__file__).resolve().parent.parent / "content"
+
+
+@functools.lru_cache(maxsize=None)
+def load(kind: str, name: str) -> Any:
+    """Parse content/<kind>/<name>.json once per process."""
+    with open(CONTENT_DIR / kind / f"{name}.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def names(kind: str) -> list[str]:
+    """File stems available under content/<kind>/, sorted."""
+    return sorted(p.stem for p in (CONTENT_DIR / kind).glob("*.json"))
+
+
+def days() -> list[int]:
+    return sorted(int(name[len("day"):]) for name in names("days"))
+
+
+def day_phrases(day: int) -> dict:
+    return load("days", f"day{day}")
+
+
+def supplementary_phrases(category: str) -> dict:
+    return load("supplementary", category)
+
+
+def readings(level: str) -> dict:
+    return load("reading", level)
+
+
+def writing_activities(activity_type: str) -> dict:
+    return load("writing", activity_type)
+
+
+class LazyMapping(Mapping):
+    """Read-only mapping over known keys whose values come from `loader(key)`."""
+
+    def __init__(self, keys: Iterable[Hashable], loader: Callable[[Any], Any]):
+        self._keys = list(keys)
+        self._key_set = set(self._keys)
+        self._loader = loader
+
+    def __getitem__(self, key):
+        if key not in self._key_set:
+            raise KeyError(key)
+        return self._loader(key)
+
+    def __iter__(self) -> Iterator:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key) -> bool:
+        return key in self._key_set
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._keys!r})"
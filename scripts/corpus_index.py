@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Single indexed SQLite database over every phrase, reading vocabulary entry,
+writing character and timing cue.
+
+Build it from content/ and timing/, then query without importing or scanning
+the lesson modules:
+
+    python scripts/corpus_index.py build
+    python scripts/corpus_index.py search 吃
+    python scripts/corpus_index.py search "ni hao" --field pinyin
+
+Besides column indexes on hanzi, tone-stripped pinyin and English, a `tokens`
+table maps every Chinese character, pinyin syllable and English word to the
+rows containing it, so "all phrases containing 吃" is an index lookup instead
+of a LIKE '%吃%' scan.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import unicodedata
+from pathlib import Path
+from typing import Iterator
+
+import content_store
+
+ROOT = Path(__file__).resolve().parent.parent
+DEFAULT_DB_PATH = ROOT / "corpus.sqlite"
+TIMING_DIR = ROOT / "timing"
+
+SCHEMA = """
+CREATE TABLE lessons (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,          -- day | supplementary | reading | writing
+    key TEXT NOT NULL,           -- "3", "education", "beginner/Self Introduction", ...
+    timing_stem TEXT,            -- timing/<stem>_{zh,en}.json
+    UNIQUE (kind, key)
+);
+CREATE TABLE phrases (
+    id INTEGER PRIMARY KEY,
+    lesson_id INTEGER NOT NULL REFERENCES lessons(id),
+    section TEXT,
+    position INTEGER NOT NULL,   -- order within the lesson; equals cue i for day/supplementary
+    hanzi TEXT,
+    pinyin TEXT,
+    pinyin_plain TEXT,
+    english TEXT
+);
+CREATE TABLE vocabulary (
+    id INTEGER PRIMARY KEY,
+    lesson_id INTEGER NOT NULL REFERENCES lessons(id),
+    position INTEGER NOT NULL,
+    hanzi TEXT,
+    pinyin TEXT,
+    pinyin_plain TEXT,
+    english TEXT
+);
+CREATE TABLE characters (
+    id INTEGER PRIMARY KEY,
+    lesson_id INTEGER NOT NULL REFERENCES lessons(id),
+    position INTEGER NOT NULL,
+    hanzi TEXT,
+    pinyin TEXT,
+    pinyin_plain TEXT,
+    english TEXT,
+    stroke_count INTEGER,
+    stroke_order TEXT
+);
+CREATE TABLE cues (
+    lesson_id INTEGER NOT NULL REFERENCES lessons(id),
+    lang TEXT NOT NULL,
+    i INTEGER NOT NULL,
+    section TEXT,
+    start REAL NOT NULL,
+    "end" REAL NOT NULL,
+    PRIMARY KEY (lesson_id, lang, i)
+);
+CREATE TABLE tokens (
+    kind TEXT NOT NULL,          -- hanzi | pinyin | en
+    token TEXT NOT NULL,
+    source TEXT NOT NULL,        -- phrases | vocabulary | characters
+    row_id INTEGER NOT NULL
+);
+"""
+
+INDEXES = """
+CREATE INDEX idx_phrases_hanzi ON phrases(hanzi);
+CREATE INDEX idx_phrases_pinyin ON phrases(pinyin_plain);
+CREATE INDEX idx_phrases_english ON phrases(english COLLATE NOCASE);
+CREATE INDEX idx_phrases_lesson ON phrases(lesson_id, position);
+CREATE INDEX idx_vocabulary_hanzi ON vocabulary(hanzi);
+CREATE INDEX idx_vocabulary_pinyin ON vocabulary(pinyin_plain);
+CREATE INDEX idx_vocabulary_english ON vocabulary(english COLLATE NOCASE);
+CREATE INDEX idx_characters_hanzi ON characters(hanzi);
+CREATE INDEX idx_characters_pinyin ON characters(pinyin_plain);
+CREATE INDEX idx_tokens ON tokens(kind, token, source);
+"""
+
+SOURCES = ("phrases", "vocabulary", "characters")
+_HANZI_RE = re.compile(r"[㐀-鿿豈-﫿]")
+_WORD_RE = re.compile(r"[a-z0-9']+")
+
+
+def strip_tones(pinyin: str) -> str:
+    """'Nǐ hǎo!' -> 'ni hao'; ü becomes u."""
+    decomposed = unicodedata.normalize("NFD", pinyin or "")
+    plain = "".join(c for c in decomposed if not unicodedata.combining(c)).lower()
+    return " ".join(_WORD_RE.findall(plain))
+
+
+def _tokens(hanzi: str | None, pinyin_plain: str, english: str | None) -> Iterator[tuple[str, str]]:
+    for char in set(_HANZI_RE.findall(hanzi or "")):
+        yield "hanzi", char
+    for syllable in set(pinyin_plain.split()):
+        yield "pinyin", syllable
+    for word in set(_WORD_RE.findall((english or "").lower())):
+        yield "en", word
+
+
+def _slug(name: str) -> str:
+    return name.lower().replace(" ", "_")
+
+
+class _Writer:
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def lesson(self, kind: str, key: str, timing_stem: str | None) -> int:
+        cur = self.conn.execute(
+            "INSERT INTO lessons (kind, key, timing_stem) VALUES (?, ?, ?)",
+            (kind, key, timing_stem),
+        )
+        return cur.lastrowid
+
+    def row(self, table: str, lesson_id: int, position: int, hanzi, pinyin, english, **extra) -> None:
+        pinyin_plain = strip_tones(pinyin or "")
+        columns = ["lesson_id", "position", "hanzi", "pinyin", "pinyin_plain", "english", *extra]
+        values = [lesson_id, position, hanzi, pinyin, pinyin_plain, english, *extra.values()]
+        cur = self.conn.execute(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(values))})",
+            values,
+        )
+        self.conn.executemany(
+            "INSERT INTO tokens (kind, token, source, row_id) VALUES (?, ?, ?, ?)",
+            [(kind, tok, table, cur.lastrowid) for kind, tok in _tokens(hanzi, pinyin_plain, english)],
+        )
+
+    def cues(self, lesson_id: int, timing_stem: str) -> None:
+        for lang in ("zh", "en"):
+            path = TIMING_DIR / f"{timing_stem}_{lang}.json"
+            if not path.is_file():
+                continue
+            with open(path, encoding="utf-8") as f:
+                cues = json.load(f).get("phrases", [])
+            self.conn.executemany(
+                'INSERT INTO cues (lesson_id, lang, i, section, start, "end") VALUES (?, ?, ?, ?, ?, ?)',
+                [(lesson_id, lang, c["i"], c.get("section"), c["start"], c["end"]) for c in cues],
+            )
+
+
+def _add_phrase_lesson(w: _Writer, kind: str, key: str, stem: str, sections: dict) -> None:
+    lesson_id = w.lesson(kind, key, stem)
+    position = 0
+    for section, phrases in sections.items():
+        for phrase in phrases:
+            w.row("phrases", lesson_id, position, phrase["zh"], phrase["pinyin"], phrase["en"], section=section)
+            position += 1
+    w.cues(lesson_id, stem)
+
+
+def build_index(db_path: str | os.PathLike = DEFAULT_DB_PATH) -> Path:
+    """(Re)create the corpus database from content/ and timing/; returns its path."""
+    db_path = Path(db_path)
+    tmp_path = db_path.with_name(db_path.name + ".part")
+    if tmp_path.exists():
+        tmp_path.unlink()
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+        w = _Writer(conn)
+        for day in content_store.days():
+            _add_phrase_lesson(w, "day", str(day), f"day{day}", content_store.day_phrases(day))
+        for category in content_store.names("supplementary"):
+            _add_phrase_lesson(
+                w, "supplementary", category, f"supplementary/{category}",
+                content_store.supplementary_phrases(category),
+            )
+        for level in content_store.names("reading"):
+            for topic, reading in content_store.readings(level).items():
+                stem = f"reading/{level}_{_slug(topic)}"
+                lesson_id = w.lesson("reading", f"{level}/{topic}", stem)
+                for pos, word in enumerate(reading["vocabulary"]):
+                    w.row("vocabulary", lesson_id, pos, word["zh"], word["pinyin"], word["en"])
+                w.cues(lesson_id, stem)
+        for activity_type in content_store.names("writing"):
+            for level, activity in content_store.writing_activities(activity_type).items():
+                stem = f"writing/{activity_type}_{_slug(level)}"
+                lesson_id = w.lesson("writing", f"{activity_type}/{level}", stem)
+                for pos, char in enumerate(activity.get("characters", [])):
+                    w.row(
+                        "characters", lesson_id, pos, char["character"], char["pinyin"], char["meaning"],
+                        stroke_count=char.get("stroke_count"), stroke_order=char.get("stroke_order"),
+                    )
+                for pos, ex in enumerate(activity.get("exercises", [])):
+                    if activity_type == "translation":
+                        w.row("phrases", lesson_id, pos, ex["zh"], ex["pinyin"], ex["en"], section=activity_type)
+                    else:
+                        w.row(
+                            "phrases", lesson_id, pos, ex["full_sentence"], None, ex["full_sentence_en"],
+                            section=activity_type,
+                        )
+                w.cues(lesson_id, stem)
+        conn.executescript(INDEXES)
+        conn.commit()
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+    os.replace(tmp_path, db_path)
+    return db_path
+
+
+class CorpusIndex:
+    """Read-only query API over a database produced by build_index()."""
+
+    def __init__(self, db_path: str | os.PathLike = DEFAULT_DB_PATH):
+        self.conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        self.conn.row_factory = sqlite3.Row
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "CorpusIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _rows(self, source: str, where: str, params: list) -> list[dict]:
+        sql = (
+            f"SELECT '{source}' AS source, s.*, l.kind AS lesson_kind, l.key AS lesson_key "
+            f"FROM {source} s JOIN lessons l ON l.id = s.lesson_id WHERE {where} "
+            "ORDER BY l.id, s.position"
+        )
+        return [dict(r) for r in self.conn.execute(sql, params)]
+
+    def _by_tokens(self, kind: str, tokens: list[str], sources: tuple[str, ...]) -> dict[str, list[dict]]:
+        results: dict[str, list[dict]] = {}
+        if not tokens:
+            return results
+        for source in sources:
+            clauses = " INTERSECT ".join(
+                "SELECT row_id FROM tokens WHERE kind = ? AND token = ? AND source = ?" for _ in tokens
+            )
+            params = [v for tok in tokens for v in (kind, tok, source)]
+            results[source] = self._rows(source, f"s.id IN ({clauses})", params)
+        return results
+
+    def containing_hanzi(self, text: str, sources: tuple[str, ...] = SOURCES) -> dict[str, list[dict]]:
+        """Rows whose hanzi contains `text` (e.g. every phrase with 吃), per source table."""
+        chars = sorted(set(_HANZI_RE.findall(text)))
+        found = self._by_tokens("hanzi", chars, sources)
+        # Token hits guarantee every character is present; multi-character
+        # queries additionally need them adjacent and in order.
+        return {src: [r for r in rows if text in (r["hanzi"] or "")] for src, rows in found.items()}
+
+    def matching_pinyin(self, text: str, sources: tuple[str, ...] = SOURCES) -> dict[str, list[dict]]:
+        """Rows whose tone-stripped pinyin contains every syllable of `text` (tones ignored)."""
+        syllables = strip_tones(text).split()
+        found = self._by_tokens("pinyin", syllables, sources)
+        needle = " ".join(syllables)
+        return {src: [r for r in rows if needle in r["pinyin_plain"]] for src, rows in found.items()}
+
+    def matching_english(self, text: str, sources: tuple[str, ...] = SOURCES) -> dict[str, list[dict]]:
+        """Rows whose English contains every word of `text` (case-insensitive)."""
+        return self._by_tokens("en", _WORD_RE.findall(text.lower()), sources)
+
+    def lesson_phrases(self, kind: str, key: str) -> list[dict]:
+        return self._rows("phrases", "l.kind = ? AND l.key = ?", [kind, key])
+
+    def cue_for_phrase(self, phrase_id: int, lang: str = "zh") -> dict | None:
+        """Timing cue for a day/supplementary phrase, matched by its position in the lesson."""
+        row = self.conn.execute(
+            'SELECT c.i, c.section, c.start, c."end", l.timing_stem FROM phrases p '
+            "JOIN lessons l ON l.id = p.lesson_id "
+            "JOIN cues c ON c.lesson_id = p.lesson_id AND c.i = p.position AND c.lang = ? "
+            "WHERE p.id = ? AND l.kind IN ('day', 'supplementary')",
+            (lang, phrase_id),
+        ).fetchone()
+        return dict(row) if row else None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build or query the SQLite corpus index")
+    parser.add_argument("--db", default=str(DEFAULT_DB_PATH), help="Database path")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="Rebuild the index from content/ and timing/")
+    search = sub.add_parser("search", help="Find phrases, vocabulary and characters")
+    search.add_argument("query")
+    search.add_argument("--field", choices=["hanzi", "pinyin", "en"], default="hanzi")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        path = build_index(args.db)
+        with sqlite3.connect(path) as conn:
+            counts = {t: conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0] for t in (*SOURCES, "cues")}
+        print(f"Wrote {path}: " + ", ".join(f"{n} {t}" for t, n in counts.items()))
+        return
+
+    with CorpusIndex(args.db) as index:
+        lookup = {
+            "hanzi": index.containing_hanzi,
+            "pinyin": index.matching_pinyin,
+            "en": index.matching_english,
+        }[args.field]
+        for source, rows in lookup(args.query).items():
+            for r in rows:
+                print(f"[{r['lesson_kind']} {r['lesson_key']}] {source}: {r['hanzi']} | {r['pinyin'] or ''} | {r['english']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Precompute one JSON bundle per day lesson: phrases for every format plus both
+timing manifests, written to api/day/<N>.json.
+
+The day page loads this single document instead of a text file and a timing
+file; server.py also answers /api/day/<N> with it (gzip + ETag like any file).
+
+    python scripts/lesson_bundles.py
+    python scripts/lesson_bundles.py --days 1 2 3 --force
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+
+import build_manifest
+import content_store
+
+BUNDLE_DIR = os.path.join("api", "day")
+TIMING_LANGS = ("zh", "en")
+BUNDLE_VERSION = 1
+
+
+def bundle_path(day: int) -> str:
+    return os.path.join(BUNDLE_DIR, f"{day}.json")
+
+
+def _load_timing(day: int, lang: str) -> dict | None:
+    try:
+        with open(os.path.join("timing", f"day{day}_{lang}.json"), encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def build_bundle(day: int) -> dict:
+    sections = [
+        {"title": title, "phrases": phrases}
+        for title, phrases in content_store.day_phrases(day).items()
+    ]
+    return {
+        "version": BUNDLE_VERSION,
+        "day": day,
+        "sections": sections,
+        "timing": {lang: _load_timing(day, lang) for lang in TIMING_LANGS},
+    }
+
+
+def write_bundle(day: int, manifest: build_manifest.BuildManifest | None = None) -> bool:
+    """Write api/day/<day>.json unless its inputs are unchanged; returns whether it was written."""
+    bundle = build_bundle(day)
+    out_path = bundle_path(day)
+    build_fp = build_manifest.fingerprint(bundle, build_manifest.code_version(sys.modules[__name__]))
+    if manifest is not None and manifest.is_fresh([out_path], build_fp):
+        return False
+
+    os.makedirs(BUNDLE_DIR, exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as f:
+        # Compact: this is served to browsers, not read by people.
+        json.dump(bundle, f, ensure_ascii=False, separators=(",", ":"))
+    if manifest is not None:
+        manifest.record([out_path], build_fp)
+    return True
+
+
+def write_bundles(days: list[int] | None = None, manifest: build_manifest.BuildManifest | None = None) -> int:
+    """Write bundles for `days` (default: every day); returns how many were written."""
+    return sum(write_bundle(day, manifest) for day in (days or content_store.days()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Precompute api/day/<N>.json lesson bundles")
+    parser.add_argument("--days", type=int, nargs="+", help="Days to bundle (default: all)")
+    parser.add_argument("--force", "-f", action="store_true", help="Rewrite even if inputs are unchanged")
+    args = parser.parse_args()
+
+    manifest = build_manifest.BuildManifest(force=args.force)
+    written = write_bundles(args.days, manifest)
+    print(f"✓ Wrote {written} lesson bundle(s) to {BUNDLE_DIR}/")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""
+Pure-Python MPEG audio frame parsing for stitching and timing TTS segments.
+
+Edge TTS returns constant-format MP3 (same sample rate, channels and layer for
+every segment of a voice), so segments can be joined by appending their audio
+frames; no decode/re-encode or ffmpeg needed. Durations come from the frame
+count. Metadata (ID3 tags, Xing/Info/VBRI header frames) is dropped because it
+would describe a single segment, not the stitched file.
+
+A segment is either a file path or the MP3 bytes themselves, so freshly
+synthesized audio can be stitched straight from memory.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from typing import BinaryIO, Iterator, NamedTuple, Union
+
+Segment = Union[str, bytes]
+
+# Bitrates in kbps indexed by [version_is_mpeg1][layer][bitrate_index].
+_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_SAMPLE_RATES = {
+    "1": (44100, 48000, 32000),
+    "2": (22050, 24000, 16000),
+    "2.5": (11025, 12000, 8000),
+}
+_VERSIONS = {0b00: "2.5", 0b10: "2", 0b11: "1"}
+_LAYERS = {0b01: 3, 0b10: 2, 0b11: 1}
+
+
+class FrameHeader(NamedTuple):
+    version: str
+    layer: int
+    bitrate: int
+    sample_rate: int
+    channels: int
+    frame_length: int
+    samples: int
+
+    @property
+    def stream_format(self) -> tuple[str, int, int, int]:
+        """Fields that must match for frames to be appended to one stream."""
+        return (self.version, self.layer, self.sample_rate, self.channels)
+
+
+def parse_header(header: bytes) -> FrameHeader | None:
+    """Decode a 4-byte MPEG audio frame header; None if it is not one."""
+    if len(header) < 4 or header[0] != 0xFF or (header[1] & 0xE0) != 0xE0:
+        return None
+    version = _VERSIONS.get((header[1] >> 3) & 0b11)
+    layer = _LAYERS.get((header[1] >> 1) & 0b11)
+    bitrate_index = header[2] >> 4
+    rate_index = (header[2] >> 2) & 0b11
+    if version is None or layer is None or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    mpeg1 = version == "1"
+    bitrate = _BITRATES[(mpeg1, layer)][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    padding = (header[2] >> 1) & 1
+    channels = 1 if (header[3] >> 6) == 0b11 else 2
+    if layer == 1:
+        samples = 384
+        frame_length = (12 * bitrate // sample_rate + padding) * 4
+    elif layer == 2 or mpeg1:
+        samples = 1152
+        frame_length = 144 * bitrate // sample_rate + padding
+    else:
+        samples = 576
+        frame_length = 72 * bitrate // sample_rate + padding
+    return FrameHeader(version, layer, bitrate, sample_rate, channels, frame_length, samples)
+
+
+def id3v2_size(head: bytes) -> int:
+    """Byte length of a leading ID3v2 tag (0 when absent)."""
+    if len(head) < 10 or head[:3] != b"ID3":
+        return 0
+    size = 0
+    for b in head[6:10]:
+        size = (size << 7) | (b & 0x7F)
+    footer = 10 if head[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def side_info_size(header: FrameHeader) -> int:
+    if header.layer != 3:
+        return 0
+    if header.version == "1":
+        return 17 if header.channels == 1 else 32
+    return 9 if header.channels == 1 else 17
+
+
+def is_info_frame(header: FrameHeader, frame: bytes) -> bool:
+    """True for Xing/Info/VBRI metadata frames, which carry no audio."""
+    off = 4 + side_info_size(header)
+    if frame[off:off + 4] in (b"Xing", b"Info"):
+        return True
+    return frame[36:40] == b"VBRI"
+
+
+def iter_frames(fh: BinaryIO) -> Iterator[tuple[FrameHeader, bytes]]:
+    """
+    Yield (header, frame_bytes) for each audio frame, one frame in memory at
+    a time. Leading ID3v2 is skipped; parsing stops at trailing tags or junk.
+    """
+    head = fh.read(10)
+    fh.seek(id3v2_size(head))
+    while True:
+        raw = fh.read(4)
+        header = parse_header(raw)
+        if header is None or header.frame_length <= 4:
+            return
+        body = fh.read(header.frame_length - 4)
+        if len(body) < header.frame_length - 4:
+            return
+        yield header, raw + body
+
+
+def _xing_duration(header: FrameHeader, frame: bytes) -> float | None:
+    """Duration from a Xing/Info header's frame count, minus LAME encoder delay/padding."""
+    off = 4 + side_info_size(header)
+    if frame[off:off + 4] not in (b"Xing", b"Info"):
+        return None
+    flags = int.from_bytes(frame[off + 4:off + 8], "big")
+    if not flags & 0x1:
+        return None
+    frames = int.from_bytes(frame[off + 8:off + 12], "big")
+    samples = frames * header.samples
+    # Optional fields: frames (4), bytes (4), TOC (100), quality (4).
+    lame = off + 8 + sum(n for bit, n in ((0x1, 4), (0x2, 4), (0x4, 100), (0x8, 4)) if flags & bit)
+    if len(frame) >= lame + 24 and frame[lame:lame + 4] in (b"LAME", b"Lavc", b"Lavf"):
+        gap = frame[lame + 21:lame + 24]
+        delay = (gap[0] << 4) | (gap[1] >> 4)
+        padding = ((gap[1] & 0x0F) << 8) | gap[2]
+        if delay + padding < samples:
+            samples -= delay + padding
+    return samples / header.sample_rate
+
+
+def _vbri_duration(header: FrameHeader, frame: bytes) -> float | None:
+    if frame[36:40] != b"VBRI" or len(frame) < 54:
+        return None
+    frames = int.from_bytes(frame[50:54], "big")
+    return frames * header.samples / header.sample_rate
+
+
+def scan_duration(fh: BinaryIO) -> float:
+    """Sum every frame's samples, seeking over frame bodies without reading them."""
+    head = fh.read(10)
+    fh.seek(id3v2_size(head))
+    seconds = 0.0
+    while True:
+        header = parse_header(fh.read(4))
+        if header is None or header.frame_length <= 4:
+            return seconds
+        fh.seek(header.frame_length - 4, os.SEEK_CUR)
+        seconds += header.samples / header.sample_rate
+
+
+def open_segment(segment: Segment) -> BinaryIO:
+    """Binary file object over a segment path or in-memory MP3 bytes."""
+    if isinstance(segment, (bytes, bytearray, memoryview)):
+        return io.BytesIO(segment)
+    return open(segment, "rb")
+
+
+def probe_duration(path: Segment) -> float:
+    """
+    Duration of an MP3 in seconds without decoding audio.
+
+    Reads the Xing/Info (with LAME gapless trim) or VBRI header when present,
+    otherwise falls back to a frame scan. Raises ValueError for non-MP3 data.
+    """
+    with open_segment(path) as fh:
+        for header, frame in iter_frames(fh):
+            break
+        else:
+            label = path if isinstance(path, str) else f"{len(path)}-byte segment"
+            raise ValueError(f"No MPEG audio frames found in {label}")
+        seconds = _xing_duration(header, frame)
+        if seconds is None:
+            seconds = _vbri_duration(header, frame)
+        if seconds is None:
+            fh.seek(0)
+            seconds = scan_duration(fh)
+    return seconds
+
+
+def first_header(path: Segment) -> FrameHeader | None:
+    with open_segment(path) as fh:
+        for header, _ in iter_frames(fh):
+            return header
+    return None
+
+
+def _append_frames(path: Segment, out: BinaryIO, stream_format: tuple) -> float | None:
+    """Copy one segment's audio frames to `out`; returns seconds, None on format change."""
+    samples = 0
+    sample_rate = 0
+    with open_segment(path) as fh:
+        for header, frame in iter_frames(fh):
+            if header.stream_format != stream_format:
+                return None
+            if samples == 0 and is_info_frame(header, frame):
+                continue
+            out.write(frame)
+            samples += header.samples
+            sample_rate = header.sample_rate
+    return samples / sample_rate if sample_rate else 0.0
+
+
+def concat_segments(segment_paths: list[Segment], output_path: str) -> list[float] | None:
+    """
+    Append the audio frames of each segment (path or bytes) into output_path
+    and return each segment's duration in seconds (frame count x samples /
+    sample rate).
+
+    Returns None without touching output_path when the segments do not share
+    one stream format (version, layer, sample rate, channels); callers should
+    fall back to decoding and re-encoding. Raises ValueError for a segment
+    with no audio frames (an empty or truncated TTS response).
+    """
+    formats = set()
+    for i, path in enumerate(segment_paths):
+        header = first_header(path)
+        if header is None:
+            raise ValueError(f"No MPEG audio frames in segment {i}")
+        formats.add(header.stream_format)
+    if len(formats) != 1:
+        return None
+    stream_format = formats.pop()
+
+    durations: list[float] | None = []
+    tmp_path = output_path + ".part"
+    try:
+        with open(tmp_path, "wb") as out:
+            for path in segment_paths:
+                seconds = _append_frames(path, out, stream_format)
+                if seconds is None:
+                    durations = None
+                    break
+                durations.append(seconds)
+        if durations is None:
+            os.unlink(tmp_path)
+        else:
+            os.replace(tmp_path, output_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return durations
@@ -1,13 +1,52 @@
 #!/usr/bin/env python3
-"""Copy PWA content assets into flutter_app/assets for offline bundling."""
+"""
+Copy PWA content assets into flutter_app/assets for offline bundling.
+
+    python scripts/sync_flutter_assets.py
+    python scripts/sync_flutter_assets.py --dry-run
+    python scripts/sync_flutter_assets.py --link --jobs 16
+
+Incremental: a destination file is left alone when its size and mtime match
+the source, or when they differ but the content hash matches. Only changed
+files are rewritten and files no longer present in the source are deleted, so
+a no-change sync touches nothing and Flutter's asset build cache stays warm.
+
+Verified sizes, mtimes and sha256 digests are kept in flutter_app/.asset_sync.json
+(outside assets/, so it is not bundled) to skip re-hashing on the next run.
+
+With --link, changed files are reflinked (FICLONE, copy-on-write on btrfs/XFS),
+else hardlinked to the source, else copied; the strategy is reported per file.
+Files are checked and written in parallel across --jobs threads.
+"""
 
 from __future__ import annotations
 
+import argparse
+import contextlib
+import errno
+import hashlib
+import json
+import os
 import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
 ROOT = Path(__file__).resolve().parent.parent
 ASSETS = ROOT / "flutter_app" / "assets"
+SYNC_MANIFEST = ROOT / "flutter_app" / ".asset_sync.json"
+HASH_CHUNK = 1024 * 1024
+DEFAULT_JOBS = 8
+# linux/fs.h _IOW(0x94, 9, int); fcntl.FICLONE only exists on Python 3.12+.
+FICLONE = getattr(fcntl, "FICLONE", 0x40049409)
+# Errors meaning "this strategy is unavailable here", not "the copy failed".
+_UNSUPPORTED = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOSYS}
 
 COPY_MAP = [
     (ROOT / "audio_files" / "day*.mp3", ASSETS / "audio"),
@@ -22,48 +61,230 @@ COPY_MAP = [
 ]
 
 
-def copy_glob(src_glob: Path, dest_dir: Path) -> int:
-    dest_dir.mkdir(parents=True, exist_ok=True)
-    count = 0
-    for src in sorted(src_glob.parent.glob(src_glob.name)):
-        if src.is_file():
-            shutil.copy2(src, dest_dir / src.name)
-            count += 1
-    return count
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def plan_files(copy_map: list[tuple[Path, Path]]) -> dict[Path, Path]:
+    """Map every destination file to the source file it should mirror."""
+    planned: dict[Path, Path] = {}
+    for src, dest in copy_map:
+        if "*" in src.name:
+            for path in sorted(src.parent.glob(src.name)):
+                if path.is_file():
+                    planned[dest / path.name] = path
+        elif src.is_dir():
+            for path in sorted(src.rglob("*")):
+                if path.is_file():
+                    planned[dest / path.relative_to(src)] = path
+        elif src.is_file():
+            planned[dest] = src
+        else:
+            print(f"  skip missing: {src}")
+    return planned
+
+
+def managed_files(copy_map: list[tuple[Path, Path]]) -> set[Path]:
+    """Existing destination files owned by `copy_map` (candidates for stale deletion)."""
+    found: set[Path] = set()
+    for src, dest in copy_map:
+        if "*" in src.name:
+            found.update(p for p in dest.glob(src.name) if p.is_file())
+        elif dest.is_dir():
+            found.update(p for p in dest.rglob("*") if p.is_file())
+        elif dest.is_file():
+            found.add(dest)
+    return found
+
+
+def _reflink(src: Path, tmp: str) -> None:
+    if fcntl is None:
+        raise OSError(errno.ENOSYS, "reflink unsupported on this platform")
+    with open(src, "rb") as fin, open(tmp, "wb") as fout:
+        fcntl.ioctl(fout.fileno(), FICLONE, fin.fileno())
+    shutil.copystat(src, tmp)
 
 
-def copy_tree(src: Path, dest: Path) -> int:
-    if not src.exists():
-        print(f"  skip missing: {src}")
-        return 0
-    if src.is_file():
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src, dest)
-        return 1
-    if dest.exists():
-        shutil.rmtree(dest)
-    shutil.copytree(src, dest)
-    count = sum(1 for p in dest.rglob("*") if p.is_file())
-    return count
+def _hardlink(src: Path, tmp: str) -> None:
+    os.unlink(tmp)
+    os.link(src, tmp)
+
+
+def _install(src: Path, dest: Path, link: bool = False) -> str:
+    """
+    Materialize `src` at `dest` via a temp file in the destination directory,
+    then rename, so a hardlinked destination is replaced rather than written
+    through. Returns the strategy used: "reflink", "hardlink" or "copy".
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=dest.parent, prefix=f".{dest.name}.", suffix=".part")
+    os.close(fd)
+    try:
+        strategies = [("reflink", _reflink), ("hardlink", _hardlink)] if link else []
+        for name, attempt in strategies:
+            try:
+                attempt(src, tmp)
+                break
+            except OSError as exc:
+                if exc.errno not in _UNSUPPORTED:
+                    raise
+        else:
+            name = "copy"
+            shutil.copy2(src, tmp)
+        os.replace(tmp, dest)
+        return name
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+
+
+def _is_current(src: Path, dest: Path, src_st: os.stat_result, entry: dict | None) -> tuple[bool, str | None]:
+    """Whether `dest` already mirrors `src`; also returns the source digest if it was known or computed."""
+    src_known = bool(entry) and entry["size"] == src_st.st_size and entry["mtime_ns"] == src_st.st_mtime_ns
+    src_hash = entry["sha256"] if src_known else None
+    try:
+        dest_st = dest.stat()
+    except FileNotFoundError:
+        return False, src_hash
+    if dest_st.st_size != src_st.st_size:
+        return False, src_hash
+    if (dest_st.st_dev, dest_st.st_ino) == (src_st.st_dev, src_st.st_ino):
+        return True, src_hash or file_sha256(src)
+    if src_known and entry["dest_mtime_ns"] == dest_st.st_mtime_ns:
+        return True, src_hash
+    if dest_st.st_mtime_ns == src_st.st_mtime_ns and src_hash is not None:
+        return True, src_hash
+    src_hash = src_hash or file_sha256(src)
+    return file_sha256(dest) == src_hash, src_hash
+
+
+def load_manifest(path: Path) -> dict[str, dict]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f).get("files", {})
+    except FileNotFoundError:
+        return {}
+
+
+def save_manifest(path: Path, entries: dict[str, dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".part")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "files": dict(sorted(entries.items()))}, f, indent=1)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def _sync_one(
+    dest: Path, src: Path, entry: dict | None, root: Path, link: bool, dry_run: bool
+) -> tuple[str | None, dict | None]:
+    """Check and, if needed, update one file; returns (strategy or None if unchanged, manifest entry)."""
+    src_st = src.stat()
+    current, src_hash = _is_current(src, dest, src_st, entry)
+    linked = bool(entry and entry.get("linked"))
+    if current and link and not linked:
+        # An identical plain copy from an earlier sync: replace it with a link once.
+        current = os.path.samefile(src, dest)
+        linked = current
+    strategy = None
+    if not current:
+        if dry_run:
+            return "update", None
+        strategy = _install(src, dest, link)
+        linked = link
+    return strategy, {
+        "src": src.relative_to(root).as_posix(),
+        "size": src_st.st_size,
+        "mtime_ns": src_st.st_mtime_ns,
+        "dest_mtime_ns": dest.stat().st_mtime_ns,
+        "sha256": src_hash or file_sha256(src),
+        "linked": linked,
+    }
+
+
+def sync(
+    copy_map: list[tuple[Path, Path]] = COPY_MAP,
+    manifest_path: Path = SYNC_MANIFEST,
+    root: Path = ROOT,
+    dry_run: bool = False,
+    link: bool = False,
+    jobs: int = DEFAULT_JOBS,
+) -> dict[str, int]:
+    """
+    Bring every destination in `copy_map` up to date across `jobs` threads.
+
+    Returns counts of copied (any strategy), unchanged and deleted files, plus
+    how many were written by each of reflink, hardlink and copy.
+    """
+    old = load_manifest(manifest_path)
+    entries: dict[str, dict] = {}
+    counts = {"copied": 0, "unchanged": 0, "deleted": 0, "reflink": 0, "hardlink": 0, "copy": 0}
+
+    planned = plan_files(copy_map)
+    keys = [dest.relative_to(root).as_posix() for dest in planned]
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        results = pool.map(
+            lambda dest, src, key: _sync_one(dest, src, old.get(key), root, link, dry_run),
+            planned.keys(),
+            planned.values(),
+            keys,
+        )
+        for key, (strategy, entry) in zip(keys, results):
+            if strategy is None:
+                counts["unchanged"] += 1
+            else:
+                print(f"  {strategy:<8} {key}")
+                counts["copied"] += 1
+                if strategy in counts:
+                    counts[strategy] += 1
+            if entry is not None:
+                entries[key] = entry
+
+    for stale in sorted(managed_files(copy_map) - planned.keys()):
+        print(f"  delete   {stale.relative_to(root).as_posix()}")
+        counts["deleted"] += 1
+        if not dry_run:
+            stale.unlink()
+            for parent in stale.parents:
+                if parent == root or any(parent.iterdir()):
+                    break
+                parent.rmdir()
+
+    if not dry_run and entries != old:
+        save_manifest(manifest_path, entries)
+    return counts
 
 
 def main() -> None:
-    total = 0
+    parser = argparse.ArgumentParser(description="Sync PWA content assets into flutter_app/assets")
+    parser.add_argument("--dry-run", "-n", action="store_true", help="Report changes without writing anything")
+    parser.add_argument(
+        "--link", action="store_true", help="Reflink, else hardlink, changed files instead of copying them"
+    )
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_JOBS, help="Parallel file workers")
+    args = parser.parse_args()
+
     print("Syncing PWA assets into flutter_app/assets …")
-    for src, dest in COPY_MAP:
-        if "*" in str(src):
-            n = copy_glob(src, dest)
-        else:
-            n = copy_tree(src, dest)
-        print(f"  {src.name}: {n} files -> {dest.relative_to(ROOT)}")
-        total += n
+    t0 = time.perf_counter()
+    counts = sync(dry_run=args.dry_run, link=args.link, jobs=args.jobs)
 
     legacy = ASSETS / "text" / "text_files"
-    if legacy.exists():
+    if legacy.exists() and not args.dry_run:
         shutil.rmtree(legacy)
         print(f"  removed legacy duplicate: {legacy.relative_to(ROOT)}")
 
-    print(f"Done. {total} files synced.")
+    print(
+        f"Done in {(time.perf_counter() - t0) * 1000:.0f} ms. {counts['copied']} copied, "
+        f"{counts['unchanged']} unchanged, {counts['deleted']} deleted."
+    )
+    written = ", ".join(f"{counts[s]} {s}" for s in ("reflink", "hardlink", "copy") if counts[s])
+    if written:
+        print(f"  written via {written}")
 
 
 if __name__ == "__main__":
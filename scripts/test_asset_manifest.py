@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""Tests for the asset hash manifest (scripts/asset_manifest.py)."""
+
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import asset_manifest
+from asset_manifest import diff_entries, find_drift, find_duplicates, hash_file, scan
+
+
+class TestHashFile(unittest.TestCase):
+    """Tests for the mmap-backed sha256."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_matches_hashlib_across_chunks_and_for_empty_files(self):
+        data = os.urandom(10_000)
+        (self.tmpdir / "a.bin").write_bytes(data)
+        (self.tmpdir / "empty").write_bytes(b"")
+        with mock.patch.object(asset_manifest, "HASH_CHUNK", 4096):
+            self.assertEqual(hash_file(self.tmpdir / "a.bin"), hashlib.sha256(data).hexdigest())
+        self.assertEqual(hash_file(self.tmpdir / "empty"), hashlib.sha256(b"").hexdigest())
+
+
+class TestManifest(unittest.TestCase):
+    """Tests for scan, duplicates, drift and verify diffs on a small PWA/Flutter tree."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.src = self.root / "timing"
+        self.dest = self.root / "flutter_app" / "assets" / "timing"
+        for tree in (self.src, self.dest):
+            tree.mkdir(parents=True)
+            (tree / "day1.json").write_text("{}")
+            (tree / "day2.json").write_text("[1]")
+        (self.src / "day3.json").write_text("[3]")
+        (self.src / "copy_of_day2.json").write_text("[1]")
+        (self.dest / "day1.json").write_text("{ }")
+        (self.dest / "old.json").write_text("[0]")
+        self.copy_map = [(self.src, self.dest)]
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _scan(self, previous=None):
+        paths = asset_manifest.asset_files(self.root, ("timing", "flutter_app/assets"))
+        return scan(paths, self.root, previous, jobs=2)
+
+    def test_scan_records_size_and_digest(self):
+        entries = self._scan()
+        self.assertEqual(entries["timing/day1.json"]["size"], 2)
+        self.assertEqual(entries["timing/day1.json"]["sha256"], hashlib.sha256(b"{}").hexdigest())
+        self.assertEqual(len(entries), 7)
+
+    def test_duplicates_are_reported_within_a_tree_only(self):
+        self.assertEqual(find_duplicates(self._scan()), [["timing/copy_of_day2.json", "timing/day2.json"]])
+
+    def test_drift_reports_missing_differing_and_stale_copies(self):
+        drift = find_drift(self._scan(), self.copy_map, self.root)
+        self.assertEqual(drift, {
+            "missing": ["flutter_app/assets/timing/copy_of_day2.json", "flutter_app/assets/timing/day3.json"],
+            "differs": ["flutter_app/assets/timing/day1.json"],
+            "stale": ["flutter_app/assets/timing/old.json"],
+        })
+
+    def test_verify_rehashes_only_files_whose_mtime_changed(self):
+        old = self._scan()
+        (self.src / "day3.json").write_text("[9]")
+        os.utime(self.src / "day3.json", ns=(0, old["timing/day3.json"]["mtime_ns"] + 10**9))
+        (self.dest / "old.json").unlink()
+        with mock.patch.object(asset_manifest, "hash_file", wraps=hash_file) as hashed:
+            new = self._scan(previous=old)
+        self.assertEqual(hashed.call_count, 1)
+        self.assertEqual(diff_entries(old, new), {
+            "added": [],
+            "removed": ["flutter_app/assets/timing/old.json"],
+            "modified": ["timing/day3.json"],
+        })
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Tests for concurrent segment synthesis and cue assembly (scripts/audio_timings.py)."""
+
+import asyncio
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import audio_timings
+import mp3_frames
+from tts_backends import SyntheticBackend
+from tts_cache import SegmentCache, segment_key
+
+
+class TestConcurrentCueOrder(unittest.TestCase):
+    """Cues must follow job order, not the order segments finish in."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.jobs = [
+            ("你好。", {"zh": "你好"}),
+            ("我们明天一起去图书馆吧。", {"zh": "我们明天一起去图书馆吧"}),
+            ("谢谢。", {"zh": "谢谢"}),
+            ("今天天气很好，我们去公园散步。", {"zh": "今天天气很好，我们去公园散步"}),
+            ("再见。", {"zh": "再见"}),
+            ("请问洗手间在哪里？", {"zh": "请问洗手间在哪里"}),
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _build(self, concurrency):
+        """Stitch the jobs with later segments answering faster; returns (cues, completion order)."""
+        texts = [text for text, _ in self.jobs]
+        backend = SyntheticBackend()
+        finished = []
+
+        async def synthesize(text, voice):
+            idx = texts.index(text)
+            await asyncio.sleep(0.005 * (len(texts) - idx))
+            finished.append(idx)
+            return await backend.synthesize(text, voice)
+
+        mp3 = os.path.join(self.tmpdir, f"c{concurrency}.mp3")
+        timing = os.path.join(self.tmpdir, f"c{concurrency}.json")
+        asyncio.run(audio_timings.concatenate_tts_segments(
+            self.jobs, "zh-CN-XiaoxiaoNeural", mp3, timing,
+            concurrency=concurrency, synthesize=synthesize, engine=backend.engine,
+        ))
+        with open(timing, encoding="utf-8") as f:
+            cues = json.load(f)["phrases"]
+        self.assertAlmostEqual(cues[-1]["end"], mp3_frames.probe_duration(mp3), places=3)
+        return cues, finished
+
+    def test_cues_identical_for_serial_and_concurrent_synthesis(self):
+        serial, serial_order = self._build(1)
+        concurrent, concurrent_order = self._build(8)
+        self.assertEqual(serial_order, list(range(len(self.jobs))))
+        self.assertEqual(concurrent_order, list(reversed(range(len(self.jobs)))))
+        self.assertEqual(
+            [(c["i"], c["start"], c["end"]) for c in serial],
+            [(c["i"], c["start"], c["end"]) for c in concurrent],
+        )
+        self.assertEqual([c["zh"] for c in concurrent], [meta["zh"] for _, meta in self.jobs])
+        self.assertEqual(concurrent[0]["start"], 0.0)
+        for prev, cue in zip(concurrent, concurrent[1:]):
+            self.assertEqual(cue["start"], prev["end"])
+            self.assertGreater(cue["end"], cue["start"])
+
+
+class TestSharedCacheEviction(unittest.TestCase):
+    """Lessons stitched together must not evict each other's cached segments."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_concurrent_lessons_with_tiny_cache_budget(self):
+        backend = SyntheticBackend()
+        cache = SegmentCache(os.path.join(self.tmpdir, "cache"), max_bytes=1)
+        hello = asyncio.run(backend.synthesize("你好。", "v"))
+        cache.store_bytes(segment_key("你好。", "v", backend.engine), hello)
+
+        async def synthesize(text, voice):
+            # Lesson A's uncached segment is slow, so lesson B finishes first.
+            await asyncio.sleep(0.05 if text == "我们明天一起去图书馆吧。" else 0)
+            return await backend.synthesize(text, voice)
+
+        def lesson(name, texts):
+            return audio_timings.concatenate_tts_segments(
+                [(text, {}) for text in texts], "v",
+                os.path.join(self.tmpdir, f"{name}.mp3"), os.path.join(self.tmpdir, f"{name}.json"),
+                synthesize=synthesize, engine=backend.engine, cache=cache,
+            )
+
+        async def run():
+            await asyncio.gather(lesson("a", ["你好。", "我们明天一起去图书馆吧。"]), lesson("b", ["谢谢。"]))
+
+        asyncio.run(run())
+        expected = sum(
+            mp3_frames.probe_duration(asyncio.run(backend.synthesize(text, "v")))
+            for text in ("你好。", "我们明天一起去图书馆吧。")
+        )
+        self.assertAlmostEqual(mp3_frames.probe_duration(os.path.join(self.tmpdir, "a.mp3")), expected, places=3)
+        self.assertEqual(cache.hits, 1)
+
+        audio_timings.evict_tts_cache({"cache": cache})
+        self.assertEqual(cache.evict(), 0)
+        left = [name for _, _, names in os.walk(cache.root) for name in names if name.endswith(".mp3")]
+        self.assertEqual(left, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
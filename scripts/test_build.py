@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Tests for the corpus build job graph and status accounting (scripts/build.py)."""
+
+import asyncio
+import contextlib
+import importlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import build
+from build import Job, JobResult, collect_jobs, print_report, run_text_jobs, run_tts_jobs
+from build_manifest import BuildManifest
+
+
+class TestCollectJobs(unittest.TestCase):
+    """Tests for collect_jobs."""
+
+    def test_every_day_gets_text_and_audio_jobs(self):
+        days = [day for name in build.DAY_MODULES for day in importlib.import_module(name).all_phrases]
+        jobs = collect_jobs(["days"], text_only=False)
+        self.assertEqual(len(jobs), len(days) * (len(build.TEXT_FORMATS) + len(build.AUDIO_FORMATS)))
+        self.assertEqual({j.module for j in jobs}, set(build.DAY_MODULES))
+        first = [j for j in jobs if j.args[0] == days[0]]
+        self.assertEqual(
+            [(j.kind, j.func, j.args) for j in first],
+            [("text", "generate_text_file", (days[0], "zh")),
+             ("text", "generate_text_file", (days[0], "pinyin")),
+             ("text", "generate_text_file", (days[0], "en")),
+             ("tts", "generate_audio", (days[0], "zh")),
+             ("tts", "generate_audio", (days[0], "en"))],
+        )
+        self.assertEqual(first[3].label, f"day{days[0]} zh audio")
+
+    def test_text_only_and_group_selection(self):
+        jobs = collect_jobs(["writing"], text_only=True)
+        self.assertTrue(jobs)
+        self.assertEqual(
+            {(j.kind, j.module, j.func) for j in jobs}, {("text", "writing_activities", "generate_writing_file")}
+        )
+        self.assertIn(Job("text", "writing sentence/Beginner en text", "writing_activities",
+                          "generate_writing_file", ("sentence", "Beginner", "en")), jobs)
+        self.assertEqual(collect_jobs([], text_only=False), [])
+
+
+def _fake_lessons():
+    """A generator module whose jobs are built, skipped or fail depending on their key."""
+    module = types.ModuleType("fake_lessons")
+
+    def generate_text_file(key, fmt, manifest):
+        if key == "broken":
+            raise ValueError("bad lesson")
+        if key == "new":
+            manifest.record([f"text_files/{key}_{fmt}.txt"], "fp")
+
+    async def generate_audio(key, fmt, manifest=None, **tts_options):
+        if key == "broken":
+            raise ConnectionError("tts down")
+        return key == "new"
+
+    module.generate_text_file = generate_text_file
+    module.generate_audio = generate_audio
+    return module
+
+
+class TestJobStatus(unittest.TestCase):
+    """Tests for built/skipped/failed accounting and manifest merging."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.manifest = BuildManifest(os.path.join(self.tmpdir, "build_manifest.json"))
+        patcher = mock.patch.dict(sys.modules, {"fake_lessons": _fake_lessons()})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _jobs(self, kind, func):
+        return [Job(kind, key, "fake_lessons", func, (key, "zh")) for key in ("new", "old", "broken")]
+
+    def test_text_jobs(self):
+        # Threads stand in for the process pool so the fake module is importable by workers.
+        with mock.patch.object(build, "ProcessPoolExecutor", ThreadPoolExecutor):
+            results = asyncio.run(run_text_jobs(self._jobs("text", "generate_text_file"), self.manifest, 2))
+        self.assertEqual([r.status for r in results], ["built", "skipped", "failed"])
+        self.assertIn("bad lesson", results[2].error)
+        self.assertEqual(self.manifest.entries, {"text_files/new_zh.txt": "fp"})
+        self.assertTrue(os.path.exists(self.manifest.path))
+
+    def test_tts_jobs(self):
+        results = asyncio.run(run_tts_jobs(self._jobs("tts", "generate_audio"), self.manifest, {}))
+        self.assertEqual([r.status for r in results], ["built", "skipped", "failed"])
+        self.assertIn("tts down", results[2].error)
+
+    def test_report_counts(self):
+        results = [
+            JobResult(Job("text", "a", "m", "f", ()), "built", 0.5),
+            JobResult(Job("text", "b", "m", "f", ()), "skipped", 0.1),
+            JobResult(Job("tts", "c", "m", "f", ()), "failed", 0.2, "ConnectionError()"),
+        ]
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            print_report(results, 1.0, top=5)
+        report = out.getvalue()
+        self.assertIn("text: 2 jobs, 1 built, 1 skipped, 0 failed, 0.60s job time", report)
+        self.assertIn(" tts: 1 jobs, 0 built, 0 skipped, 1 failed", report)
+        self.assertIn("✗ c: ConnectionError()", report)
+        self.assertIn("Slowest 1 jobs:\n      0.50s  a\n", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Tests for the incremental build manifest (scripts/build_manifest.py)."""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from build_manifest import BuildManifest, fingerprint
+
+
+class TestFingerprint(unittest.TestCase):
+    """Tests for fingerprint."""
+
+    def test_dict_order_does_not_matter(self):
+        self.assertEqual(fingerprint({"a": 1, "b": 2}, "zh"), fingerprint({"b": 2, "a": 1}, "zh"))
+        self.assertNotEqual(fingerprint({"a": 1}, "zh"), fingerprint({"a": 1}, "en"))
+
+
+class TestBuildManifest(unittest.TestCase):
+    """Tests for BuildManifest freshness, recording and saving."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "build_manifest.json")
+        self.output = os.path.join(self.tmpdir, "day1_zh.txt")
+        with open(self.output, "w", encoding="utf-8") as f:
+            f.write("你好\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_recorded_output_is_fresh_after_reload(self):
+        BuildManifest(self.path).record([self.output], "fp1")
+        manifest = BuildManifest(self.path)
+        self.assertTrue(manifest.is_fresh([self.output], "fp1"))
+        self.assertFalse(manifest.is_fresh([self.output], "fp2"))
+
+    def test_missing_output_is_not_fresh(self):
+        missing = os.path.join(self.tmpdir, "day1_zh.mp3")
+        manifest = BuildManifest(self.path)
+        manifest.record([self.output, missing], "fp")
+        self.assertFalse(manifest.is_fresh([self.output, missing], "fp"))
+        self.assertTrue(manifest.is_fresh([self.output], "fp"))
+
+    def test_force_is_never_fresh(self):
+        BuildManifest(self.path).record([self.output], "fp")
+        self.assertFalse(BuildManifest(self.path, force=True).is_fresh([self.output], "fp"))
+
+    def test_keys_are_normalized(self):
+        manifest = BuildManifest(self.path)
+        manifest.record([os.path.join(self.tmpdir, ".", "sub", "..", "day1_zh.txt")], "fp")
+        self.assertEqual(list(manifest.entries), [BuildManifest._key(self.output)])
+        self.assertTrue(manifest.is_fresh([self.output], "fp"))
+        self.assertEqual(BuildManifest._key(os.path.join("text_files", "day1_zh.txt")), "text_files/day1_zh.txt")
+
+    def test_without_autosave_updates_wait_for_merge(self):
+        worker = BuildManifest(self.path, autosave=False)
+        worker.record([self.output], "fp")
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(worker.updates, {BuildManifest._key(self.output): "fp"})
+
+        parent = BuildManifest(self.path)
+        parent.merge(worker.updates)
+        with open(self.path, encoding="utf-8") as f:
+            saved = json.load(f)
+        self.assertEqual(saved, {"version": 1, "outputs": {BuildManifest._key(self.output): "fp"}})
+        self.assertEqual(sorted(os.listdir(self.tmpdir)), ["build_manifest.json", "day1_zh.txt"])
+
+    def test_empty_merge_does_not_write(self):
+        BuildManifest(self.path).merge({})
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == "__main__":
+    unittest.main()
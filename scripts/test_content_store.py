@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Tests for the lazily loaded lesson content store (scripts/content_store.py)."""
+
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import content_store
+
+
+class TestLoaders(unittest.TestCase):
+    """Tests for the per-lesson loaders."""
+
+    def test_day_phrases_are_memoized(self):
+        day1 = content_store.day_phrases(1)
+        self.assertIs(day1, content_store.day_phrases(1))
+        first = next(iter(day1.values()))[0]
+        self.assertEqual(set(first), {"zh", "pinyin", "en"})
+
+    def test_every_group_has_content(self):
+        for day in range(1, 41):
+            self.assertTrue(content_store.day_phrases(day), day)
+        self.assertTrue(content_store.supplementary_phrases("education"))
+        self.assertIn("Self Introduction", content_store.readings("beginner"))
+        self.assertIn("characters", next(iter(content_store.writing_activities("character").values())))
+
+
+class TestLazyMapping(unittest.TestCase):
+    """Tests for LazyMapping."""
+
+    def test_loads_only_requested_keys(self):
+        calls = []
+
+        def loader(key):
+            calls.append(key)
+            return {"key": key}
+
+        mapping = content_store.LazyMapping([3, 1, 2], loader)
+        self.assertEqual(list(mapping), [3, 1, 2])
+        self.assertEqual(len(mapping), 3)
+        self.assertIn(1, mapping)
+        self.assertEqual(calls, [])
+        self.assertEqual(mapping[2], {"key": 2})
+        self.assertEqual(calls, [2])
+
+    def test_unknown_key_raises(self):
+        mapping = content_store.LazyMapping(["a"], lambda key: key)
+        with self.assertRaises(KeyError):
+            mapping["b"]
+        self.assertIsNone(mapping.get("b"))
+
+
+if __name__ == "__main__":
+    unittest.main()
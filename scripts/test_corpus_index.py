@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Tests for the SQLite corpus index (scripts/corpus_index.py)."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import corpus_index
+
+
+class TestStripTones(unittest.TestCase):
+    """Tests for pinyin normalization."""
+
+    def test_strips_marks_and_punctuation(self):
+        self.assertEqual(corpus_index.strip_tones("Nǐ hǎo ma?"), "ni hao ma")
+        self.assertEqual(corpus_index.strip_tones("lǜsè"), "luse")
+
+
+class TestCorpusIndex(unittest.TestCase):
+    """Queries against an index built from the shipped content."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        path = corpus_index.build_index(os.path.join(cls.tmpdir.name, "corpus.sqlite"))
+        cls.index = corpus_index.CorpusIndex(path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.index.close()
+        cls.tmpdir.cleanup()
+
+    def test_containing_hanzi(self):
+        phrases = self.index.containing_hanzi("吃饭")["phrases"]
+        self.assertTrue(phrases)
+        self.assertTrue(all("吃饭" in p["hanzi"] for p in phrases))
+
+    def test_matching_pinyin_ignores_tones(self):
+        phrases = self.index.matching_pinyin("ni hao")["phrases"]
+        self.assertIn("你好", [p["hanzi"] for p in phrases])
+
+    def test_cue_for_day_phrase(self):
+        first = self.index.lesson_phrases("day", "1")[0]
+        cue = self.index.cue_for_phrase(first["id"])
+        self.assertEqual(cue["i"], 0)
+        self.assertEqual(cue["timing_stem"], "day1")
+        self.assertLess(cue["start"], cue["end"])
+
+
+if __name__ == "__main__":
+    unittest.main()
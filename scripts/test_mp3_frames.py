@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Tests for frame-level MP3 parsing and stitching (scripts/mp3_frames.py)."""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import mp3_frames
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DAY1_ZH = os.path.join(ROOT, "audio_files", "day1_zh.mp3")
+
+
+def make_frame(rate_index=1, bitrate_index=8):
+    """One silent mono MPEG-2 Layer III frame (24 kHz / 64 kbps by default)."""
+    header = bytes([0xFF, 0xF3, (bitrate_index << 4) | (rate_index << 2), 0xC0])
+    parsed = mp3_frames.parse_header(header)
+    return header + b"\x00" * (parsed.frame_length - 4)
+
+
+class TestParseHeader(unittest.TestCase):
+    """Tests for parse_header."""
+
+    def test_edge_tts_style_header(self):
+        header = mp3_frames.parse_header(make_frame()[:4])
+        self.assertEqual(header.version, "2")
+        self.assertEqual(header.layer, 3)
+        self.assertEqual(header.sample_rate, 24000)
+        self.assertEqual(header.channels, 1)
+        self.assertEqual(header.frame_length, 192)
+        self.assertEqual(header.samples, 576)
+
+    def test_rejects_non_frames(self):
+        self.assertIsNone(mp3_frames.parse_header(b"ID3\x04"))
+        self.assertIsNone(mp3_frames.parse_header(b"\xff\xf3"))
+
+
+class TestProbeDuration(unittest.TestCase):
+    """Tests for probe_duration."""
+
+    def test_info_header_with_gapless_trim(self):
+        # Matches the decoded length pydub/ffmpeg report (and the last cue end).
+        self.assertAlmostEqual(mp3_frames.probe_duration(DAY1_ZH), 19.248)
+
+    def test_falls_back_to_frame_scan(self):
+        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as fh:
+            fh.write(make_frame() * 50)
+        try:
+            self.assertAlmostEqual(mp3_frames.probe_duration(fh.name), 1.2)
+        finally:
+            os.unlink(fh.name)
+
+
+class TestConcatSegments(unittest.TestCase):
+    """Tests for concat_segments."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _write(self, name, data):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, "wb") as fh:
+            fh.write(data)
+        return path
+
+    def test_appends_frames_and_reports_durations(self):
+        a = self._write("a.mp3", make_frame() * 10)
+        b = self._write("b.mp3", make_frame() * 25)
+        out = os.path.join(self.tmpdir, "out.mp3")
+
+        durations = mp3_frames.concat_segments([a, b], out)
+
+        self.assertEqual(durations, [0.24, 0.6])
+        self.assertEqual(os.path.getsize(out), 35 * 192)
+
+    def test_drops_id3_and_info_frames(self):
+        out = os.path.join(self.tmpdir, "out.mp3")
+        durations = mp3_frames.concat_segments([DAY1_ZH, DAY1_ZH], out)
+
+        with open(DAY1_ZH, "rb") as fh:
+            frames = list(mp3_frames.iter_frames(fh))
+        self.assertTrue(mp3_frames.is_info_frame(*frames[0]))
+        audio_frames = len(frames) - 1
+        self.assertAlmostEqual(durations[0], audio_frames * 576 / 24000)
+        with open(out, "rb") as fh:
+            head = fh.read(4)
+        self.assertIsNotNone(mp3_frames.parse_header(head))
+        audio_bytes = sum(len(frame) for _, frame in frames[1:])
+        self.assertEqual(os.path.getsize(out), 2 * audio_bytes)
+
+    def test_mismatched_sample_rates_fall_back(self):
+        a = self._write("a.mp3", make_frame(rate_index=1) * 3)
+        b = self._write("b.mp3", make_frame(rate_index=0) * 3)
+        out = os.path.join(self.tmpdir, "out.mp3")
+
+        self.assertIsNone(mp3_frames.concat_segments([a, b], out))
+        self.assertFalse(os.path.exists(out))
+        self.assertFalse(os.path.exists(out + ".part"))
+
+    def test_segment_without_frames_raises(self):
+        a = self._write("a.mp3", make_frame() * 3)
+        out = os.path.join(self.tmpdir, "out.mp3")
+
+        for empty in (b"", b"<html>rate limited</html>"):
+            with self.assertRaisesRegex(ValueError, "No MPEG audio frames in segment 1"):
+                mp3_frames.concat_segments([a, empty, a], out)
+        self.assertFalse(os.path.exists(out))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Tests for the incremental Flutter asset sync (scripts/sync_flutter_assets.py)."""
+
+import contextlib
+import errno
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import sync_flutter_assets
+from sync_flutter_assets import load_manifest, sync
+
+
+class SyncTestCase(unittest.TestCase):
+    """Temporary source tree with a glob mapping and a directory mapping."""
+
+    def setUp(self):
+        self.root = Path(tempfile.mkdtemp())
+        self.src = self.root / "audio_files"
+        self.dest = self.root / "assets" / "audio"
+        (self.src / "reading").mkdir(parents=True)
+        (self.src / "day1.mp3").write_bytes(b"one")
+        (self.src / "day2.mp3").write_bytes(b"two")
+        (self.src / "reading" / "r1.mp3").write_bytes(b"reading")
+        self.copy_map = [
+            (self.src / "day*.mp3", self.dest),
+            (self.src / "reading", self.dest / "reading"),
+        ]
+        self.manifest = self.root / ".asset_sync.json"
+
+    def tearDown(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def _sync(self, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            counts = sync(self.copy_map, self.manifest, self.root, **kwargs)
+        return {k: counts[k] for k in ("copied", "unchanged", "deleted")}
+
+
+class TestSync(SyncTestCase):
+    """Tests for sync copy, skip and delete decisions."""
+
+    def test_first_sync_copies_and_records_manifest(self):
+        self.assertEqual(self._sync(), {"copied": 3, "unchanged": 0, "deleted": 0})
+        self.assertEqual((self.dest / "reading" / "r1.mp3").read_bytes(), b"reading")
+        entry = load_manifest(self.manifest)["assets/audio/day1.mp3"]
+        self.assertEqual(entry["src"], "audio_files/day1.mp3")
+        self.assertEqual(entry["size"], 3)
+
+    def test_second_sync_touches_nothing(self):
+        self._sync()
+        mtimes = {p: p.stat().st_mtime_ns for p in self.dest.rglob("*")}
+        manifest_mtime = self.manifest.stat().st_mtime_ns
+        self.assertEqual(self._sync(), {"copied": 0, "unchanged": 3, "deleted": 0})
+        self.assertEqual(mtimes, {p: p.stat().st_mtime_ns for p in self.dest.rglob("*")})
+        self.assertEqual(manifest_mtime, self.manifest.stat().st_mtime_ns)
+
+    def test_touched_source_with_same_content_is_not_copied(self):
+        self._sync()
+        dest_mtime = (self.dest / "day1.mp3").stat().st_mtime_ns
+        os.utime(self.src / "day1.mp3", ns=(0, dest_mtime + 10**9))
+        self.assertEqual(self._sync()["copied"], 0)
+        self.assertEqual((self.dest / "day1.mp3").stat().st_mtime_ns, dest_mtime)
+
+    def test_changed_source_is_copied(self):
+        self._sync()
+        (self.src / "day2.mp3").write_bytes(b"TWO")
+        os.utime(self.src / "day2.mp3", ns=(0, 12345))
+        self.assertEqual(self._sync(), {"copied": 1, "unchanged": 2, "deleted": 0})
+        self.assertEqual((self.dest / "day2.mp3").read_bytes(), b"TWO")
+
+    def test_stale_files_are_deleted_within_mapped_scope_only(self):
+        self._sync()
+        (self.dest / "notes.txt").write_text("not managed by day*.mp3")
+        (self.src / "day2.mp3").unlink()
+        shutil.rmtree(self.src / "reading")
+        (self.src / "reading").mkdir()
+        self.assertEqual(self._sync()["deleted"], 2)
+        self.assertFalse((self.dest / "day2.mp3").exists())
+        self.assertFalse((self.dest / "reading").exists())
+        self.assertTrue((self.dest / "notes.txt").exists())
+        self.assertNotIn("assets/audio/day2.mp3", load_manifest(self.manifest))
+
+    def test_dry_run_writes_nothing(self):
+        self.assertEqual(self._sync(dry_run=True)["copied"], 3)
+        self.assertFalse(self.dest.exists())
+        self.assertFalse(self.manifest.exists())
+
+
+class TestLinkSync(SyncTestCase):
+    """Tests for --link strategies (reflink, hardlink, copy fallback)."""
+
+    def _strategies(self, **kwargs):
+        with contextlib.redirect_stdout(io.StringIO()):
+            counts = sync(self.copy_map, self.manifest, self.root, **kwargs)
+        return {k: counts[k] for k in ("reflink", "hardlink", "copy")}
+
+    def test_link_shares_the_source_file(self):
+        counts = self._strategies(link=True, jobs=2)
+        self.assertEqual(counts["copy"], 0)
+        self.assertEqual(counts["reflink"] + counts["hardlink"], 3)
+        if counts["hardlink"]:
+            self.assertTrue(os.path.samefile(self.src / "day1.mp3", self.dest / "day1.mp3"))
+        self.assertEqual(self._sync(link=True), {"copied": 0, "unchanged": 3, "deleted": 0})
+
+    def test_link_replaces_earlier_copies_once(self):
+        self._sync()
+        self.assertEqual(self._sync(link=True)["copied"], 3)
+        self.assertEqual(self._sync(link=True)["copied"], 0)
+
+    def test_replaced_source_breaks_and_refreshes_hardlink(self):
+        with mock.patch.object(sync_flutter_assets, "_reflink", side_effect=OSError(errno.EOPNOTSUPP, "unsupported")):
+            self.assertEqual(self._strategies(link=True)["hardlink"], 3)
+            (self.src / "day1.mp3").unlink()
+            (self.src / "day1.mp3").write_bytes(b"uno!")
+            self.assertEqual(self._sync(link=True)["copied"], 1)
+        self.assertEqual((self.dest / "day1.mp3").read_bytes(), b"uno!")
+
+    def test_falls_back_to_copy_when_links_are_unsupported(self):
+        unsupported = OSError(errno.EXDEV, "cross-device link")
+        with mock.patch.object(sync_flutter_assets, "_reflink", side_effect=unsupported), \
+                mock.patch.object(sync_flutter_assets, "_hardlink", side_effect=unsupported):
+            self.assertEqual(self._strategies(link=True), {"reflink": 0, "hardlink": 0, "copy": 3})
+            self.assertEqual(self._sync(link=True)["copied"], 0)
+        self.assertFalse(os.path.samefile(self.src / "day1.mp3", self.dest / "day1.mp3"))
+        self.assertEqual(sorted(p.name for p in self.dest.iterdir()), ["day1.mp3", "day2.mp3", "reading"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""Tests for TTS backends (scripts/tts_backends.py) and the offline audio pipeline."""
+
+import argparse
+import asyncio
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import audio_timings
+import mp3_frames
+from tts_backends import EdgeTTSBackend, SyntheticBackend, get_backend
+from tts_cache import SegmentCache
+from tts_resilience import FlakySynthesizer, RetryPolicy, TransientTTSError
+
+
+def _frames(data):
+    return list(mp3_frames.iter_frames(io.BytesIO(data)))
+
+
+class TestSyntheticBackend(unittest.TestCase):
+    """Tests for the offline synthetic backend."""
+
+    def setUp(self):
+        self.backend = SyntheticBackend(chunk_frames=4)
+
+    def test_output_is_edge_format_mp3(self):
+        frames = _frames(asyncio.run(self.backend.synthesize("你好。", "zh-CN-XiaoxiaoNeural")))
+        self.assertEqual(len(frames), SyntheticBackend.frame_count("你好。"))
+        header = frames[0][0]
+        self.assertEqual((header.version, header.layer, header.sample_rate, header.channels), ("2", 3, 24000, 1))
+
+    def test_duration_grows_with_text_and_is_deterministic(self):
+        short = asyncio.run(self.backend.synthesize("你好。", "v"))
+        long = asyncio.run(self.backend.synthesize("我们明天一起去图书馆吧。", "v"))
+        self.assertGreater(len(long), len(short))
+        self.assertEqual(short, asyncio.run(self.backend.synthesize("你好。", "other-voice")))
+
+    def test_stream_yields_chunks(self):
+        async def collect():
+            return [chunk async for chunk in self.backend.stream("Good morning, teacher.", "v")]
+
+        chunks = asyncio.run(collect())
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(b"".join(chunks), asyncio.run(self.backend.synthesize("Good morning, teacher.", "v")))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            get_backend("espeak")
+        self.assertEqual(get_backend("synthetic").engine, SyntheticBackend.engine)
+
+
+class TestEdgeTTSErrors(unittest.TestCase):
+    """EdgeTTSBackend reports service hiccups as retryable and leaves other errors alone."""
+
+    def setUp(self):
+        edge_tts = types.ModuleType("edge_tts")
+        edge_tts.exceptions = types.SimpleNamespace(NoAudioReceived=type("NoAudioReceived", (Exception,), {}))
+
+        class Communicate:
+            def __init__(self, text, voice):
+                if not voice.endswith("Neural"):
+                    raise ValueError(f"Invalid voice {voice!r}")
+
+            async def stream(self):
+                raise edge_tts.exceptions.NoAudioReceived("No audio was received.")
+                yield  # pragma: no cover
+
+        edge_tts.Communicate = Communicate
+        patcher = mock.patch.dict(sys.modules, {"edge_tts": edge_tts, "aiohttp": None})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_no_audio_is_transient(self):
+        with self.assertRaises(TransientTTSError):
+            asyncio.run(EdgeTTSBackend().synthesize("你好。", "zh-CN-XiaoxiaoNeural"))
+
+    def test_bad_voice_is_not_retried(self):
+        calls = []
+        backend = EdgeTTSBackend()
+
+        async def synthesize(text, voice):
+            calls.append(voice)
+            return await backend.synthesize(text, voice)
+
+        with self.assertRaises(ValueError):
+            asyncio.run(audio_timings.synthesize_segments(
+                ["你好。"], "zh-CN-Xiaoxiao", synthesize=synthesize, engine=backend.engine,
+                retry=RetryPolicy(retries=3, base_delay=0.001),
+            ))
+        self.assertEqual(calls, ["zh-CN-Xiaoxiao"])
+
+
+class TestOfflinePipeline(unittest.TestCase):
+    """concatenate_tts_segments / synthesize_segments without the network."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.jobs = [
+            ("你好。", {"section": "greetings"}),
+            ("谢谢。", {"section": "greetings"}),
+            ("我们明天一起去图书馆吧。", {"section": "plans"}),
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def test_cues_match_stitched_audio(self):
+        mp3 = os.path.join(self.tmpdir, "out.mp3")
+        timing = os.path.join(self.tmpdir, "out.json")
+        asyncio.run(audio_timings.concatenate_tts_segments(
+            self.jobs, "zh-CN-XiaoxiaoNeural", mp3, timing, backend=SyntheticBackend()
+        ))
+        with open(timing, encoding="utf-8") as f:
+            cues = json.load(f)["phrases"]
+        self.assertEqual([c["i"] for c in cues], [0, 1, 2])
+        self.assertEqual(cues[0]["start"], 0.0)
+        self.assertAlmostEqual(cues[-1]["end"], mp3_frames.probe_duration(mp3), places=3)
+        self.assertEqual(sorted(os.listdir(self.tmpdir)), ["out.json", "out.mp3"])
+
+    def test_segments_stay_in_memory_until_spill_threshold(self):
+        spill = os.path.join(self.tmpdir, "spill")
+        texts = [text for text, _ in self.jobs]
+        first = len(asyncio.run(SyntheticBackend().synthesize(texts[0], "v")))
+        segments = asyncio.run(audio_timings.synthesize_segments(
+            texts, "v", spill, backend=SyntheticBackend(), concurrency=1, spill_bytes=first
+        ))
+        self.assertIsInstance(segments[0], bytes)
+        self.assertEqual(segments[1:], [os.path.join(spill, "seg_0001.mp3"), os.path.join(spill, "seg_0002.mp3")])
+        self.assertEqual(
+            mp3_frames.probe_duration(segments[2]),
+            mp3_frames.probe_duration(asyncio.run(SyntheticBackend().synthesize(texts[2], "v"))),
+        )
+
+    def test_rerun_resumes_from_cache_after_a_failed_segment(self):
+        cache = SegmentCache(os.path.join(self.tmpdir, "cache"))
+        texts = [text for text, _ in self.jobs]
+
+        async def run(synthesize):
+            return await audio_timings.synthesize_segments(
+                texts, "v", synthesize=synthesize, engine="fake",
+                cache=cache, retry=RetryPolicy(retries=1, base_delay=0.001),
+            )
+
+        flaky = FlakySynthesizer()
+
+        async def broken(text, voice):
+            if text != "你好。":
+                raise TransientTTSError("service down")
+            return await flaky(text, voice)
+
+        with self.assertRaises(TransientTTSError):
+            asyncio.run(run(broken))
+        self.assertEqual(flaky.calls, 1)
+        healthy = FlakySynthesizer()
+        asyncio.run(run(healthy))
+        self.assertEqual(sorted(healthy.attempts), ["我们明天一起去图书馆吧。", "谢谢。"])
+
+
+class TestBackendOptions(unittest.TestCase):
+    """--tts-backend resolution and --text-only runs without edge-tts installed."""
+
+    def _options(self, *argv):
+        parser = argparse.ArgumentParser()
+        parser.add_argument("--text-only", action="store_true")
+        audio_timings.add_tts_arguments(parser)
+        return audio_timings.tts_options_from_args(parser.parse_args(["--no-cache", *argv]))
+
+    def test_text_only_does_not_need_edge_tts(self):
+        with mock.patch.dict(sys.modules, {"edge_tts": None}):
+            options = self._options("--text-only")
+            self.assertEqual(options["backend"], "edge")
+            with self.assertRaisesRegex(RuntimeError, "--tts-backend synthetic"):
+                audio_timings._resolve_synthesis(None, options["backend"], None)
+
+    def test_backend_by_name(self):
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir, ignore_errors=True)
+        mp3, timing = os.path.join(tmpdir, "out.mp3"), os.path.join(tmpdir, "out.json")
+        options = self._options("--tts-backend", "synthetic", "--retries", "0")
+        with mock.patch.dict(sys.modules, {"edge_tts": None}):
+            asyncio.run(audio_timings.concatenate_tts_segments([("你好。", {})], "v", mp3, timing, **options))
+        self.assertEqual(
+            mp3_frames.probe_duration(mp3),
+            mp3_frames.probe_duration(asyncio.run(SyntheticBackend().synthesize("你好。", "v"))),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Tests for the content-addressed TTS segment cache (scripts/tts_cache.py)."""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from tts_cache import SegmentCache, segment_key
+
+
+class TestSegmentKey(unittest.TestCase):
+    """Tests for segment_key."""
+
+    def test_key_depends_on_text_voice_and_engine(self):
+        base = segment_key("你好。", "zh-CN-XiaoxiaoNeural", "edge-tts/7.2.3")
+        self.assertEqual(base, segment_key("你好。", "zh-CN-XiaoxiaoNeural", "edge-tts/7.2.3"))
+        self.assertNotEqual(base, segment_key("您好。", "zh-CN-XiaoxiaoNeural", "edge-tts/7.2.3"))
+        self.assertNotEqual(base, segment_key("你好。", "zh-CN-YunxiNeural", "edge-tts/7.2.3"))
+        self.assertNotEqual(base, segment_key("你好。", "zh-CN-XiaoxiaoNeural", "edge-tts/7.2.4"))
+
+
+class TestSegmentCache(unittest.TestCase):
+    """Tests for SegmentCache lookup, store and eviction."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.cache = SegmentCache(os.path.join(self.tmpdir, "cache"), max_bytes=250)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _segment(self, name, size=100):
+        path = os.path.join(self.tmpdir, name)
+        with open(path, "wb") as fh:
+            fh.write(b"x" * size)
+        return path
+
+    def test_store_then_lookup(self):
+        self.assertIsNone(self.cache.lookup("ab" * 32))
+        stored = self.cache.store("ab" * 32, self._segment("seg.mp3"))
+        self.assertEqual(self.cache.lookup("ab" * 32), stored)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_store_bytes(self):
+        stored = self.cache.store_bytes("cd" * 32, b"frames")
+        self.assertEqual(self.cache.lookup("cd" * 32), stored)
+        with open(stored, "rb") as fh:
+            self.assertEqual(fh.read(), b"frames")
+        self.assertEqual(os.listdir(os.path.dirname(stored)), [os.path.basename(stored)])
+
+    def test_evict_drops_least_recently_used(self):
+        paths = {}
+        for i, key in enumerate(["aa" * 32, "bb" * 32, "cc" * 32]):
+            paths[key] = self.cache.store(key, self._segment(f"{i}.mp3"))
+            os.utime(paths[key], (1000 + i, 1000 + i))
+        # Touching the oldest entry makes it the most recently used.
+        self.cache.lookup("aa" * 32)
+
+        self.assertEqual(self.cache.evict(), 1)
+        self.assertFalse(os.path.exists(paths["bb" * 32]))
+        self.assertTrue(os.path.exists(paths["aa" * 32]))
+        self.assertTrue(os.path.exists(paths["cc" * 32]))
+
+
+if __name__ == "__main__":
+    unittest.main()
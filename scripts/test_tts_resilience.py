@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Tests for TTS retries, backoff and rate limiting (scripts/tts_resilience.py)."""
+
+import asyncio
+import os
+import random
+import sys
+import time
+import unittest
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from tts_resilience import FlakySynthesizer, RetryPolicy, TokenBucket, TransientTTSError, with_retries
+
+FAST = RetryPolicy(retries=3, base_delay=0.001, max_delay=0.002)
+
+
+class TestRetryPolicy(unittest.TestCase):
+    """Tests for RetryPolicy.delay."""
+
+    def test_delay_is_jittered_below_an_exponential_cap(self):
+        policy = RetryPolicy(base_delay=0.5, max_delay=3.0)
+        rng = random.Random(1)
+        for retry, cap in enumerate([0.5, 1.0, 2.0, 3.0, 3.0]):
+            delays = [policy.delay(retry, rng) for _ in range(200)]
+            self.assertTrue(all(0 <= d <= cap for d in delays))
+            self.assertGreater(max(delays), cap * 0.8)
+
+
+class TestWithRetries(unittest.TestCase):
+    """Tests for with_retries around the failure-injecting fake."""
+
+    def test_transient_failures_are_retried(self):
+        fake = FlakySynthesizer(fail_first=2)
+        synthesize = with_retries(fake, FAST, on_retry=None)
+        data = asyncio.run(synthesize("你好。", "zh-CN-XiaoxiaoNeural"))
+        self.assertEqual(fake.attempts["你好。"], 3)
+        self.assertEqual(data, "你好。".encode("utf-8"))
+
+    def test_gives_up_after_retries(self):
+        fake = FlakySynthesizer(fail_first=10)
+        with self.assertRaises(TransientTTSError):
+            asyncio.run(with_retries(fake, FAST, on_retry=None)("hi.", "en-US-JennyNeural"))
+        self.assertEqual(fake.calls, FAST.retries + 1)
+
+    def test_errors_outside_retry_on_are_not_retried(self):
+        fake = FlakySynthesizer(fail_first=1)
+        policy = FAST._replace(retry_on=(TimeoutError,))
+        with self.assertRaises(TransientTTSError):
+            asyncio.run(with_retries(fake, policy, on_retry=None)("hi.", "v"))
+        self.assertEqual(fake.calls, 1)
+
+    def test_permanent_errors_fail_on_first_attempt(self):
+        calls = []
+
+        async def bad_voice(text, voice):
+            calls.append(text)
+            raise ValueError(f"Invalid voice {voice!r}")
+
+        with self.assertRaises(ValueError):
+            asyncio.run(with_retries(bad_voice, RetryPolicy(base_delay=0.001), on_retry=None)("hi.", "nope"))
+        self.assertEqual(calls, ["hi."])
+
+    def test_timeouts_are_retried_by_default(self):
+        calls = []
+
+        async def slow_once(text, voice):
+            calls.append(text)
+            if len(calls) == 1:
+                raise asyncio.TimeoutError()
+            return b"ok"
+
+        self.assertEqual(asyncio.run(with_retries(slow_once, FAST, on_retry=None)("hi.", "v")), b"ok")
+        self.assertEqual(len(calls), 2)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Tests for the shared rate limiter."""
+
+    def test_bursts_then_paces_at_rate(self):
+        async def run():
+            bucket = TokenBucket(rate=100, burst=5)
+            t0 = time.monotonic()
+            await asyncio.gather(*(bucket.acquire() for _ in range(15)))
+            return time.monotonic() - t0
+
+        # 5 tokens immediately, then 10 more at 100/s.
+        elapsed = asyncio.run(run())
+        self.assertGreaterEqual(elapsed, 0.09)
+        self.assertLess(elapsed, 1.0)
+
+    def test_rate_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""Tests for the timing manifest checker (scripts/verify_timings.py)."""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import verify_timings
+from verify_timings import audio_for_timing, check_manifest
+
+
+class TestCheckManifest(unittest.TestCase):
+    """Tests for check_manifest and audio_for_timing."""
+
+    def setUp(self):
+        self.tmpdir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _manifest(self, cues):
+        path = self.tmpdir / "day1_zh.json"
+        path.write_text(json.dumps({"version": 1, "phrases": cues}), encoding="utf-8")
+        return path
+
+    def test_audio_path_mirrors_timing_path(self):
+        timing = verify_timings.TIMING_DIR / "reading" / "x_zh.json"
+        self.assertEqual(audio_for_timing(timing), verify_timings.AUDIO_DIR / "reading" / "x_zh.mp3")
+
+    def test_manifest_outside_timing_dir_is_reported(self):
+        path = self._manifest([{"i": 0, "start": 0.0, "end": 1.0}])
+        self.assertIsNone(audio_for_timing(path))
+        self.assertEqual(check_manifest(path, 0.1), ["timing file outside timing/ (no matching audio_files/ path)"])
+
+    def test_gaps_and_indexes_are_reported(self):
+        path = self._manifest([{"i": 0, "start": 0.0, "end": 1.0}, {"i": 2, "start": 1.5, "end": 2.0}])
+        problems = check_manifest(path, 0.1)
+        self.assertIn("cue 1: i=2", problems)
+        self.assertIn("cue 1: starts at 1.5, previous ended at 1.0", problems)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+Pluggable TTS backends for the audio/timing pipeline.
+
+A backend turns (text, voice) into MP3 bytes, streamed in chunks, and names
+its engine and version for segment cache keys and build fingerprints:
+
+    edge       Microsoft Edge online TTS via the edge-tts package (imported lazily)
+    synthetic  Offline and deterministic: silent MPEG-2 Layer III frames in the
+               edge-tts output format, lasting roughly as long as the text
+               would take to read. For CI and benchmarks, not for lessons.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator
+
+from tts_resilience import TransientTTSError
+
+DEFAULT_BACKEND = "edge"
+SYNTHETIC_VERSION = 1
+
+# MPEG-2 Layer III, 64 kbps, 24 kHz, mono, no CRC: the format edge-tts returns.
+# All-zero side info and main data decode as silence.
+_SILENT_HEADER = bytes([0xFF, 0xF3, 0x84, 0xC0])
+_SILENT_FRAME = _SILENT_HEADER + bytes(192 - len(_SILENT_HEADER))
+_FRAME_SECONDS = 576 / 24000
+
+
+class TTSBackend:
+    """
+    Base class: subclasses set `engine` and implement `stream`. Errors in
+    `transient_errors` are re-raised as TransientTTSError so they are retried.
+    """
+
+    engine = "unknown"
+    transient_errors: tuple[type[BaseException], ...] = ()
+
+    def stream(self, text: str, voice: str) -> AsyncIterator[bytes]:
+        """Yield the MP3 encoding of `text` in chunks."""
+        raise NotImplementedError
+
+    async def synthesize(self, text: str, voice: str) -> bytes:
+        """The whole MP3 in memory (the synthesize(text, voice) callable the pipeline uses)."""
+        buf = bytearray()
+        async for chunk in self.stream(text, voice):
+            buf += chunk
+        return bytes(buf)
+
+    async def save(self, text: str, voice: str, path: str) -> None:
+        """Stream the MP3 to `path`."""
+        with open(path, "wb") as fh:
+            async for chunk in self.stream(text, voice):
+                fh.write(chunk)
+
+
+class EdgeTTSBackend(TTSBackend):
+    """Microsoft Edge online text-to-speech."""
+
+    def __init__(self):
+        try:
+            import edge_tts
+        except ImportError as e:
+            raise RuntimeError(
+                "edge-tts is required for the edge TTS backend. pip install edge-tts, "
+                "or pass --tts-backend synthetic to run offline."
+            ) from e
+        self._edge_tts = edge_tts
+        # Part of every segment cache key, so upgrading edge-tts invalidates old audio.
+        self.engine = f"edge-tts/{getattr(edge_tts, '__version__', 'unknown')}"
+        # Service hiccups: no audio in the reply, a dropped or garbled websocket
+        # session, and aiohttp client errors (resets, 429/5xx responses).
+        exceptions = getattr(edge_tts, "exceptions", None)
+        names = ("NoAudioReceived", "UnexpectedResponse", "UnknownResponse", "WebSocketError")
+        self.transient_errors = tuple(getattr(exceptions, name) for name in names if hasattr(exceptions, name))
+        try:
+            import aiohttp
+        except ImportError:
+            pass
+        else:
+            self.transient_errors += (aiohttp.ClientError,)
+
+    async def stream(self, text: str, voice: str) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._edge_tts.Communicate(text, voice).stream():
+                if chunk["type"] == "audio":
+                    yield chunk["data"]
+        except self.transient_errors as e:
+            raise TransientTTSError(f"edge-tts: {e!r}") from e
+
+
+def _spoken_seconds(text: str) -> float:
+    """Rough reading time: ~4.5 CJK characters or ~15 Latin characters per second."""
+    cjk = sum(1 for ch in text if ord(ch) >= 0x2E80 and ch.isalpha())
+    other = sum(1 for ch in text if ch.isalnum()) - cjk
+    return 0.25 + cjk * 0.22 + other * 0.065
+
+
+class SyntheticBackend(TTSBackend):
+    """Deterministic offline backend emitting silence sized to the text; `latency` simulates a round trip."""
+
+    engine = f"synthetic/{SYNTHETIC_VERSION}"
+
+    def __init__(self, latency: float = 0.0, chunk_frames: int = 32):
+        self.latency = latency
+        self.chunk_frames = chunk_frames
+
+    @staticmethod
+    def frame_count(text: str) -> int:
+        return max(1, round(_spoken_seconds(text) / _FRAME_SECONDS))
+
+    async def stream(self, text: str, voice: str) -> AsyncIterator[bytes]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        remaining = self.frame_count(text)
+        while remaining:
+            n = min(remaining, self.chunk_frames)
+            yield _SILENT_FRAME * n
+            remaining -= n
+
+
+BACKENDS: dict[str, type[TTSBackend]] = {
+    "edge": EdgeTTSBackend,
+    "synthetic": SyntheticBackend,
+}
+
+
+def get_backend(name: str = DEFAULT_BACKEND) -> TTSBackend:
+    try:
+        backend_class = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"unknown TTS backend {name!r} (choose from {', '.join(BACKENDS)})") from None
+    return backend_class()
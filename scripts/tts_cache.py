@@ -0,0 +1,110 @@
+"""
+Content-addressed on-disk cache for synthesized TTS segments.
+
+Segments are keyed by sha256(text, voice, engine) so a rebuild only
+re-synthesizes phrases whose wording, voice or TTS engine version changed.
+The cache is bounded by total size; hits refresh the file mtime and eviction
+drops the least recently used segments first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Callable
+
+DEFAULT_CACHE_DIR = ".tts_cache"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def segment_key(text: str, voice: str, engine: str) -> str:
+    payload = json.dumps([text, voice, engine], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SegmentCache:
+    """Directory of `<key[:2]>/<key>.mp3` files with size-bounded LRU eviction."""
+
+    def __init__(self, root: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], f"{key}.mp3")
+
+    def lookup(self, key: str) -> str | None:
+        """Return the cached segment path (marking it recently used) or None."""
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return path
+
+    def store(self, key: str, src_path: str) -> str:
+        """Copy a freshly synthesized segment into the cache; returns its cache path."""
+        return self._install(key, lambda tmp: shutil.copyfile(src_path, tmp))
+
+    def store_bytes(self, key: str, data: bytes) -> str:
+        """Write an in-memory segment into the cache; returns its cache path."""
+
+        def write(tmp: str) -> None:
+            with open(tmp, "wb") as fh:
+                fh.write(data)
+
+        return self._install(key, write)
+
+    def _install(self, key: str, write: Callable[[str], None]) -> str:
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+        os.close(fd)
+        try:
+            write(tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+            raise
+        return path
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        entries = []
+        if not os.path.isdir(self.root):
+            return entries
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if not name.endswith(".mp3"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        return entries
+
+    def evict(self) -> int:
+        """Delete least recently used segments until under max_bytes; returns count removed."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
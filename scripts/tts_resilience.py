@@ -0,0 +1,140 @@
+"""
+Retries, backoff and rate limiting for TTS synthesis calls.
+
+`with_retries` wraps any `synthesize(text, voice) -> bytes` coroutine so a
+transient failure is retried with exponential backoff and full jitter instead
+of aborting the lesson; every attempt first takes a token from a shared
+`TokenBucket`, which caps request rate across all lessons in flight. Only
+transient errors are retried (network failures and timeouts; backends report
+their own service hiccups as `TransientTTSError`), so a bad voice name or a
+bug fails on the first attempt. `FlakySynthesizer` is a local stand-in for
+edge-tts that injects failures.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import sys
+import time
+from collections import Counter
+from typing import Awaitable, Callable, NamedTuple
+
+SynthesizeFn = Callable[[str, str], Awaitable[bytes]]
+
+DEFAULT_RETRIES = 4
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_MAX_DELAY = 30.0
+# TransientTTSError is a ConnectionError, so it is covered by OSError.
+TRANSIENT_ERRORS: tuple[type[BaseException], ...] = (OSError, asyncio.TimeoutError)
+
+
+class RetryPolicy(NamedTuple):
+    """Up to `retries` extra attempts; delays drawn from [0, min(max_delay, base_delay * 2**n)]."""
+
+    retries: int = DEFAULT_RETRIES
+    base_delay: float = DEFAULT_BASE_DELAY
+    max_delay: float = DEFAULT_MAX_DELAY
+    retry_on: tuple[type[BaseException], ...] = TRANSIENT_ERRORS
+
+    def delay(self, retry: int, rng: random.Random | None = None) -> float:
+        """Backoff before retry number `retry` (0-based), with full jitter."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** retry))
+        return (rng or random).uniform(0, ceiling)
+
+
+class TokenBucket:
+    """
+    Async rate limiter: `rate` tokens per second, bursts up to `burst`.
+    Waiters are served in arrival order. Create one per event loop.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1.0, burst if burst is not None else rate)
+        self.tokens = self.capacity
+        self.clock = clock
+        self.updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+
+def _log_retry(text: str, retry: int, policy: RetryPolicy, exc: BaseException, delay: float) -> None:
+    print(
+        f"  TTS retry {retry + 1}/{policy.retries} in {delay:.1f}s after {exc!r}: {text[:40]!r}",
+        file=sys.stderr,
+    )
+
+
+def with_retries(
+    synthesize: SynthesizeFn,
+    policy: RetryPolicy = RetryPolicy(),
+    rate_limiter: TokenBucket | None = None,
+    *,
+    rng: random.Random | None = None,
+    on_retry: Callable[[str, int, RetryPolicy, BaseException, float], None] | None = _log_retry,
+) -> SynthesizeFn:
+    """Wrap `synthesize` with rate limiting and retries; the last error propagates."""
+
+    async def _synthesize(text: str, voice: str) -> bytes:
+        for retry in range(policy.retries + 1):
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
+            try:
+                return await synthesize(text, voice)
+            except policy.retry_on as exc:
+                if retry == policy.retries:
+                    raise
+                delay = policy.delay(retry, rng)
+                if on_retry is not None:
+                    on_retry(text, retry, policy, exc, delay)
+                await asyncio.sleep(delay)
+
+    return _synthesize
+
+
+class TransientTTSError(ConnectionError):
+    """A retryable synthesis failure (raised by backends and FlakySynthesizer)."""
+
+
+class FlakySynthesizer:
+    """
+    Offline stand-in for edge-tts: returns the UTF-8 text as the "audio" after
+    `latency` seconds, failing the first `fail_first` attempts for each text
+    and then each attempt with probability `failure_rate`.
+    """
+
+    def __init__(self, fail_first: int = 0, failure_rate: float = 0.0, latency: float = 0.0, seed: int = 0):
+        self.fail_first = fail_first
+        self.failure_rate = failure_rate
+        self.latency = latency
+        self.rng = random.Random(seed)
+        self.attempts: Counter[str] = Counter()
+        self.failures = 0
+
+    @property
+    def calls(self) -> int:
+        return sum(self.attempts.values())
+
+    async def __call__(self, text: str, voice: str) -> bytes:
+        self.attempts[text] += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.attempts[text] <= self.fail_first or self.rng.random() < self.failure_rate:
+            self.failures += 1
+            raise TransientTTSError(f"injected failure for {text!r}")
+        return text.encode("utf-8")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Check timing/*.json cue manifests against their stitched MP3s.
+
+Every manifest must have contiguous cues (i = 0..n-1, each start equal to the
+previous end) and its last cue must end within --tolerance seconds of the MP3
+duration, probed from frame headers without decoding.
+
+    python scripts/verify_timings.py
+    python scripts/verify_timings.py timing/day3_zh.json --tolerance 0.05
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import mp3_frames
+
+ROOT = Path(__file__).resolve().parent.parent
+TIMING_DIR = ROOT / "timing"
+AUDIO_DIR = ROOT / "audio_files"
+
+
+def audio_for_timing(timing_path: Path) -> Path | None:
+    """timing/reading/x_zh.json -> audio_files/reading/x_zh.mp3; None outside timing/."""
+    try:
+        rel = timing_path.resolve().relative_to(TIMING_DIR)
+    except ValueError:
+        return None
+    return AUDIO_DIR / rel.with_suffix(".mp3")
+
+
+def _display(path: Path) -> Path:
+    try:
+        return path.resolve().relative_to(ROOT)
+    except ValueError:
+        return path
+
+
+def check_manifest(timing_path: Path, tolerance: float) -> list[str]:
+    problems: list[str] = []
+    with open(timing_path, encoding="utf-8") as f:
+        cues = json.load(f).get("phrases", [])
+    if not cues:
+        return ["no cues"]
+
+    prev_end = 0.0
+    for idx, cue in enumerate(cues):
+        if cue.get("i") != idx:
+            problems.append(f"cue {idx}: i={cue.get('i')}")
+        start, end = cue.get("start"), cue.get("end")
+        if start is None or end is None or end < start:
+            problems.append(f"cue {idx}: bad span {start}..{end}")
+            continue
+        if abs(start - prev_end) > 0.001:
+            problems.append(f"cue {idx}: starts at {start}, previous ended at {prev_end}")
+        prev_end = end
+
+    mp3_path = audio_for_timing(timing_path)
+    if mp3_path is None:
+        problems.append("timing file outside timing/ (no matching audio_files/ path)")
+        return problems
+    if not mp3_path.is_file():
+        problems.append(f"missing audio {mp3_path.relative_to(ROOT)}")
+        return problems
+    try:
+        duration = mp3_frames.probe_duration(str(mp3_path))
+    except ValueError as e:
+        problems.append(str(e))
+        return problems
+    if abs(duration - prev_end) > tolerance:
+        problems.append(f"last cue ends at {prev_end:.3f}s but audio is {duration:.3f}s")
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Verify timing manifests against MP3 durations")
+    parser.add_argument("paths", nargs="*", type=Path, help="Manifests to check (default: all of timing/)")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Allowed end drift in seconds")
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(TIMING_DIR.rglob("*.json"))
+    failures = 0
+    for path in paths:
+        problems = check_manifest(path, args.tolerance)
+        if problems:
+            failures += 1
+            print(f"✗ {_display(path)}")
+            for problem in problems:
+                print(f"    {problem}")
+    print(f"Checked {len(paths)} manifests, {failures} with problems.")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,430 @@
-import gzip
+import argparse
+import bisect
+import datetime
+import email.utils
 import os
-import socketserver
+import re
+import selectors
+import signal
+import socket
+import stat
+import threading
+import time
+import uuid
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 
 import http.server
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DEFAULT_PORT = 8000
+DEFAULT_WORKERS = 32
+DEFAULT_IDLE_TIMEOUT = 15.0
+DEFAULT_MAX_REQUESTS_PER_CONNECTION = 100
+COMPRESSED_CACHE_BYTES = 32 * 1024 * 1024
+GZIP_LEVEL = 9
+# Compressible files above this size are gzip-streamed with chunked encoding
+# instead of being compressed whole (and cached) before the first byte is sent.
+STREAM_GZIP_THRESHOLD = 1024 * 1024
+STREAM_CHUNK_BYTES = 64 * 1024
+FILE_CACHE_MAX_FILE_BYTES = 1024 * 1024
+# More ranges than this in one request are ignored and the whole file is sent.
+_MAX_RANGES = 16
+
 # Paths that compress well via gzip (stay aligned with handlers below).
 _GZIP_EXTENSIONS = ('.html', '.css', '.js', '.txt', '.json')
 
+# /api/day/<N> -> api/day/<N>.json (see scripts/lesson_bundles.py).
+_API_DAY_ROUTE = re.compile(r'^/api/day/(\d+)/?$')
+
+# Content-Encoding -> compressor, in server preference order.
+_COMPRESSORS = OrderedDict()
+if brotli is not None:
+    _COMPRESSORS['br'] = lambda raw: brotli.compress(raw, quality=11)
+
+
+def _gzip_compress(raw):
+    """One-shot gzip; byte-identical to streaming the same input through _gzip_compressor()."""
+    compressor = _gzip_compressor()
+    return compressor.compress(raw) + compressor.flush()
+
+
+def _gzip_compressor():
+    # wbits=31: gzip container with a zero mtime, so output depends only on the input.
+    return zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 31)
+
+
+_COMPRESSORS['gzip'] = _gzip_compress
+
+
+class CompressedCache:
+    """
+    Thread-safe LRU of compressed file bodies, bounded by total bytes.
+
+    Entries are keyed by (path, encoding) and remember the (mtime, size) they
+    were built from; a changed file misses and is recompressed on next request.
+    """
+
+    def __init__(self, max_bytes=COMPRESSED_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, fs_path, encoding, source=None, store=True):
+        """
+        Return (compressed bytes, os.stat_result) for fs_path.
+
+        `source` is an optional (bytes, stat_result) pair already in memory
+        (see FileCache) so the file need not be opened again. With
+        store=False a miss is compressed but not kept.
+        """
+        key = (fs_path, encoding)
+        if source is not None:
+            raw, st = source
+            return self._lookup(key, st, lambda: raw, store), st
+        with open(fs_path, 'rb') as fh:
+            st = os.fstat(fh.fileno())
+            return self._lookup(key, st, fh.read, store), st
+
+    def _lookup(self, key, st, read, store=True):
+        validator = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == validator:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        encoded = _COMPRESSORS[key[1]](read())
+        if store:
+            self._put(key, validator, encoded)
+        return encoded
+
+    def _put(self, key, validator, encoded):
+        if len(encoded) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.total_bytes -= len(old[1])
+            self._entries[key] = (validator, encoded)
+            self.total_bytes += len(encoded)
+            while self.total_bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.total_bytes -= len(evicted)
+
+
+class FileCache:
+    """
+    Thread-safe LRU of whole file contents and stat results, bounded by total bytes.
+
+    A cached file is re-stat'ed at most once per `stat_interval` seconds and
+    reloaded when its mtime or size changed, so repeated app-shell requests skip
+    open/read/stat entirely. Files over `max_file_bytes` are never cached.
+    """
+
+    def __init__(self, max_bytes, max_file_bytes=FILE_CACHE_MAX_FILE_BYTES, stat_interval=1.0):
+        self.max_bytes = max_bytes
+        self.max_file_bytes = min(max_file_bytes, max_bytes)
+        self.stat_interval = stat_interval
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # path -> [data, stat_result, last_checked]
+        self._lock = threading.Lock()
+
+    def get(self, fs_path):
+        """Return (bytes, os.stat_result) for fs_path, or None if it is not cacheable."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(fs_path)
+            if entry is not None and now - entry[2] < self.stat_interval:
+                self._entries.move_to_end(fs_path)
+                self.hits += 1
+                return entry[0], entry[1]
+
+        st = os.stat(fs_path)
+        if entry is not None and (entry[1].st_mtime_ns, entry[1].st_size) == (st.st_mtime_ns, st.st_size):
+            with self._lock:
+                entry[2] = now
+                self.hits += 1
+            return entry[0], entry[1]
+        if not stat.S_ISREG(st.st_mode) or st.st_size > self.max_file_bytes:
+            self.invalidate(fs_path)
+            return None
+
+        with open(fs_path, 'rb') as fh:
+            st = os.fstat(fh.fileno())
+            data = fh.read()
+        with self._lock:
+            self.misses += 1
+            old = self._entries.pop(fs_path, None)
+            if old is not None:
+                self.total_bytes -= len(old[0])
+            self._entries[fs_path] = [data, st, now]
+            self.total_bytes += len(data)
+            while self.total_bytes > self.max_bytes:
+                _, (evicted, _, _) = self._entries.popitem(last=False)
+                self.total_bytes -= len(evicted)
+        return data, st
+
+    def recently_checked(self, fs_path):
+        """True if fs_path is cached and was validated within stat_interval."""
+        with self._lock:
+            entry = self._entries.get(fs_path)
+            return entry is not None and time.monotonic() - entry[2] < self.stat_interval
+
+    def invalidate(self, fs_path):
+        with self._lock:
+            old = self._entries.pop(fs_path, None)
+            if old is not None:
+                self.total_bytes -= len(old[0])
+
+
+class ServerMetrics:
+    """
+    Request counters and latency histograms, rendered in Prometheus text format.
+
+    Recording is one lock acquisition and a bisect per request, so it stays on
+    in production.
+    """
+
+    ROUTES = ('html', 'json', 'mp3', 'other')
+    LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = {}  # (route, status code) -> count
+        self.bytes_sent = dict.fromkeys(self.ROUTES, 0)
+        self.latency_counts = {route: [0] * (len(self.LATENCY_BUCKETS) + 1) for route in self.ROUTES}
+        self.latency_sum = dict.fromkeys(self.ROUTES, 0.0)
+        self.compression = {}  # encoding -> [uncompressed bytes, compressed bytes, responses]
+
+    @staticmethod
+    def route_of(path):
+        tail = path.lower()
+        if tail.endswith(('.html', '.htm', '/')):
+            return 'html'
+        if tail.endswith('.json'):
+            return 'json'
+        if tail.endswith('.mp3'):
+            return 'mp3'
+        return 'other'
+
+    def record(self, route, status, nbytes, seconds):
+        bucket = bisect.bisect_left(self.LATENCY_BUCKETS, seconds)
+        with self._lock:
+            key = (route, status)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            self.bytes_sent[route] += nbytes
+            self.latency_counts[route][bucket] += 1
+            self.latency_sum[route] += seconds
+
+    def record_compression(self, encoding, original, compressed):
+        with self._lock:
+            totals = self.compression.setdefault(encoding, [0, 0, 0])
+            totals[0] += original
+            totals[1] += compressed
+            totals[2] += 1
+
+    def render(self, caches=()):
+        """Prometheus text exposition; `caches` is (name, cache) pairs with hits/misses."""
+        with self._lock:
+            requests = dict(self.requests)
+            bytes_sent = dict(self.bytes_sent)
+            latency_counts = {route: list(counts) for route, counts in self.latency_counts.items()}
+            latency_sum = dict(self.latency_sum)
+            compression = {enc: list(totals) for enc, totals in self.compression.items()}
+
+        lines = [
+            '# HELP http_requests_total Requests served, by route class and status code.',
+            '# TYPE http_requests_total counter',
+        ]
+        for (route, status), count in sorted(requests.items()):
+            lines.append(f'http_requests_total{{route="{route}",code="{status}"}} {count}')
+        lines += [
+            '# HELP http_response_bytes_total Bytes written to clients (headers and bodies).',
+            '# TYPE http_response_bytes_total counter',
+        ]
+        lines += [f'http_response_bytes_total{{route="{route}"}} {bytes_sent[route]}' for route in self.ROUTES]
+        lines += [
+            '# HELP http_request_duration_seconds Time from reading a request to finishing its response.',
+            '# TYPE http_request_duration_seconds histogram',
+        ]
+        for route in self.ROUTES:
+            cumulative = 0
+            for bound, count in zip((*self.LATENCY_BUCKETS, '+Inf'), latency_counts[route]):
+                cumulative += count
+                lines.append(f'http_request_duration_seconds_bucket{{route="{route}",le="{bound}"}} {cumulative}')
+            lines.append(f'http_request_duration_seconds_sum{{route="{route}"}} {latency_sum[route]:.6f}')
+            lines.append(f'http_request_duration_seconds_count{{route="{route}"}} {cumulative}')
+        ordered = sorted(compression.items())
+        lines += [
+            '# HELP http_compression_input_bytes_total Uncompressed size of compressed responses.',
+            '# TYPE http_compression_input_bytes_total counter',
+        ]
+        for encoding, (original, _, _) in ordered:
+            lines.append(f'http_compression_input_bytes_total{{encoding="{encoding}"}} {original}')
+        lines += [
+            '# HELP http_compression_output_bytes_total Compressed size of compressed responses.',
+            '# TYPE http_compression_output_bytes_total counter',
+        ]
+        for encoding, (_, compressed, _) in ordered:
+            lines.append(f'http_compression_output_bytes_total{{encoding="{encoding}"}} {compressed}')
+        lines += [
+            '# HELP http_compression_ratio Compressed / uncompressed bytes over all compressed responses.',
+            '# TYPE http_compression_ratio gauge',
+        ]
+        for encoding, (original, compressed, _) in ordered:
+            lines.append(f'http_compression_ratio{{encoding="{encoding}"}} {compressed / original if original else 0:.4f}')
+        lines += [
+            '# HELP http_cache_lookups_total In-memory cache lookups, by cache and result.',
+            '# TYPE http_cache_lookups_total counter',
+        ]
+        for name, cache in caches:
+            lines.append(f'http_cache_lookups_total{{cache="{name}",result="hit"}} {cache.hits}')
+            lines.append(f'http_cache_lookups_total{{cache="{name}",result="miss"}} {cache.misses}')
+        lines += [
+            '# HELP http_cache_bytes Bytes currently held by each in-memory cache.',
+            '# TYPE http_cache_bytes gauge',
+        ]
+        lines += [f'http_cache_bytes{{cache="{name}"}} {cache.total_bytes}' for name, cache in caches]
+        return '\n'.join(lines) + '\n'
+
+
+class _CountingWriter:
+    """Proxy for a handler's wfile that counts bytes written through it."""
+
+    def __init__(self, raw):
+        self._raw = raw
+        self.count = 0
+
+    def write(self, data):
+        written = self._raw.write(data)
+        self.count += len(data)
+        return written
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
 
 class GzipHandler(http.server.SimpleHTTPRequestHandler):
     """
-    SimpleHTTPRequestHandler with gzip for text-heavy static files only.
+    SimpleHTTPRequestHandler with gzip (or brotli) for text-heavy static files only.
 
     The previous implementation compressed inside end_headers() after stock send_head()
     had already emitted Content-Length, producing illegal duplicate headers while
     stock do_GET still streamed the uncompressed file. Compression is isolated to
-    do_GET/do_HEAD with a single header set + one write.
+    do_GET/do_HEAD with a single header set + one write, and compressed bodies are
+    reused from `compressed_cache` until the file changes. Files above
+    `stream_gzip_threshold` are instead gzip-streamed with chunked encoding.
+    Every file response carries a strong ETag per representation, so
+    revalidation is answered with 304, and identity responses honor
+    Range/If-Range (206, multipart/byteranges, 416).
     """
 
+    compressed_cache = CompressedCache()
+    # Identity bodies go through socket.sendfile (os.sendfile where available,
+    # a send() loop otherwise); False restores the userspace copyfile loop.
+    use_sendfile = True
+    stream_gzip_threshold = STREAM_GZIP_THRESHOLD
+    _resolved_path = None
+    _response_started = False
+    _connection_header_sent = False
+    _status = None
+
+    # Persistent connections: every response carries Content-Length (or is a
+    # 304/HEAD), so HTTP/1.1 clients can reuse the socket. `timeout` bounds a
+    # stalled request; idle time between requests is PooledHTTPServer's concern.
+    protocol_version = 'HTTP/1.1'
+    timeout = 30
+    # Headers and body go out in separate writes; without TCP_NODELAY a reused
+    # connection stalls on Nagle + delayed ACK for ~40 ms per response.
+    disable_nagle_algorithm = True
+    max_requests_per_connection = DEFAULT_MAX_REQUESTS_PER_CONNECTION
+
+    def setup(self):
+        super().setup()
+        self.requests_served = getattr(self.server, 'requests_served_on', lambda request: 0)(self.request)
+        self.idle_keep_alive = False
+        self.metrics = getattr(self.server, 'metrics', None)
+        self.wfile = _CountingWriter(self.wfile)
+
+    def handle_one_request(self):
+        started = time.perf_counter()
+        self.command = None
+        self._status = None
+        self._resolved_path = None
+        self.wfile.count = 0
+        super().handle_one_request()
+        if self.metrics is not None and self.command and self._status is not None:
+            route = self.metrics.route_of(self._resolved_path or self._url_path_without_query())
+            self.metrics.record(route, self._status, self.wfile.count, time.perf_counter() - started)
+
+    def handle(self):
+        """Serve requests until the client closes or the connection goes idle."""
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection:
+            if not self._request_buffered():
+                # Nothing pipelined: let the server watch the idle socket
+                # instead of blocking this worker on the next read.
+                self.idle_keep_alive = True
+                return
+            self.handle_one_request()
+
+    def _request_buffered(self):
+        """True if another request's bytes are already readable without blocking."""
+        self.request.setblocking(False)
+        try:
+            return bool(self.rfile.peek(1))
+        except OSError:
+            return False
+        finally:
+            self.request.settimeout(self.timeout)
+
+    def parse_request(self):
+        if not super().parse_request():
+            return False
+        self.requests_served += 1
+        limit = getattr(self.server, 'max_requests_per_connection', self.max_requests_per_connection)
+        if self.requests_served >= limit:
+            self.close_connection = True
+        return True
+
+    def send_header(self, keyword, value):
+        if keyword.lower() == 'connection':
+            self._connection_header_sent = True
+        super().send_header(keyword, value)
+
+    def end_headers(self):
+        # Tell the client whether this connection survives the response, unless
+        # the response already said so (send_error always sends "close").
+        if not self._connection_header_sent and self.request_version != 'HTTP/0.9':
+            if self.close_connection:
+                self.send_header('Connection', 'close')
+            elif self.request_version == 'HTTP/1.0':
+                self.send_header('Connection', 'keep-alive')
+        self._connection_header_sent = False
+        super().end_headers()
+
     def send_response_only(self, code, message=None):
         super().send_response_only(code, message)
+        self._response_started = True
+        self._status = int(code)
 
-        tail = self._url_path_without_query()
+        # Directory requests served as index.html (and /api/day/N as its JSON
+        # bundle) get that file's cache policy.
+        tail = self._resolved_path or self._url_path_without_query()
 
         if tail.endswith(
             ('.css', '.js', '.png', '.jpg', '.jpeg', '.gif', '.ico', '.svg')
@@ -31,95 +433,545 @@ class GzipHandler(http.server.SimpleHTTPRequestHandler):
         elif tail.endswith(('.html', '.json')):
             self.send_header('Cache-Control', 'public, max-age=0, must-revalidate')
 
+        if tail.lower().endswith(_GZIP_EXTENSIONS):
+            # Identity and compressed responses share a URL; caches must key on both.
+            self.send_header('Vary', 'Accept-Encoding')
+
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('X-Content-Type-Options', 'nosniff')
         self.send_header('X-Frame-Options', 'DENY')
         self.send_header('X-XSS-Protection', '1; mode=block')
 
     @staticmethod
-    def _accepts_gzip(value):
-        if not value:
-            return False
-        return 'gzip' in value.lower()
+    def _encoding_qvalues(value):
+        """Map of coding -> q-value from an Accept-Encoding header."""
+        qvalues = {}
+        for item in (value or '').split(','):
+            coding, _, params = item.strip().partition(';')
+            coding = coding.strip().lower()
+            if not coding:
+                continue
+            q = 1.0
+            for param in params.split(';'):
+                name, _, number = param.strip().partition('=')
+                if name.strip().lower() == 'q':
+                    try:
+                        q = float(number)
+                    except ValueError:
+                        q = 0.0
+            qvalues[coding] = q
+        return qvalues
 
     def _url_path_without_query(self):
         return self.path.split('?', 1)[0].split('#', 1)[0]
 
-    def _should_try_gzip(self):
-        if not self._accepts_gzip(self.headers.get('Accept-Encoding')):
+    def _resolve_file(self):
+        """Filesystem path of the regular file this request names, else None."""
+        route = _API_DAY_ROUTE.match(self._url_path_without_query())
+        if route:
+            # Precomputed by scripts/lesson_bundles.py; served like any static JSON.
+            fs_path = self.translate_path(f'/api/day/{int(route.group(1))}.json')
+            return fs_path if os.path.isfile(fs_path) else None
+        fs_path = self.translate_path(self.path)
+        file_cache = getattr(self.server, 'file_cache', None)
+        if file_cache is not None and file_cache.recently_checked(fs_path):
+            if not self._url_path_without_query().endswith('/'):
+                return fs_path
+        if os.path.isdir(fs_path):
+            if not self._url_path_without_query().endswith('/'):
+                return None  # stock handler redirects to the slash form
+            for index in ('index.html', 'index.htm'):
+                candidate = os.path.join(fs_path, index)
+                if os.path.isfile(candidate):
+                    return candidate
+            return None
+        if os.path.isfile(fs_path) and not self._url_path_without_query().endswith('/'):
+            return fs_path
+        return None
+
+    def _negotiate_encoding(self, fs_path, choices=_COMPRESSORS):
+        """Preferred Content-Encoding among `choices`, or None to send identity."""
+        if not fs_path.lower().endswith(_GZIP_EXTENSIONS):
+            return None
+        qvalues = self._encoding_qvalues(self.headers.get('Accept-Encoding'))
+        for encoding in choices:
+            if qvalues.get(encoding, qvalues.get('*', 0)) > 0:
+                return encoding
+        return None
+
+    @staticmethod
+    def _etag(st, encoding=None):
+        """Strong validator for one representation (identity or a content coding)."""
+        suffix = f'-{encoding}' if encoding else ''
+        return f'"{st.st_mtime_ns:x}-{st.st_size:x}{suffix}"'
+
+    def _not_modified(self, st, etag):
+        """Evaluate If-None-Match (preferred) or If-Modified-Since against a file."""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            if if_none_match.strip() == '*':
+                return True
+            for tag in if_none_match.split(','):
+                tag = tag.strip()
+                if tag.startswith('W/'):
+                    tag = tag[2:]
+                if tag == etag:
+                    return True
             return False
-        tail = self._url_path_without_query().lower()
-        return tail.endswith(_GZIP_EXTENSIONS)
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since)
+            except (TypeError, IndexError, OverflowError, ValueError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=datetime.timezone.utc)
+            return int(st.st_mtime) <= since.timestamp()
+        return False
 
-    def _defer_to_parent_headers(self):
-        """Let stock handler manage Range requests and validators."""
-        if self.headers.get('Range'):
-            return True
-        if self.headers.get('If-Modified-Since'):
-            return True
-        if self.headers.get('If-None-Match'):
+    def _send_validators(self, st, etag):
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', self.date_time_string(st.st_mtime))
+
+    def _send_not_modified(self, st, etag):
+        self.send_response(HTTPStatus.NOT_MODIFIED)
+        self._send_validators(st, etag)
+        self.end_headers()
+
+    @staticmethod
+    def _parse_ranges(value, size):
+        """
+        Byte ranges from a Range header as sorted, merged (start, end) pairs.
+
+        Returns None when the header is malformed or not in bytes (serve the
+        whole file) and [] when no range is satisfiable (416).
+        """
+        unit, _, spec = (value or '').partition('=')
+        if unit.strip().lower() != 'bytes' or not spec.strip():
+            return None
+        ranges = []
+        for item in spec.split(','):
+            first, sep, last = item.strip().partition('-')
+            if not sep:
+                return None
+            try:
+                if first:
+                    start = int(first)
+                    end = int(last) if last else max(start, size - 1)
+                    if end < start:
+                        return None
+                else:
+                    suffix = int(last)
+                    start, end = max(0, size - suffix), size - 1
+                    if suffix == 0:
+                        continue
+            except ValueError:
+                return None
+            if start < size:
+                ranges.append((start, min(end, size - 1)))
+        if len(ranges) > _MAX_RANGES:
+            return None
+        merged = []
+        for start, end in sorted(ranges):
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+
+    def _if_range_matches(self, st, etag):
+        """True when there is no If-Range or it still names the current file."""
+        if_range = self.headers.get('If-Range')
+        if if_range is None:
             return True
-        return False
+        if_range = if_range.strip()
+        if if_range.startswith('"'):
+            return if_range == etag  # weak tags never match If-Range
+        return if_range == self.date_time_string(st.st_mtime)
 
-    def _emit_gzip(self, fs_path, write_body=True):
-        with open(fs_path, 'rb') as fh:
-            raw = fh.read()
-        encoded = gzip.compress(raw)
-        st = os.stat(fs_path)
+    def _write_body(self, data):
+        try:
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+
+    def _cached_file(self, fs_path):
+        """(bytes, stat_result) from the server's FileCache, or None when disabled/uncacheable."""
+        file_cache = getattr(self.server, 'file_cache', None)
+        if file_cache is None:
+            return None
+        return file_cache.get(fs_path)
+
+    def _emit_compressed(self, fs_path, encoding, write_body=True):
+        cached = self._cached_file(fs_path)
+        st = cached[1] if cached else os.stat(fs_path)
+        stream = st.st_size > self.stream_gzip_threshold and self.request_version == 'HTTP/1.1'
+        if stream and encoding != 'gzip':
+            # Only gzip is streamed; rather than compress a large file whole
+            # for brotli, fall back to gzip when the client takes it.
+            if self._negotiate_encoding(fs_path, ('gzip',)):
+                encoding = 'gzip'
+            else:
+                stream = False
+        etag = self._etag(st, encoding)
+        if self._not_modified(st, etag):
+            self._send_not_modified(st, etag)
+            return
+        if stream:
+            self._emit_gzip_stream(fs_path, st, etag, write_body)
+            return
+        # Large files only get here for HTTP/1.0 or br-only clients; compress
+        # them for this response without evicting the small hot entries.
+        encoded, st = self.compressed_cache.get(
+            fs_path, encoding, source=cached, store=st.st_size <= self.stream_gzip_threshold
+        )
 
         self.send_response(HTTPStatus.OK)
         ctype = self.guess_type(fs_path)
         if ctype:
             self.send_header('Content-Type', ctype)
-        self.send_header('Last-Modified', self.date_time_string(st.st_mtime))
-        self.send_header('Content-Encoding', 'gzip')
+        self._send_validators(st, self._etag(st, encoding))
+        self.send_header('Content-Encoding', encoding)
         self.send_header('Content-Length', str(len(encoded)))
-        self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+        if write_body:
+            self._write_body(encoded)
+            if self.metrics is not None:
+                self.metrics.record_compression(encoding, st.st_size, len(encoded))
+
+    def _emit_gzip_stream(self, fs_path, st, etag, write_body):
+        """Compress fixed-size reads as they are sent (chunked), bounding memory and TTFB."""
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', self.guess_type(fs_path))
+        self._send_validators(st, etag)
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        if not write_body:
+            return
+        compressor = _gzip_compressor()
+        original = compressed = 0
+        try:
+            with open(fs_path, 'rb') as fh:
+                while True:
+                    raw = fh.read(STREAM_CHUNK_BYTES)
+                    data = compressor.compress(raw) if raw else compressor.flush()
+                    if data:
+                        self.wfile.write(b'%x\r\n%b\r\n' % (len(data), data))
+                    original += len(raw)
+                    compressed += len(data)
+                    if not raw:
+                        break
+            self.wfile.write(b'0\r\n\r\n')
+        except (BrokenPipeError, ConnectionResetError):
+            self.close_connection = True
+            return
+        if self.metrics is not None:
+            self.metrics.record_compression('gzip', original, compressed)
+
+    def _emit_identity(self, fs_path, write_body=True):
+        cached = self._cached_file(fs_path)
+        if cached is not None:
+            self._emit_identity_from(*cached, fs_path, write_body)
+            return
+        with open(fs_path, 'rb') as fh:
+            self._emit_identity_from(fh, os.fstat(fh.fileno()), fs_path, write_body)
+
+    def _emit_identity_from(self, source, st, fs_path, write_body):
+        """Send a file (open file object or its bytes) honoring validators and Range."""
+        etag = self._etag(st)
+        if self._not_modified(st, etag):
+            self._send_not_modified(st, etag)
+            return
+
+        ranges = None
+        if write_body and self.headers.get('Range') and self._if_range_matches(st, etag):
+            ranges = self._parse_ranges(self.headers['Range'], st.st_size)
+        if ranges == []:
+            self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            self.send_header('Content-Range', f'bytes */{st.st_size}')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        ctype = self.guess_type(fs_path)
+        parts = []
+        if ranges is None:
+            self.send_response(HTTPStatus.OK)
+            self.send_header('Content-Type', ctype)
+            self.send_header('Content-Length', str(st.st_size))
+            parts.append((b'', 0, st.st_size))
+        elif len(ranges) == 1:
+            start, end = ranges[0]
+            self.send_response(HTTPStatus.PARTIAL_CONTENT)
+            self.send_header('Content-Type', ctype)
+            self.send_header('Content-Range', f'bytes {start}-{end}/{st.st_size}')
+            self.send_header('Content-Length', str(end - start + 1))
+            parts.append((b'', start, end - start + 1))
+        else:
+            boundary = uuid.uuid4().hex
+            for start, end in ranges:
+                head = (
+                    f'\r\n--{boundary}\r\nContent-Type: {ctype}\r\n'
+                    f'Content-Range: bytes {start}-{end}/{st.st_size}\r\n\r\n'
+                ).encode('latin-1')
+                parts.append((head, start, end - start + 1))
+            parts.append((f'\r\n--{boundary}--\r\n'.encode('latin-1'), 0, 0))
+            self.send_response(HTTPStatus.PARTIAL_CONTENT)
+            self.send_header('Content-Type', f'multipart/byteranges; boundary={boundary}')
+            self.send_header('Content-Length', str(sum(len(h) + n for h, _, n in parts)))
+        self.send_header('Accept-Ranges', 'bytes')
+        self._send_validators(st, etag)
         self.end_headers()
         if write_body:
             try:
-                self.wfile.write(encoded)
-            except BrokenPipeError:
-                pass
-            except ConnectionResetError:
-                pass
+                for head, offset, count in parts:
+                    if head:
+                        self.wfile.write(head)
+                    if count:
+                        self._send_file(source, offset, count)
+            except (BrokenPipeError, ConnectionResetError):
+                self.close_connection = True
 
-    def do_GET(self):
-        if self._defer_to_parent_headers():
-            super().do_GET()
+    def _send_file(self, source, offset, count):
+        """Write `count` bytes of source from `offset`; open files go zero-copy when possible."""
+        if isinstance(source, bytes):
+            self.wfile.write(memoryview(source)[offset:offset + count])
             return
+        fh = source
+        if self.use_sendfile:
+            self.wfile.flush()
+            self.wfile.count += self.connection.sendfile(fh, offset, count)
+            return
+        fh.seek(offset)
+        remaining = count
+        while remaining > 0:
+            chunk = fh.read(min(remaining, 64 * 1024))
+            if not chunk:
+                break
+            self.wfile.write(chunk)
+            remaining -= len(chunk)
 
-        if self._should_try_gzip():
-            fs_path = self.translate_path(self.path)
-            if os.path.isfile(fs_path):
-                try:
-                    self._emit_gzip(fs_path, write_body=True)
-                except OSError:
-                    self.send_error(HTTPStatus.NOT_FOUND.value, 'File not found')
-                return
+    def _emit_metrics(self, write_body):
+        caches = [('compressed', self.compressed_cache)]
+        file_cache = getattr(self.server, 'file_cache', None)
+        if file_cache is not None:
+            caches.append(('file', file_cache))
+        body = self.metrics.render(caches).encode('utf-8')
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Cache-Control', 'no-store')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if write_body:
+            self._write_body(body)
+
+    def _serve(self, write_body):
+        self._response_started = False
+        self._resolved_path = None
+        if self.metrics is not None and self._url_path_without_query() == '/metrics':
+            self._emit_metrics(write_body)
+            return
+        self._resolved_path = self._resolve_file()
+        if self._resolved_path is None:
+            if write_body:
+                super().do_GET()
+            else:
+                super().do_HEAD()
+            return
 
-        super().do_GET()
+        # Byte ranges address the identity representation.
+        encoding = None if self.headers.get('Range') else self._negotiate_encoding(self._resolved_path)
+        try:
+            if encoding:
+                self._emit_compressed(self._resolved_path, encoding, write_body)
+            else:
+                self._emit_identity(self._resolved_path, write_body)
+        except OSError:
+            if self._response_started:
+                # Failed mid-body; the stream cannot be resynchronized.
+                self.close_connection = True
+            else:
+                self.send_error(HTTPStatus.NOT_FOUND.value, 'File not found')
+
+    def do_GET(self):
+        self._serve(write_body=True)
 
     def do_HEAD(self):
-        if self._defer_to_parent_headers():
-            super().do_HEAD()
-            return
+        self._serve(write_body=False)
+
+
+class PooledHTTPServer(http.server.HTTPServer):
+    """
+    HTTPServer that handles each connection on a bounded thread pool.
+
+    ThreadingHTTPServer starts one thread per connection with no ceiling; here at
+    most `workers` requests run at once and further connections wait in the pool
+    queue, so one slow MP3 download no longer stalls every other client.
 
-        if self._should_try_gzip():
-            fs_path = self.translate_path(self.path)
-            if os.path.isfile(fs_path):
-                try:
-                    self._emit_gzip(fs_path, write_body=False)
-                except OSError:
-                    self.send_error(HTTPStatus.NOT_FOUND.value, 'File not found')
+    Idle keep-alive connections do not hold a worker: the handler hands them back
+    and one selector thread waits for their next request, closing any that stay
+    silent for `idle_timeout` seconds.
+    """
+
+    allow_reuse_address = True
+    request_queue_size = 128
+
+    def __init__(
+        self, server_address, handler_class, workers=DEFAULT_WORKERS, cache_bytes=0,
+        idle_timeout=DEFAULT_IDLE_TIMEOUT, max_requests_per_connection=DEFAULT_MAX_REQUESTS_PER_CONNECTION,
+    ):
+        self.workers = max(1, workers)
+        self.idle_timeout = idle_timeout
+        self.max_requests_per_connection = max_requests_per_connection
+        self.file_cache = FileCache(cache_bytes) if cache_bytes > 0 else None
+        self.metrics = ServerMetrics()
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='http')
+        self._served = {}  # idle socket -> requests served on it so far
+        self._parked = []  # sockets handed back by workers, not yet registered
+        self._park_lock = threading.Lock()
+        self._closing = False
+        self._wakeup_r, self._wakeup_w = socket.socketpair()
+        self._wakeup_w.setblocking(False)
+        self._idle_thread = threading.Thread(target=self._watch_idle, name='http-idle', daemon=True)
+        super().__init__(server_address, handler_class)
+        self._idle_thread.start()
+
+    def process_request(self, request, client_address):
+        self._submit(request, client_address)
+
+    def _submit(self, request, client_address):
+        try:
+            self._pool.submit(self._process_request_worker, request, client_address)
+        except RuntimeError:  # pool already shut down
+            self.shutdown_request(request)
+
+    def _process_request_worker(self, request, client_address):
+        try:
+            handler = self.RequestHandlerClass(request, client_address, self)
+            if getattr(handler, 'idle_keep_alive', False) and self._park(request, client_address, handler):
                 return
+        except Exception:
+            self.handle_error(request, client_address)
+        self.shutdown_request(request)
 
-        super().do_HEAD()
+    def requests_served_on(self, request):
+        """Requests already answered on this connection before it went idle."""
+        with self._park_lock:
+            return self._served.pop(request, 0)
 
+    def _park(self, request, client_address, handler):
+        with self._park_lock:
+            if self._closing:
+                return False
+            self._served[request] = handler.requests_served
+            self._parked.append((request, client_address))
+        self._wake()
+        return True
 
-if __name__ == '__main__':
-    PORT = 8000
-    socketserver.TCPServer.allow_reuse_address = True
-    with socketserver.TCPServer(('', PORT), GzipHandler) as httpd:
-        print(f'Serving at port {PORT} with Gzip compression and caching enabled')
+    def _wake(self):
+        try:
+            self._wakeup_w.send(b'\0')
+        except BlockingIOError:
+            pass  # a wakeup is already pending
+
+    def _watch_idle(self):
+        selector = selectors.DefaultSelector()
+        selector.register(self._wakeup_r, selectors.EVENT_READ)
+        try:
+            while True:
+                with self._park_lock:
+                    parked, self._parked = self._parked, []
+                    closing = self._closing
+                deadline = time.monotonic() + self.idle_timeout
+                for request, client_address in parked:
+                    selector.register(request, selectors.EVENT_READ, (client_address, deadline))
+                if closing:
+                    break
+                for key, _ in selector.select(timeout=1.0):
+                    if key.fileobj is self._wakeup_r:
+                        self._wakeup_r.recv(4096)
+                        continue
+                    selector.unregister(key.fileobj)
+                    self._submit(key.fileobj, key.data[0])
+                now = time.monotonic()
+                for key in list(selector.get_map().values()):
+                    if key.fileobj is not self._wakeup_r and key.data[1] <= now:
+                        selector.unregister(key.fileobj)
+                        self._forget(key.fileobj)
+        finally:
+            for key in list(selector.get_map().values()):
+                if key.fileobj is not self._wakeup_r:
+                    self._forget(key.fileobj)
+            selector.close()
+
+    def _forget(self, request):
+        with self._park_lock:
+            self._served.pop(request, None)
+        self.shutdown_request(request)
+
+    def server_close(self):
+        """Stop listening, close idle connections, then let in-flight requests finish."""
+        super().server_close()
+        with self._park_lock:
+            self._closing = True
+        self._wake()
+        self._idle_thread.join()
+        self._pool.shutdown(wait=True)
+        self._wakeup_r.close()
+        self._wakeup_w.close()
+
+
+def serve(
+    bind='', port=DEFAULT_PORT, workers=DEFAULT_WORKERS, cache_mb=0,
+    idle_timeout=DEFAULT_IDLE_TIMEOUT, max_requests=DEFAULT_MAX_REQUESTS_PER_CONNECTION,
+):
+    """Serve the current directory until SIGINT/SIGTERM, then drain in-flight requests."""
+    cache_bytes = int(cache_mb * 1024 * 1024)
+    with PooledHTTPServer(
+        (bind, port), GzipHandler, workers=workers, cache_bytes=cache_bytes,
+        idle_timeout=idle_timeout, max_requests_per_connection=max_requests,
+    ) as httpd:
+        def _stop(signum, frame):
+            # shutdown() blocks until serve_forever() returns, so it must not run
+            # on the thread that is inside serve_forever().
+            threading.Thread(target=httpd.shutdown, daemon=True).start()
+
+        signal.signal(signal.SIGINT, _stop)
+        signal.signal(signal.SIGTERM, _stop)
+        host = bind or '0.0.0.0'
+        print(
+            f'Serving at http://{host}:{httpd.server_address[1]} with {httpd.workers} workers, '
+            'gzip compression and caching enabled'
+            + (f', {cache_mb:g} MB hot-file cache' if httpd.file_cache else '')
+        )
         httpd.serve_forever()
+        print('Shutting down, waiting for in-flight requests...')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve the Mandarin Pathways PWA')
+    parser.add_argument('--bind', '-b', default='', help='Address to bind (default: all interfaces)')
+    parser.add_argument('--port', '-p', type=int, default=DEFAULT_PORT, help=f'Port (default: {DEFAULT_PORT})')
+    parser.add_argument(
+        '--workers', '-w', type=int, default=DEFAULT_WORKERS,
+        help=f'Requests handled concurrently (default: {DEFAULT_WORKERS})',
+    )
+    parser.add_argument(
+        '--cache-mb', type=float, default=0,
+        help='Keep up to this many MB of small files in memory, re-checked by stat once a second (default: off)',
+    )
+    parser.add_argument(
+        '--idle-timeout', type=float, default=DEFAULT_IDLE_TIMEOUT,
+        help=f'Close keep-alive connections idle this many seconds (default: {DEFAULT_IDLE_TIMEOUT:g})',
+    )
+    parser.add_argument(
+        '--max-requests', type=int, default=DEFAULT_MAX_REQUESTS_PER_CONNECTION,
+        help=f'Requests per connection before closing it (default: {DEFAULT_MAX_REQUESTS_PER_CONNECTION})',
+    )
+    args = parser.parse_args()
+    serve(args.bind, args.port, args.workers, args.cache_mb, args.idle_timeout, args.max_requests)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,4 @@
-const CACHE_VERSION = "12";
+const CACHE_VERSION = "14";
 const CACHE_NAME = `mandarin-pathways-v${CACHE_VERSION}`;
 
 // Cache groups for different types of resources
@@ -201,13 +201,14 @@ self.addEventListener("fetch", (event) => {
         return;
     }
 
-    // Audio and text files - Cache first, then network
+    // Audio, text, timing and lesson bundle files - Cache first, then network
     if (
         event.request.url.includes("/audio_files/") ||
         event.request.url.includes("/text_files/") ||
         event.request.url.includes("/reading_files/") ||
         event.request.url.includes("/writing_files/") ||
-        event.request.url.includes("/timing/")
+        event.request.url.includes("/timing/") ||
+        event.request.url.includes("/api/day/")
     ) {
         event.respondWith(
             caches.match(event.request).then(
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""Tests for the static file server (server.py)."""
+
+import functools
+import http.client
+import os
+import gzip
+import json
+import socket
+import tempfile
+import threading
+import unittest
+
+import server
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+class QuietHandler(server.GzipHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class ServerTestCase(unittest.TestCase):
+    """Runs a PooledHTTPServer over the repository root on an ephemeral port."""
+
+    workers = 4
+    cache_bytes = 0
+    server_options = {}
+
+    def setUp(self):
+        handler = functools.partial(QuietHandler, directory=ROOT)
+        self.httpd = server.PooledHTTPServer(
+            ('127.0.0.1', 0), handler, workers=self.workers, cache_bytes=self.cache_bytes,
+            **self.server_options,
+        )
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, args=(0.05,), daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
+
+    def request(self, method, path, headers=None):
+        conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=5)
+        try:
+            conn.request(method, path, headers=headers or {})
+            response = conn.getresponse()
+            return response, response.read()
+        finally:
+            conn.close()
+
+
+class TestPooledHTTPServer(ServerTestCase):
+    """Tests for concurrent serving."""
+
+    def test_stalled_client_does_not_block_others(self):
+        stalled = socket.create_connection(('127.0.0.1', self.port))
+        try:
+            stalled.sendall(b'GET /index.html HTTP/1.1\r\n')  # never finishes its headers
+            response, body = self.request('GET', '/manifest.json')
+            self.assertEqual(response.status, 200)
+            self.assertTrue(body)
+        finally:
+            stalled.close()
+
+    def test_gzip_semantics_preserved(self):
+        response, body = self.request('GET', '/index.html', {'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.getheader('Content-Encoding'), 'gzip')
+        self.assertEqual(int(response.getheader('Content-Length')), len(body))
+        self.assertEqual(response.getheader('Cache-Control'), 'public, max-age=0, must-revalidate')
+
+
+class TestStreamingGzip(ServerTestCase):
+    """Files above the threshold are gzip-streamed with chunked encoding."""
+
+    def setUp(self):
+        QuietHandler.stream_gzip_threshold = 1024
+        QuietHandler.compressed_cache = server.CompressedCache()
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+        del QuietHandler.stream_gzip_threshold
+        del QuietHandler.compressed_cache
+
+    def test_streamed_body_matches_one_shot(self):
+        path = os.path.join(ROOT, 'js', 'day-page.js')
+        with open(path, 'rb') as f:
+            raw = f.read()
+        self.assertGreater(len(raw), 1024)
+        response, body = self.request('GET', '/js/day-page.js', {'Accept-Encoding': 'br, gzip'})
+        self.assertEqual(response.getheader('Transfer-Encoding'), 'chunked')
+        self.assertEqual(response.getheader('Content-Encoding'), 'gzip')
+        self.assertIsNone(response.getheader('Content-Length'))
+        self.assertEqual(body, server._gzip_compress(raw))
+        self.assertEqual(gzip.decompress(body), raw)
+
+        headers = {'Accept-Encoding': 'gzip', 'If-None-Match': response.getheader('ETag')}
+        self.assertEqual(self.request('GET', '/js/day-page.js', headers)[0].status, 304)
+
+    def test_http10_large_file_is_not_cached(self):
+        with open(os.path.join(ROOT, 'js', 'day-page.js'), 'rb') as f:
+            raw = f.read()
+        with socket.create_connection(('127.0.0.1', self.port), timeout=5) as sock:
+            sock.sendall(b'GET /js/day-page.js HTTP/1.0\r\nAccept-Encoding: gzip\r\n\r\n')
+            response = b''
+            while chunk := sock.recv(65536):
+                response += chunk
+        head, body = response.split(b'\r\n\r\n', 1)
+        self.assertIn(b'Content-Encoding: gzip', head)
+        self.assertNotIn(b'chunked', head)
+        self.assertEqual(gzip.decompress(body), raw)
+        cached = [key for key in QuietHandler.compressed_cache._entries if key[0].endswith('day-page.js')]
+        self.assertEqual(cached, [])
+
+
+class TestLessonBundles(ServerTestCase):
+    """Tests for the /api/day/<N> bundle route."""
+
+    def test_bundle_served_with_validators(self):
+        response, body = self.request('GET', '/api/day/1', {'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.getheader('Content-Type'), 'application/json')
+        bundle = json.loads(gzip.decompress(body))
+        self.assertEqual(bundle['day'], 1)
+        self.assertEqual(bundle['timing']['zh']['phrases'][0]['i'], 0)
+
+        headers = {'Accept-Encoding': 'gzip', 'If-None-Match': response.getheader('ETag')}
+        self.assertEqual(self.request('GET', '/api/day/1', headers)[0].status, 304)
+
+    def test_unknown_day(self):
+        self.assertEqual(self.request('GET', '/api/day/999')[0].status, 404)
+
+
+class TestMetrics(ServerTestCase):
+    """Tests for the /metrics endpoint."""
+
+    def test_counters_and_histograms(self):
+        self.request('GET', '/index.html', {'Accept-Encoding': 'gzip'})
+        _, mp3 = self.request('GET', '/audio_files/day1_zh.mp3')
+        self.request('GET', '/missing.json')
+        response, body = self.request('GET', '/metrics')
+        self.assertTrue(response.getheader('Content-Type').startswith('text/plain; version=0.0.4'))
+        text = body.decode()
+        self.assertIn('http_requests_total{route="html",code="200"} 1', text)
+        self.assertIn('http_requests_total{route="json",code="404"} 1', text)
+        self.assertIn('http_request_duration_seconds_count{route="mp3"} 1', text)
+        self.assertIn('http_request_duration_seconds_bucket{route="mp3",le="+Inf"} 1', text)
+        self.assertIn('http_compression_ratio{encoding="gzip"} 0.', text)
+        self.assertIn('http_cache_lookups_total{cache="compressed",result="miss"}', text)
+        sent = int(text.split('http_response_bytes_total{route="mp3"} ')[1].split()[0])
+        self.assertGreater(sent, len(mp3))
+
+    def test_families_are_contiguous(self):
+        self.request('GET', '/index.html', {'Accept-Encoding': 'gzip'})
+        text = self.request('GET', '/metrics')[1].decode()
+        family, seen = None, []
+        for line in text.splitlines():
+            if line.startswith('# TYPE '):
+                family = line.split()[2]
+                self.assertNotIn(family, seen)
+                seen.append(family)
+            elif not line.startswith('#'):
+                name = line.split('{')[0].split()[0]
+                self.assertIn(name, (family, f'{family}_bucket', f'{family}_sum', f'{family}_count'), line)
+        self.assertIn('http_compression_output_bytes_total', seen)
+
+
+class TestKeepAlive(ServerTestCase):
+    """Tests for HTTP/1.1 persistent connections."""
+
+    server_options = {'idle_timeout': 0.5, 'max_requests_per_connection': 3}
+
+    def test_connection_reused_across_paths(self):
+        conn = http.client.HTTPConnection('127.0.0.1', self.port, timeout=5)
+        try:
+            conn.request('GET', '/index.html', headers={'Accept-Encoding': 'gzip'})
+            conn.getresponse().read()
+            sock = conn.sock
+            conn.request('GET', '/audio_files/day1_zh.mp3', headers={'Range': 'bytes=0-9'})
+            response = conn.getresponse()
+            self.assertEqual(len(response.read()), 10)
+            self.assertIs(conn.sock, sock)
+
+            conn.request('GET', '/missing.txt')
+            response = conn.getresponse()
+            self.assertEqual(response.status, 404)
+            self.assertEqual(len(response.read()), int(response.getheader('Content-Length')))
+        finally:
+            conn.close()
+
+    def test_pipelined_requests(self):
+        with socket.create_connection(('127.0.0.1', self.port), timeout=5) as sock:
+            request = b'HEAD /manifest.json HTTP/1.1\r\nHost: test\r\n\r\n'
+            sock.sendall(request * 2)
+            data = b''
+            while data.count(b'HTTP/1.1 200') < 2:
+                chunk = sock.recv(65536)
+                self.assertTrue(chunk)
+                data += chunk
+
+    def test_request_cap_and_idle_timeout(self):
+        with socket.create_connection(('127.0.0.1', self.port), timeout=5) as sock:
+            request = b'HEAD /manifest.json HTTP/1.1\r\nHost: test\r\n\r\n'
+            responses = b''
+            for _ in range(3):
+                sock.sendall(request)
+                responses += sock.recv(65536)
+            self.assertIn(b'Connection: close', responses.rsplit(b'HTTP/1.1', 1)[1])
+            self.assertEqual(sock.recv(1), b'')
+
+        with socket.create_connection(('127.0.0.1', self.port), timeout=5) as sock:
+            sock.sendall(request)
+            sock.recv(65536)
+            self.assertEqual(sock.recv(1), b'')  # closed after idle_timeout
+
+
+class TestIdentityBodies(ServerTestCase):
+    """Identity responses match the file with and without sendfile."""
+
+    def test_sendfile_and_copy_loop(self):
+        with open(os.path.join(ROOT, 'audio_files', 'day1_zh.mp3'), 'rb') as f:
+            expected = f.read()
+        for use_sendfile in (True, False):
+            QuietHandler.use_sendfile = use_sendfile
+            try:
+                response, body = self.request('GET', '/audio_files/day1_zh.mp3')
+            finally:
+                del QuietHandler.use_sendfile
+            self.assertEqual(int(response.getheader('Content-Length')), len(expected))
+            self.assertEqual(body, expected)
+
+
+class TestRanges(ServerTestCase):
+    """Tests for Range / If-Range handling."""
+
+    path = '/audio_files/day1_zh.mp3'
+
+    def setUp(self):
+        super().setUp()
+        with open(os.path.join(ROOT, 'audio_files', 'day1_zh.mp3'), 'rb') as f:
+            self.data = f.read()
+
+    def test_parse_ranges(self):
+        parse = server.GzipHandler._parse_ranges
+        self.assertEqual(parse('bytes=0-9', 100), [(0, 9)])
+        self.assertEqual(parse('bytes=-10', 100), [(90, 99)])
+        self.assertEqual(parse('bytes=90-', 100), [(90, 99)])
+        self.assertEqual(parse('bytes=0-4, 3-9, 50-60', 100), [(0, 9), (50, 60)])
+        self.assertEqual(parse('bytes=200-300', 100), [])
+        self.assertIsNone(parse('bytes=9-0', 100))
+        self.assertIsNone(parse('items=0-1', 100))
+
+    def test_single_range(self):
+        response, body = self.request('GET', self.path, {'Range': 'bytes=1000-1999'})
+        self.assertEqual(response.status, 206)
+        self.assertEqual(response.getheader('Content-Range'), f'bytes 1000-1999/{len(self.data)}')
+        self.assertEqual(body, self.data[1000:2000])
+
+    def test_multiple_ranges(self):
+        response, body = self.request('GET', self.path, {'Range': 'bytes=0-99,-100'})
+        self.assertEqual(response.status, 206)
+        ctype = response.getheader('Content-Type')
+        self.assertTrue(ctype.startswith('multipart/byteranges; boundary='))
+        self.assertEqual(int(response.getheader('Content-Length')), len(body))
+        boundary = ctype.split('boundary=')[1].encode()
+        parts = [p for p in body.split(b'--' + boundary) if p.strip(b'-\r\n')]
+        self.assertEqual([p.split(b'\r\n\r\n', 1)[1][:-2] for p in parts], [self.data[:100], self.data[-100:]])
+
+    def test_unsatisfiable(self):
+        response, body = self.request('GET', self.path, {'Range': f'bytes={len(self.data)}-'})
+        self.assertEqual(response.status, 416)
+        self.assertEqual(response.getheader('Content-Range'), f'bytes */{len(self.data)}')
+
+    def test_if_range(self):
+        full, _ = self.request('GET', self.path)
+        self.assertEqual(full.getheader('Accept-Ranges'), 'bytes')
+        current = {'Range': 'bytes=0-9', 'If-Range': full.getheader('ETag')}
+        self.assertEqual(self.request('GET', self.path, current)[0].status, 206)
+        stale = {'Range': 'bytes=0-9', 'If-Range': '"stale"'}
+        response, body = self.request('GET', self.path, stale)
+        self.assertEqual(response.status, 200)
+        self.assertEqual(body, self.data)
+
+
+class TestRangesFromFileCache(TestRanges):
+    """The range tests again, with bodies served from the hot-file cache."""
+
+    cache_bytes = 8 * 1024 * 1024
+
+    def test_served_from_memory(self):
+        self.request('GET', self.path)
+        self.request('GET', self.path, {'Range': 'bytes=0-9'})
+        self.assertGreaterEqual(self.httpd.file_cache.hits, 1)
+
+
+class TestFileCache(unittest.TestCase):
+    """Tests for the hot-file LRU."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'app.js')
+        with open(self.path, 'wb') as f:
+            f.write(b'a' * 100)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_stat_polling_invalidation(self):
+        cache = server.FileCache(1024, stat_interval=0)
+        self.assertEqual(cache.get(self.path)[0], b'a' * 100)
+        self.assertEqual(cache.get(self.path)[0], b'a' * 100)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        with open(self.path, 'wb') as f:
+            f.write(b'b' * 50)
+        self.assertEqual(cache.get(self.path)[0], b'b' * 50)
+        self.assertEqual(cache.total_bytes, 50)
+
+    def test_bounds(self):
+        cache = server.FileCache(150, max_file_bytes=120)
+        big = os.path.join(self.tmpdir.name, 'big.bin')
+        with open(big, 'wb') as f:
+            f.write(b'x' * 121)
+        self.assertIsNone(cache.get(big))
+        other = os.path.join(self.tmpdir.name, 'other.js')
+        with open(other, 'wb') as f:
+            f.write(b'c' * 100)
+        cache.get(self.path)
+        cache.get(other)
+        self.assertEqual(cache.total_bytes, 100)
+        self.assertFalse(cache.recently_checked(self.path))
+
+
+class TestCompressedCache(unittest.TestCase):
+    """Tests for the compressed-variant LRU."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'page.html')
+        with open(self.path, 'w') as f:
+            f.write('<p>你好</p>' * 100)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_reuses_until_file_changes(self):
+        cache = server.CompressedCache()
+        first, _ = cache.get(self.path, 'gzip')
+        self.assertIs(cache.get(self.path, 'gzip')[0], first)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        with open(self.path, 'w') as f:
+            f.write('<p>再见</p>')
+        os.utime(self.path, ns=(0, 0))
+        updated, _ = cache.get(self.path, 'gzip')
+        self.assertEqual(gzip.decompress(updated), '<p>再见</p>'.encode())
+        self.assertEqual(cache.misses, 2)
+
+    def test_evicts_least_recently_used(self):
+        other = os.path.join(self.tmpdir.name, 'other.html')
+        with open(other, 'w') as f:
+            f.write('<p>谢谢</p>' * 100)
+        size = len(server.CompressedCache().get(self.path, 'gzip')[0])
+        cache = server.CompressedCache(max_bytes=size + 1)
+        cache.get(self.path, 'gzip')
+        cache.get(other, 'gzip')
+        self.assertLessEqual(cache.total_bytes, cache.max_bytes)
+        cache.get(self.path, 'gzip')
+        self.assertEqual(cache.misses, 3)
+
+
+class TestContentNegotiation(ServerTestCase):
+    """Tests for Accept-Encoding handling."""
+
+    def test_qvalues(self):
+        self.assertEqual(
+            server.GzipHandler._encoding_qvalues('gzip;q=0, br, *;q=0.5'),
+            {'gzip': 0.0, 'br': 1.0, '*': 0.5},
+        )
+
+    def test_rejected_gzip_gets_identity_with_vary(self):
+        response, body = self.request('GET', '/index.html', {'Accept-Encoding': 'gzip;q=0'})
+        self.assertIsNone(response.getheader('Content-Encoding'))
+        self.assertEqual(response.getheader('Vary'), 'Accept-Encoding')
+        with open(os.path.join(ROOT, 'index.html'), 'rb') as f:
+            self.assertEqual(body, f.read())
+
+
+class TestConditionalRequests(ServerTestCase):
+    """Tests for ETag / If-None-Match / If-Modified-Since handling."""
+
+    def test_etag_per_representation(self):
+        identity, _ = self.request('GET', '/timing/day1_zh.json')
+        gzipped, _ = self.request('GET', '/timing/day1_zh.json', {'Accept-Encoding': 'gzip'})
+        self.assertNotEqual(identity.getheader('ETag'), gzipped.getheader('ETag'))
+
+        for response in (identity, gzipped):
+            headers = {'If-None-Match': response.getheader('ETag')}
+            if response.getheader('Content-Encoding'):
+                headers['Accept-Encoding'] = 'gzip'
+            revalidated, body = self.request('GET', '/timing/day1_zh.json', headers)
+            self.assertEqual(revalidated.status, 304)
+            self.assertEqual(body, b'')
+            self.assertEqual(revalidated.getheader('ETag'), response.getheader('ETag'))
+
+    def test_other_representation_etag_does_not_match(self):
+        gzipped, _ = self.request('GET', '/index.html', {'Accept-Encoding': 'gzip'})
+        response, body = self.request('GET', '/index.html', {'If-None-Match': gzipped.getheader('ETag')})
+        self.assertEqual(response.status, 200)
+        self.assertTrue(body)
+
+    def test_if_modified_since(self):
+        first, _ = self.request('GET', '/', {'Accept-Encoding': 'gzip'})
+        self.assertEqual(first.getheader('Content-Encoding'), 'gzip')
+        headers = {'Accept-Encoding': 'gzip', 'If-Modified-Since': first.getheader('Last-Modified')}
+        response, body = self.request('GET', '/', headers)
+        self.assertEqual(response.status, 304)
+        self.assertEqual(body, b'')
+
+
+if __name__ == '__main__':
+    unittest.main()